@@ -0,0 +1,103 @@
+"""
+Micro-benchmark of the Markdown formatters.
+
+Renders synthetic listings of 1k to 10k posts with the formatters of
+``hashnode_mcp.utils`` and prints the time per post, which should stay flat
+as the payload grows (linear scaling). With an output budget the time of a
+whole listing should stay flat instead, since rendering stops at the budget.
+
+Usage:
+    python benchmarks/bench_formatting.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hashnode_mcp.budget import parse_budget  # noqa: E402
+from hashnode_mcp.utils import (  # noqa: E402
+    format_articles_by_tag,
+    format_latest_articles,
+    format_posts,
+    format_search_results,
+    format_top_articles,
+)
+
+SIZES = (1000, 2500, 5000, 10000)
+
+
+def make_edges(count: int) -> List[Dict[str, Any]]:
+    """Build ``count`` post edges shaped like the listing responses"""
+    return [
+        {
+            "node": {
+                "id": f"post{index}",
+                "title": f"Post number {index}",
+                "url": f"https://blog.example.com/post-{index}",
+                "slug": f"post-{index}",
+                # A few hundred distinct dates, as in a real publication
+                "publishedAt": f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}T10:00:00Z",
+                "brief": "A short description of the post. " * 10,
+                "author": {"name": "Jane Doe", "username": "jane", "profilePicture": "https://cdn.example.com/jane.png"},
+                "coverImage": {"url": f"https://cdn.example.com/cover-{index}.png"},
+            }
+        }
+        for index in range(count)
+    ]
+
+
+FORMATTERS: Dict[str, Callable[[List[Dict[str, Any]]], str]] = {
+    "search_results": lambda edges: format_search_results(
+        {"data": {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": True, "endCursor": "abc"}}}}
+    ),
+    "posts": lambda edges: format_posts({"data": {"publication": {"title": "Blog", "isTeam": False, "posts": {"edges": edges}}}}),
+    "top_articles": lambda edges: format_top_articles({"data": {"feed": {"edges": edges}}}),
+    "articles_by_tag": lambda edges: format_articles_by_tag({"data": {"tag": {"name": "python", "posts": {"edges": edges}}}}),
+    "latest_articles": lambda edges: format_latest_articles("Blog", edges),
+}
+
+
+def best_time(render: Callable[[], str], repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    """Print the time per post of every formatter at every size"""
+    parser = argparse.ArgumentParser(description="Benchmark the Markdown formatters")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (the fastest is kept)")
+    args = parser.parse_args()
+
+    payloads = {size: make_edges(size) for size in SIZES}
+    print(f"{'formatter':<18}" + "".join(f"{size:>12}" for size in SIZES) + f"{'10k/1k':>10}")
+    for name, formatter in FORMATTERS.items():
+        per_post = []
+        for size in SIZES:
+            edges = payloads[size]
+            per_post.append(best_time(lambda: formatter(edges), args.repeat) / size)
+        cells = "".join(f"{seconds * 1e6:>9.2f} us" for seconds in per_post)
+        # Per-post time at 10k relative to 1k; about 1.0 means linear scaling
+        print(f"{name:<18}{cells}{per_post[-1] / per_post[0]:>10.2f}")
+
+    limit = parse_budget()
+    print(f"\nWith the default output budget ({limit} bytes), time per listing")
+    for name, formatter in (
+        ("search_results", lambda edges: format_search_results(
+            {"data": {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": False}}}}, limit)),
+        ("latest_articles", lambda edges: format_latest_articles("Blog", edges, limit)),
+    ):
+        cells = "".join(f"{best_time(lambda: formatter(payloads[size]), args.repeat) * 1e3:>9.2f} ms" for size in SIZES)
+        print(f"{name:<18}{cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+DataLoader-style batching of concurrent GraphQL read queries.
+
+Queries issued within a short window are merged into one aliased document
+(see ``hashnode_mcp.graphql.merge_queries``), sent as a single request and
+the response is split back out to each caller. A batch is sent early once
+it reaches the maximum size or the estimated complexity the API accepts for
+one request. A merged request is sent under the label of its queries when
+they share one, so it keeps their timeout tier and circuit breaker.
+"""
+import asyncio
+import os
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from hashnode_mcp.cache import query_label
+from hashnode_mcp.deadlines import start_shared, wait_shared
+from hashnode_mcp.graphql import merge_queries, query_complexity, split_response
+from hashnode_mcp.log import get_logger
+
+logger = get_logger(__name__)
+
+BATCHING_ENABLED = os.getenv("HASHNODE_BATCHING", "true").lower() in ("1", "true", "yes")
+BATCH_WINDOW_MS = float(os.getenv("HASHNODE_BATCH_WINDOW_MS", "5"))
+BATCH_MAX_SIZE = int(os.getenv("HASHNODE_BATCH_MAX_SIZE", "25"))
+# Estimated complexity (selected fields, see query_complexity) allowed in one merged request
+BATCH_MAX_COMPLEXITY = int(os.getenv("HASHNODE_BATCH_MAX_COMPLEXITY", "500"))
+
+# send(query, variables) or send(query, variables, label=...) for merged requests
+SendFunc = Callable[..., Awaitable[dict]]
+
+
+class QueryBatcher:
+    """
+    Collect read queries for a short window and send them as one request
+
+    Args:
+        send: Coroutine function used to send a single GraphQL request
+        window: How long (in seconds) to wait for more queries before sending
+        max_batch_size: Send immediately once this many queries are waiting
+        max_complexity: Never merge queries whose estimated complexity adds up to more than this
+    """
+
+    def __init__(
+        self,
+        send: SendFunc,
+        window: float = BATCH_WINDOW_MS / 1000,
+        max_batch_size: int = BATCH_MAX_SIZE,
+        max_complexity: int = BATCH_MAX_COMPLEXITY,
+    ):
+        self.send = send
+        self.window = window
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_complexity = max_complexity
+        self._pending: List[Tuple[str, Optional[dict], asyncio.Future]] = []
+        self._pending_complexity = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Dispatches in flight, referenced so they are not garbage-collected
+        self._dispatches: Set[asyncio.Future] = set()
+        # Counters for diagnostics
+        self.queries = 0
+        self.requests = 0
+
+    async def load(self, query: str, variables: dict = None) -> dict:
+        """
+        Queue a read query and wait for its share of the batched response
+
+        Args:
+            query: The GraphQL query
+            variables: The query variables
+
+        Returns:
+            The GraphQL response for this query alone
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            complexity = query_complexity(query)
+        except ValueError:
+            complexity = 1
+
+        if self._pending and self._pending_complexity + complexity > self.max_complexity:
+            # Adding this query would make the merged request too expensive
+            self._flush()
+
+        self._pending.append((query, variables, future))
+        self._pending_complexity += complexity
+        self.queries += 1
+
+        if len(self._pending) >= self.max_batch_size or self._pending_complexity >= self.max_complexity:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        # The batch is sent without a deadline; each caller waits under its own
+        return await wait_shared(future, query_label(query))
+
+    def _flush(self) -> None:
+        """Hand the pending queries to a dispatch task"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._pending_complexity = 0
+        if batch:
+            task = start_shared(lambda: self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(lambda task: self._finished(task, batch))
+
+    def _finished(self, task: asyncio.Future, batch: List[Tuple[str, Optional[dict], asyncio.Future]]) -> None:
+        """Forget a finished dispatch, failing its queries if it crashed"""
+        self._dispatches.discard(task)
+        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+        if error is None:
+            return
+        logger.error("Batch of %s queries failed: %s", len(batch), error)
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _send_one(self, query: str, variables: Optional[dict], future: asyncio.Future) -> None:
+        """Send a single query and resolve its future"""
+        self.requests += 1
+        try:
+            result = await self.send(query, variables)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def _dispatch(self, batch: List[Tuple[str, Optional[dict], asyncio.Future]]) -> None:
+        """Send a batch of queries, merging them into one document when possible"""
+        if len(batch) == 1:
+            await self._send_one(*batch[0])
+            return
+
+        try:
+            merged, variables, aliases = merge_queries([(query, variables) for query, variables, _ in batch])
+        except ValueError:
+            await asyncio.gather(*(self._send_one(*item) for item in batch))
+            return
+
+        labels = {query_label(query) for query, _, _ in batch}
+        self.requests += 1
+        try:
+            if len(labels) == 1:
+                result = await self.send(merged, variables, label=labels.pop())
+            else:
+                result = await self.send(merged, variables)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if result.get("data") is None and result.get("errors"):
+            # The whole document was rejected (e.g. one malformed ID failed
+            # validation), so send the queries on their own to isolate it
+            await asyncio.gather(*(self._send_one(*item) for item in batch))
+            return
+
+        for (_, _, future), response in zip(batch, split_response(result, aliases)):
+            if not future.done():
+                future.set_result(response)
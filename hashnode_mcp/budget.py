@@ -0,0 +1,154 @@
+"""
+Output budget of the tools.
+
+A budget bounds the size of a tool response, in bytes or in estimated
+tokens (``BYTES_PER_TOKEN`` bytes each). Every listing tool takes a
+``budget`` argument; ``HASHNODE_OUTPUT_BUDGET`` sets the default, e.g.
+"16000", "16000 bytes" or "4000 tokens" ("0" for no limit).
+
+Responses that would not fit degrade progressively instead of being cut
+at an arbitrary byte. ``fit_items`` renders the items of a listing with a
+series of renderers, each briefer than the one before (fewer fields, then
+shorter briefs); when even the briefest one does not fit, the items that
+do are returned and the caller hands out a cursor to continue from.
+Rendering stops at the first item that overflows, so the work done is
+bounded by the budget rather than by the number of items.
+"""
+import json
+import os
+import re
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Union
+
+from hashnode_mcp.log import get_logger
+
+logger = get_logger(__name__)
+
+OUTPUT_BUDGET = os.getenv("HASHNODE_OUTPUT_BUDGET", "16000")
+# Rough size of a token in the English text and Markdown the tools return
+BYTES_PER_TOKEN = int(os.getenv("HASHNODE_BYTES_PER_TOKEN", "4"))
+
+# Room kept for the note and cursor after a listing that was cut short
+CONTINUATION_RESERVE = 256
+# Length of the briefs of a listing cut down to fit a budget
+SHORT_BRIEF_CHARS = 80
+
+_BUDGET_RE = re.compile(r"\s*(\d+)\s*(b|bytes?|t|tokens?)?\s*")
+
+
+def parse_budget(budget: Union[int, str, None] = None) -> Optional[int]:
+    """
+    Return the byte limit of a budget
+
+    Args:
+        budget: A number of bytes, or a string such as "16000", "16000 bytes"
+            or "4000 tokens"; None uses ``HASHNODE_OUTPUT_BUDGET``
+
+    Returns:
+        The limit in bytes, or None when there is no limit (a budget of 0)
+
+    Raises:
+        ValueError: If the budget cannot be parsed
+    """
+    if budget is None:
+        budget = OUTPUT_BUDGET
+    if isinstance(budget, int):
+        amount, unit = budget, "b"
+    else:
+        match = _BUDGET_RE.fullmatch(str(budget).lower())
+        if not match:
+            raise ValueError(f"Invalid output budget '{budget}'; use a number of bytes or e.g. '4000 tokens'")
+        amount, unit = int(match.group(1)), match.group(2) or "b"
+    limit = amount * BYTES_PER_TOKEN if unit.startswith("t") else amount
+    return limit if limit > 0 else None
+
+
+def text_size(text: str) -> int:
+    """Return the size of text in bytes"""
+    return len(text.encode("utf-8"))
+
+
+def json_size(value: Any) -> int:
+    """Return the size of a value serialized like ``hashnode_mcp.output.render`` does"""
+    return text_size(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+
+def bytes_left(limit: Optional[int], used: int) -> Optional[int]:
+    """Return what is left of a limit (never negative), or None for no limit"""
+    return None if limit is None else max(0, limit - used)
+
+
+def clip(text: str, max_bytes: int) -> str:
+    """
+    Cut text to at most ``max_bytes`` bytes without splitting a character
+
+    Only the first ``max_bytes`` characters are looked at, so clipping a
+    long body costs no more than the budget.
+    """
+    if len(text) * 4 <= max_bytes:
+        # Even if every character took 4 bytes it would fit
+        return text
+    head = text[:max(0, max_bytes)]
+    return head.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+
+
+def min_size(items: Sequence[Any], levels: Sequence[Callable[[Any], Any]], measure: Callable[[Any], int] = text_size) -> int:
+    """
+    Return the least room items can take: their size at the briefest level
+
+    Once the items of a listing fetched so far exceed the budget at this
+    size, later pages cannot be shown and need not be fetched.
+    """
+    render = levels[-1]
+    return sum(measure(render(item)) for item in items)
+
+
+class Fitted(NamedTuple):
+    """The items of a listing that fit in a budget"""
+    items: List[Any]
+    level: int
+    complete: bool
+
+
+def fit_items(
+    items: Sequence[Any],
+    levels: Sequence[Callable[[Any], Any]],
+    limit: Optional[int],
+    measure: Callable[[Any], int] = text_size,
+) -> Fitted:
+    """
+    Render as many items as fit in ``limit``, degrading progressively
+
+    Args:
+        items: The items of the listing
+        levels: Renderers of an item, from the most to the least detailed
+        limit: Bytes available for the items; None renders all in full
+        measure: Size of a rendered item in bytes
+
+    Returns:
+        The rendered items, the level used and whether every item is
+        included. All items are rendered at the first level where they all
+        fit; otherwise the last level is used and the listing stops before
+        the first item that overflows. The first item is always included, so
+        a continuation cursor always makes progress.
+    """
+    if limit is None:
+        render = levels[0]
+        return Fitted([render(item) for item in items], 0, True)
+
+    rendered: List[Any] = []
+    for level, render in enumerate(levels):
+        rendered = []
+        used = 0
+        for item in items:
+            piece = render(item)
+            used += measure(piece)
+            if used > limit:
+                break
+            rendered.append(piece)
+        else:
+            return Fitted(rendered, level, True)
+
+    if not rendered and items:
+        rendered = [levels[-1](items[0])]
+    logger.debug("Output budget of %s bytes fits %s of %s items", limit, len(rendered), len(items))
+    return Fitted(rendered, len(levels) - 1, len(rendered) == len(items))
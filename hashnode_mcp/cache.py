@@ -0,0 +1,364 @@
+"""
+In-memory caches for Hashnode API responses.
+
+``ResponseCache`` stores serialized GraphQL responses for read-only
+operations with a per-operation TTL and evicts the least recently used
+entries once a configurable memory ceiling is reached. ``ViewerCache`` keeps
+the publication of the authenticated user per access token and
+``PublicationHostCache`` maps publication hostnames to their IDs.
+"""
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from hashnode_mcp import utils
+from hashnode_mcp.graphql import operation_name
+
+CACHE_ENABLED = os.getenv("HASHNODE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+CACHE_MAX_BYTES = int(os.getenv("HASHNODE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+VIEWER_CACHE_TTL = float(os.getenv("HASHNODE_VIEWER_CACHE_TTL", "3600"))
+HOST_CACHE_TTL = float(os.getenv("HASHNODE_HOST_CACHE_TTL", "86400"))
+HOST_CACHE_NEGATIVE_TTL = float(os.getenv("HASHNODE_HOST_CACHE_NEGATIVE_TTL", "300"))
+HOST_CACHE_SIZE = int(os.getenv("HASHNODE_HOST_CACHE_SIZE", "1000"))
+
+# Names of the query constants in hashnode_mcp.utils, looked up by document
+QUERY_NAMES: Dict[str, str] = {
+    value: name
+    for name, value in vars(utils).items()
+    if name.endswith(("_QUERY", "_MUTATION")) and isinstance(value, str)
+}
+
+# Operation names of documents built at runtime, and the query constant whose
+# TTL, timeout tier and invalidation rules they share: post lookups projected
+# by hashnode_mcp.projection keep the "Post" name of GET_POST_BY_ID_QUERY.
+# Labelling by name keeps the number of labels fixed however many documents
+# are built.
+OPERATION_LABELS: Dict[str, str] = {
+    "Post": "GET_POST_BY_ID_QUERY",
+}
+
+# Default TTLs (in seconds) for read-only operations; anything not listed
+# here is not cached (hostname lookups live in PublicationHostCache instead).
+# Override with HASHNODE_CACHE_TTL_<NAME>, e.g.
+# HASHNODE_CACHE_TTL_GET_POST_BY_ID_QUERY=60 (0 disables caching).
+DEFAULT_TTLS: Dict[str, float] = {
+    "GET_USER_INFO_QUERY": 300,
+    "GET_POST_BY_ID_QUERY": 120,
+    "GET_PUBLICATION_POSTS_QUERY": 60,
+    "SEARCH_POSTS_OF_PUBLICATION_QUERY": 60,
+    "GET_TOP_ARTICLES_QUERY": 120,
+    "GET_ARTICLES_BY_TAG_QUERY": 120,
+    "GET_ARTICLES_BY_USERNAME_QUERY": 120,
+}
+
+
+def query_label(query: str) -> str:
+    """
+    Return a readable label for a GraphQL document
+
+    Args:
+        query: The GraphQL document
+
+    Returns:
+        The name of the matching constant in ``hashnode_mcp.utils``, the
+        constant a document built at runtime stands in for (see
+        ``OPERATION_LABELS``) or, for other documents, the operation name
+    """
+    label = QUERY_NAMES.get(query)
+    if label is not None:
+        return label
+    name = operation_name(query)
+    return OPERATION_LABELS.get(name, name) if name else "anonymous"
+
+
+def operation_ttl(label: str) -> float:
+    """Return the cache TTL in seconds configured for an operation label"""
+    override = os.getenv(f"HASHNODE_CACHE_TTL_{label}")
+    if override is not None:
+        return float(override)
+    return DEFAULT_TTLS.get(label, 0)
+
+
+class _Entry:
+    """A cached response"""
+
+    __slots__ = ("payload", "label", "stored_at", "expires_at", "tags")
+
+    def __init__(self, payload: bytes, label: str, stored_at: float, expires_at: float, tags: FrozenSet[str] = frozenset()):
+        self.payload = payload
+        self.label = label
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class ResponseCache:
+    """
+    TTL cache for GraphQL responses bounded by total payload size
+
+    Responses are stored as serialized JSON, which gives an exact size to
+    account against ``max_bytes`` and hands every reader its own copy.
+    Entries can carry tags (e.g. "Post:<id>") so every response touching an
+    entity can be dropped at once when a mutation changes it.
+
+    Args:
+        max_bytes: Memory ceiling for all cached payloads
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._tagged: Dict[str, Set[str]] = {}
+        self.size = 0
+        # Counters for diagnostics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[dict]:
+        """
+        Return a cached response, or None on a miss
+
+        Expired entries are kept until they are evicted so they can still be
+        served with ``allow_stale`` when the upstream is unavailable. Hits
+        carry ``extensions.cache`` metadata describing the entry.
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        stale = entry is not None and entry.expires_at <= now
+        if entry is None or (stale and not allow_stale):
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        result = json.loads(entry.payload)
+        result.setdefault("extensions", {})["cache"] = {
+            "hit": True,
+            "stale": stale,
+            "operation": entry.label,
+            "age": round(now - entry.stored_at, 3),
+            "ttl": round(max(0.0, entry.expires_at - now), 3),
+        }
+        return result
+
+    def set(self, key: str, result: dict, ttl: float, label: str = "", tags: Iterable[str] = ()) -> bool:
+        """
+        Store a response for ``ttl`` seconds
+
+        Responses with GraphQL errors and responses larger than the whole
+        cache are not stored. The entry can be dropped later through any of
+        its ``tags`` or its label (see ``invalidate``).
+
+        Returns:
+            True if the response was cached
+        """
+        if ttl <= 0 or not result or result.get("errors"):
+            return False
+
+        payload = json.dumps(
+            {k: v for k, v in result.items() if k != "extensions"},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        now = time.monotonic()
+        tags = frozenset(tags) | {f"op:{label}"}
+        self._entries[key] = _Entry(payload, label, now, now + ttl, tags)
+        for tag in tags:
+            self._tagged.setdefault(tag, set()).add(key)
+        self.size += len(payload)
+        while self.size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        if key in self._entries:
+            self._remove(key)
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of ``tags``
+
+        Every entry is also tagged "op:<label>" with its operation label.
+
+        Returns:
+            The number of entries removed
+        """
+        removed = 0
+        for tag in tags:
+            for key in list(self._tagged.get(tag, ())):
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self._entries.clear()
+        self._tagged.clear()
+        self.size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.size -= len(entry.payload)
+        for tag in entry.tags:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+
+
+def token_fingerprint(token: Optional[str]) -> str:
+    """Return a short, non-reversible identifier for an access token"""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+
+
+class ViewerCache:
+    """
+    Cache of the authenticated user's publication, keyed by access token
+
+    Args:
+        ttl: How long (in seconds) a resolved publication stays valid
+    """
+
+    def __init__(self, ttl: float = VIEWER_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[dict, float]] = {}
+
+    def get(self, token: Optional[str]) -> Optional[dict]:
+        """Return the cached publication (``id`` and ``title``) for a token"""
+        entry = self._entries.get(token_fingerprint(token))
+        if entry is None:
+            return None
+        publication, expires_at = entry
+        if expires_at <= time.monotonic():
+            self.invalidate(token)
+            return None
+        return publication
+
+    def set(self, token: Optional[str], publication: dict) -> None:
+        """Store the publication resolved for a token"""
+        self._entries[token_fingerprint(token)] = (
+            {"id": publication["id"], "title": publication.get("title")},
+            time.monotonic() + self.ttl,
+        )
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """Forget the publication of one token, or of every token"""
+        if token is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(token_fingerprint(token), None)
+
+
+def normalize_host(hostname: str) -> str:
+    """Normalise a publication hostname (drop scheme, path and letter case)"""
+    host = hostname.strip().lower()
+    if "://" in host:
+        host = host.split("://", 1)[1]
+    return host.split("/", 1)[0]
+
+
+def parse_host_seed(value: str) -> Tuple[Dict[str, dict], List[str]]:
+    """
+    Parse a publication seed list such as ``blog.a.com=64f...,blog.b.com``
+
+    Args:
+        value: Comma-separated hostnames, each optionally followed by ``=<publication id>``
+
+    Returns:
+        A tuple of (hostname -> publication for entries with an ID, hostnames
+        that still have to be resolved). Publications given by ID have no
+        title until it is looked up (see ``resolve_publication``)
+    """
+    known: Dict[str, dict] = {}
+    unresolved: List[str] = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "=" in item:
+            host, publication_id = item.split("=", 1)
+            host = normalize_host(host)
+            known[host] = {"id": publication_id.strip(), "title": None}
+        else:
+            unresolved.append(normalize_host(item))
+    return known, unresolved
+
+
+class PublicationHostCache:
+    """
+    Cache of hostname to publication (``id`` and ``title``) resolutions
+
+    Unknown hostnames are cached as well (negative caching) for a shorter
+    time so repeated lookups of a mistyped host do not reach the API. The
+    number of hostnames is capped, least recently used first out, so lookups
+    of many unknown hosts cannot grow the cache without limit.
+
+    Args:
+        ttl: How long (in seconds) a resolved publication stays valid
+        negative_ttl: How long (in seconds) an unknown hostname is remembered
+        max_entries: Maximum number of hostnames kept
+    """
+
+    def __init__(self, ttl: float = HOST_CACHE_TTL, negative_ttl: float = HOST_CACHE_NEGATIVE_TTL, max_entries: int = HOST_CACHE_SIZE):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[dict], float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, hostname: str) -> Tuple[bool, Optional[dict]]:
+        """
+        Look up a hostname
+
+        Returns:
+            A tuple of (found, publication) where publication is None for a
+            cached unknown hostname
+        """
+        host = normalize_host(hostname)
+        entry = self._entries.get(host)
+        if entry is None:
+            return False, None
+        publication, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[host]
+            return False, None
+        self._entries.move_to_end(host)
+        return True, publication
+
+    def set(self, hostname: str, publication: Optional[dict], ttl: Optional[float] = None) -> None:
+        """Store a resolution; pass None as publication to remember an unknown host"""
+        if ttl is None:
+            ttl = self.ttl if publication else self.negative_ttl
+        if publication:
+            publication = {"id": publication["id"], "title": publication.get("title")}
+        host = normalize_host(hostname)
+        self._entries.pop(host, None)
+        self._entries[host] = (publication, time.monotonic() + ttl)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, hostname: Optional[str] = None) -> None:
+        """Forget one hostname, or every hostname"""
+        if hostname is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(normalize_host(hostname), None)
@@ -0,0 +1,157 @@
+"""
+Circuit breaker around requests to the Hashnode API.
+
+Each operation has its own breaker tracking the failure rate over a sliding
+time window. When the rate crosses the threshold the circuit opens and
+requests fail immediately; after a cool-down a limited number of probe
+requests are let through (half-open) and their outcome decides whether the
+circuit closes again.
+"""
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+import httpx
+
+from hashnode_mcp.log import get_logger
+
+logger = get_logger(__name__)
+
+CIRCUIT_ENABLED = os.getenv("HASHNODE_CIRCUIT_BREAKER", "true").lower() in ("1", "true", "yes")
+CIRCUIT_WINDOW = float(os.getenv("HASHNODE_CIRCUIT_WINDOW", "30"))
+CIRCUIT_MIN_REQUESTS = int(os.getenv("HASHNODE_CIRCUIT_MIN_REQUESTS", "5"))
+CIRCUIT_FAILURE_RATE = float(os.getenv("HASHNODE_CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("HASHNODE_CIRCUIT_OPEN_SECONDS", "15"))
+CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("HASHNODE_CIRCUIT_HALF_OPEN_PROBES", "1"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a circuit is open"""
+
+
+def is_failure(exc: BaseException) -> bool:
+    """
+    Check whether an exception indicates an unhealthy upstream
+
+    Transport errors, timeouts and 5xx responses count; client errors
+    (including 429, which the rate limiter handles) do not.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, httpx.TimeoutException))
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one operation
+
+    Args:
+        name: The operation the breaker protects (used in error messages)
+        window: Length of the sliding window in seconds
+        min_requests: Requests needed in the window before the rate is evaluated
+        failure_rate: Failure ratio (0-1) that opens the circuit
+        open_seconds: How long the circuit stays open before probing
+        half_open_probes: Probe requests allowed at the same time while half-open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: float = CIRCUIT_WINDOW,
+        min_requests: int = CIRCUIT_MIN_REQUESTS,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+        half_open_probes: int = CIRCUIT_HALF_OPEN_PROBES,
+    ):
+        self.name = name
+        self.window = window
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            self._outcomes.popleft()
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through"""
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def before_request(self) -> None:
+        """Check whether a request may be sent, raising CircuitOpenError if not"""
+        if self.state == OPEN:
+            if self.retry_in() > 0:
+                raise CircuitOpenError(
+                    f"Circuit for {self.name} is open after repeated upstream failures; "
+                    f"failing fast for another {self.retry_in():.1f}s"
+                )
+            self.state = HALF_OPEN
+            self._probes = 0
+
+        if self.state == HALF_OPEN:
+            if self._probes >= self.half_open_probes:
+                raise CircuitOpenError(f"Circuit for {self.name} is half-open and already probing the upstream")
+            self._probes += 1
+
+    def record_success(self) -> None:
+        """Record a successful request"""
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            self._outcomes.clear()
+            return
+        now = time.monotonic()
+        self._outcomes.append((now, True))
+        self._trim(now)
+
+    def record_failure(self) -> None:
+        """Record a failed request and open the circuit if needed"""
+        now = time.monotonic()
+        if self.state == HALF_OPEN:
+            self._open(now)
+            return
+        self._outcomes.append((now, False))
+        self._trim(now)
+        if len(self._outcomes) >= self.min_requests:
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if failures / len(self._outcomes) >= self.failure_rate:
+                self._open(now)
+
+    def record_ignored(self) -> None:
+        """Release a probe slot for a request whose outcome says nothing about health"""
+        if self.state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _open(self, now: float) -> None:
+        logger.warning("Opening circuit for %s for %gs", self.name, self.open_seconds)
+        self.state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+
+
+class CircuitBreakerRegistry:
+    """Per-operation circuit breakers, created on first use"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Return the breaker for an operation"""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name, **self.settings)
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Return the state of every breaker"""
+        return {name: breaker.state for name, breaker in self._breakers.items()}
@@ -0,0 +1,269 @@
+"""
+Compressed, range-addressable store of article bodies.
+
+Long posts are too large to return from a tool call in one piece, so their
+bodies are served in slices instead: by byte range or by section (the part
+of the body under one heading). ``ContentStore`` keeps each body fetched
+once, zlib-compressed, together with an index of its headings, so every
+later slice is cut locally without another request. Entries expire after
+``CONTENT_STORE_TTL`` seconds and the least recently used ones are dropped
+once the compressed bodies exceed ``CONTENT_STORE_MAX_BYTES``.
+"""
+import os
+import re
+import time
+import zlib
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Tuple
+
+from hashnode_mcp.log import get_logger
+
+logger = get_logger(__name__)
+
+CONTENT_STORE_TTL = float(os.getenv("HASHNODE_CONTENT_STORE_TTL", "900"))
+CONTENT_STORE_MAX_BYTES = int(os.getenv("HASHNODE_CONTENT_STORE_MAX_BYTES", str(32 * 1024 * 1024)))
+CONTENT_COMPRESSION_LEVEL = int(os.getenv("HASHNODE_CONTENT_COMPRESSION_LEVEL", "6"))
+# Size of a slice when no length is given
+CONTENT_SLICE_BYTES = int(os.getenv("HASHNODE_CONTENT_SLICE_BYTES", "8000"))
+
+# Formats a body can be stored in (see hashnode_mcp.projection)
+BODY_FORMATS = ("markdown", "html", "text")
+
+_MARKDOWN_HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+_MARKDOWN_FENCE_RE = re.compile(r"^[ \t]*(```|~~~)")
+_HTML_HEADING_RE = re.compile(r"<h([1-6])\b[^>]*>(.*?)</h\1\s*>", re.I | re.S)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+class Section(NamedTuple):
+    """A heading of a body and the byte range of the part it covers"""
+    level: int
+    title: str
+    start: int
+    end: int
+
+
+def markdown_headings(body: bytes) -> List[Tuple[int, str, int]]:
+    """Return the (level, title, byte offset) of every Markdown heading outside code blocks"""
+    headings = []
+    fence = None
+    offset = 0
+    for line in body.splitlines(keepends=True):
+        text = line.decode("utf-8", "replace").rstrip("\r\n")
+        match = _MARKDOWN_FENCE_RE.match(text)
+        if match:
+            if fence is None:
+                fence = match.group(1)
+            elif match.group(1) == fence:
+                fence = None
+        elif fence is None:
+            match = _MARKDOWN_HEADING_RE.match(text)
+            if match:
+                headings.append((len(match.group(1)), match.group(2).strip(), offset))
+        offset += len(line)
+    return headings
+
+
+def html_headings(body: bytes) -> List[Tuple[int, str, int]]:
+    """Return the (level, title, byte offset) of every ``<h1>``..``<h6>`` element"""
+    headings = []
+    text = body.decode("utf-8", "replace")
+    # Match offsets are in characters; the index is in bytes
+    char_offset = byte_offset = 0
+    for match in _HTML_HEADING_RE.finditer(text):
+        byte_offset += len(text[char_offset:match.start()].encode("utf-8"))
+        char_offset = match.start()
+        title = " ".join(_HTML_TAG_RE.sub("", match.group(2)).split())
+        headings.append((int(match.group(1)), title, byte_offset))
+    return headings
+
+
+def index_sections(body: bytes, content_format: str) -> List[Section]:
+    """
+    Split a body into sections at its headings
+
+    A section runs until the next heading of the same or a higher level, so
+    it includes its subsections. Text before the first heading, if any, is
+    section 0 with level 0 and an empty title. Plain text has no headings and
+    is a single section.
+    """
+    if content_format == "markdown":
+        headings = markdown_headings(body)
+    elif content_format == "html":
+        headings = html_headings(body)
+    else:
+        headings = []
+
+    if not headings or headings[0][2] > 0 and body[:headings[0][2]].strip():
+        headings.insert(0, (0, "", 0))
+
+    sections = []
+    for index, (level, title, start) in enumerate(headings):
+        end = len(body)
+        for next_level, _, next_start in headings[index + 1:]:
+            if level > 0 and next_level <= level or level == 0:
+                end = next_start
+                break
+        sections.append(Section(level, title, start, end))
+    return sections
+
+
+def utf8_slice(body: bytes, start: int, end: int) -> Tuple[str, int, int]:
+    """
+    Cut ``body[start:end]`` without splitting a UTF-8 character
+
+    Both ends are moved back to the nearest character boundary, except that
+    a non-empty range always keeps at least one whole character, so reading
+    on from the returned end makes progress.
+
+    Returns:
+        A tuple of (text, actual start, actual end)
+    """
+    start = max(0, min(start, len(body)))
+    wanted = end = max(start, min(end, len(body)))
+    # Continuation bytes look like 0b10xxxxxx
+    while 0 < start < len(body) and body[start] & 0xC0 == 0x80:
+        start -= 1
+    while start < end < len(body) and body[end] & 0xC0 == 0x80:
+        end -= 1
+    if end == start < wanted:
+        # The range is shorter than the character it starts in
+        end += 1
+        while end < len(body) and body[end] & 0xC0 == 0x80:
+            end += 1
+    return body[start:end].decode("utf-8"), start, end
+
+
+class _Body:
+    """A stored body"""
+
+    __slots__ = ("compressed", "size", "sections", "stored_at")
+
+    def __init__(self, compressed: bytes, size: int, sections: List[Section], stored_at: float):
+        self.compressed = compressed
+        self.size = size
+        self.sections = sections
+        self.stored_at = stored_at
+
+
+class ContentSlice(NamedTuple):
+    """Part of a stored body"""
+    text: str
+    start: int
+    end: int
+    size: int
+    section: Optional[Section] = None
+
+
+# load(post_id, content_format) -> the body, or None if there is no such post
+BodyLoader = Callable[[str, str], Awaitable[Optional[str]]]
+
+
+class ContentStore:
+    """
+    LRU store of compressed article bodies and their section index
+
+    Args:
+        load: Coroutine function fetching a body that is not stored yet
+        ttl: How long (in seconds) a body is kept
+        max_bytes: Ceiling for the total size of the compressed bodies
+    """
+
+    def __init__(self, load: BodyLoader, ttl: float = CONTENT_STORE_TTL, max_bytes: int = CONTENT_STORE_MAX_BYTES):
+        self.load = load
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._bodies: "OrderedDict[Tuple[str, str], _Body]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def put(self, post_id: str, content_format: str, body: str) -> None:
+        """Store a body, replacing any stored copy"""
+        raw = body.encode("utf-8")
+        compressed = zlib.compress(raw, CONTENT_COMPRESSION_LEVEL)
+        if len(compressed) > self.max_bytes:
+            return
+        self.evict(post_id, content_format)
+        key = (post_id, content_format)
+        self._bodies[key] = _Body(compressed, len(raw), index_sections(raw, content_format), time.monotonic())
+        self.size += len(compressed)
+        while self.size > self.max_bytes:
+            _, oldest = self._bodies.popitem(last=False)
+            self.size -= len(oldest.compressed)
+
+    def evict(self, post_id: str, content_format: Optional[str] = None) -> None:
+        """Forget the stored bodies of a post, in one or every format"""
+        for fmt in BODY_FORMATS if content_format is None else (content_format,):
+            entry = self._bodies.pop((post_id, fmt), None)
+            if entry is not None:
+                self.size -= len(entry.compressed)
+
+    def clear(self) -> None:
+        """Forget every body"""
+        self._bodies.clear()
+        self.size = 0
+
+    async def _entry(self, post_id: str, content_format: str) -> _Body:
+        if content_format not in BODY_FORMATS:
+            raise ValueError(f"Unknown content format '{content_format}'; use one of: {', '.join(BODY_FORMATS)}")
+        key = (post_id, content_format)
+        entry = self._bodies.get(key)
+        if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+            self._bodies.move_to_end(key)
+            return entry
+
+        body = await self.load(post_id, content_format)
+        if body is None:
+            raise ValueError(f"No article found with ID '{post_id}'")
+        self.put(post_id, content_format, body)
+        entry = self._bodies.get(key)
+        if entry is None:
+            # Too large to keep; serve it this once
+            raw = body.encode("utf-8")
+            entry = _Body(zlib.compress(raw, 1), len(raw), index_sections(raw, content_format), time.monotonic())
+        return entry
+
+    async def sections(self, post_id: str, content_format: str) -> Tuple[List[Section], int]:
+        """
+        Return the section index of a body
+
+        Returns:
+            A tuple of (sections, size of the body in bytes)
+        """
+        entry = await self._entry(post_id, content_format)
+        return entry.sections, entry.size
+
+    async def read(self, post_id: str, content_format: str, offset: int = 0, length: Optional[int] = None) -> ContentSlice:
+        """
+        Read a byte range of a body
+
+        Args:
+            post_id: The ID of the post
+            content_format: "markdown", "html" or "text"
+            offset: Byte offset to start at
+            length: Number of bytes to read; None reads to the end
+
+        Returns:
+            The slice, moved back to UTF-8 character boundaries
+        """
+        entry = await self._entry(post_id, content_format)
+        raw = zlib.decompress(entry.compressed)
+        end = entry.size if length is None else offset + max(0, length)
+        text, start, end = utf8_slice(raw, offset, end)
+        return ContentSlice(text, start, end, entry.size)
+
+    async def read_section(self, post_id: str, content_format: str, index: int) -> ContentSlice:
+        """
+        Read one section of a body by its position in the section index
+
+        Raises:
+            ValueError: If the body has no section ``index``
+        """
+        entry = await self._entry(post_id, content_format)
+        if not 0 <= index < len(entry.sections):
+            raise ValueError(f"Section {index} does not exist; the article has {len(entry.sections)} sections")
+        section = entry.sections[index]
+        raw = zlib.decompress(entry.compressed)
+        return ContentSlice(raw[section.start:section.end].decode("utf-8"), section.start, section.end, entry.size, section)
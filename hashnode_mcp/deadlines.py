@@ -0,0 +1,186 @@
+"""
+Per-operation timeout tiers and end-to-end deadlines for tool calls.
+
+Every GraphQL operation belongs to a timeout tier with its own connect, read
+and total limits. Tools additionally run under a deadline budget that is
+shared by all of their sequential sub-requests: each request gets at most
+what is left of the budget, so a slow upstream fails the tool fast instead
+of holding a concurrency slot for minutes.
+
+Work shared between tool calls (single-flight requests, batches) runs in a
+task of its own without a deadline, started by ``start_shared``; every
+caller waits for it with ``wait_shared`` under its own deadline.
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+import httpx
+
+TOOL_DEADLINE = float(os.getenv("HASHNODE_TOOL_DEADLINE", "60"))
+WRITE_TOOL_DEADLINE = float(os.getenv("HASHNODE_WRITE_TOOL_DEADLINE", "180"))
+EXPORT_TOOL_DEADLINE = float(os.getenv("HASHNODE_EXPORT_TOOL_DEADLINE", "1800"))
+
+
+class TimeoutTier(NamedTuple):
+    """Connect, read and total limits in seconds"""
+    connect: float
+    read: float
+    total: float
+
+
+def _tier_from_env(name: str, default: TimeoutTier) -> TimeoutTier:
+    """Read a tier override such as HASHNODE_TIMEOUT_FAST="3,10,10" (connect,read,total)"""
+    value = os.getenv(f"HASHNODE_TIMEOUT_{name.upper()}")
+    if not value:
+        return default
+    return TimeoutTier(*(float(part) for part in value.split(",")))
+
+
+TIMEOUT_TIERS: Dict[str, TimeoutTier] = {
+    "fast": _tier_from_env("fast", TimeoutTier(connect=3.0, read=10.0, total=10.0)),
+    "standard": _tier_from_env("standard", TimeoutTier(connect=5.0, read=30.0, total=30.0)),
+    "slow": _tier_from_env("slow", TimeoutTier(connect=5.0, read=120.0, total=120.0)),
+}
+
+# Tier per query constant (see hashnode_mcp.cache.query_label); anything not
+# listed uses the "standard" tier
+OPERATION_TIERS: Dict[str, str] = {
+    "TEST_QUERY": "fast",
+    "GET_PUBLICATION_ID_QUERY": "fast",
+    "GET_VIEWER_PUBLICATION_QUERY": "fast",
+    "GET_USER_INFO_QUERY": "standard",
+    "GET_POST_BY_ID_QUERY": "standard",
+    "SEARCH_POSTS_OF_PUBLICATION_QUERY": "standard",
+    "CREATE_ARTICLE_MUTATION": "slow",
+    "UPDATE_ARTICLE_MUTATION": "slow",
+    "PUBLISH_DRAFT_MUTATION": "slow",
+}
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a tool has no time budget left for another request"""
+
+
+_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar("hashnode_deadline", default=None)
+
+
+def operation_tier(label: str) -> Tuple[str, TimeoutTier]:
+    """Return the name and limits of the timeout tier for an operation label"""
+    name = OPERATION_TIERS.get(label, "standard")
+    return name, TIMEOUT_TIERS[name]
+
+
+def remaining() -> Optional[float]:
+    """Return the seconds left in the current deadline, or None if there is none"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Run a block under a deadline
+
+    Nested deadlines never extend an outer one.
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def start_shared(func: Callable[[], Awaitable[Any]]) -> "asyncio.Future[Any]":
+    """
+    Start work shared by several callers in a task of its own
+
+    A task runs in a copy of the context of the caller that starts it, so
+    the deadline of that caller is cleared first: callers joining later
+    would otherwise be held to it.
+
+    Args:
+        func: Zero-argument coroutine function performing the work
+    """
+    async def run() -> Any:
+        _deadline.set(None)
+        return await func()
+    return asyncio.ensure_future(run())
+
+
+async def wait_shared(future: "asyncio.Future[Any]", label: str = "") -> Any:
+    """
+    Wait for shared work until the current deadline expires
+
+    The work itself is not cancelled, since other callers may still wait
+    for it.
+
+    Args:
+        future: The task or future of the shared work
+        label: The operation label, used in the error message
+
+    Raises:
+        DeadlineExceeded: If the deadline expires first
+    """
+    budget = remaining()
+    if budget is None:
+        return await asyncio.shield(future)
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), max(budget, 0))
+    except asyncio.TimeoutError:
+        if future.done():
+            # The work itself timed out
+            raise
+        raise DeadlineExceeded(f"Deadline exceeded while waiting for {label or 'a shared request'}")
+
+
+def request_timeout(tier: TimeoutTier, label: str = "") -> Tuple[float, httpx.Timeout]:
+    """
+    Compute the limits for one request from its tier and the current deadline
+
+    Args:
+        tier: The timeout tier of the operation
+        label: The operation label, used in the error message
+
+    Returns:
+        A tuple of (total seconds, ``httpx.Timeout`` for the request)
+    """
+    total = tier.total
+    budget = remaining()
+    if budget is not None:
+        if budget <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded: no time budget left to send {label or 'the request'}")
+        total = min(total, budget)
+    timeout = httpx.Timeout(
+        connect=min(tier.connect, total),
+        read=min(tier.read, total),
+        write=min(tier.read, total),
+        pool=total,
+    )
+    return total, timeout
+
+
+def with_deadline(seconds: float) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Decorator running an async tool under an end-to-end deadline
+
+    Args:
+        seconds: The budget shared by all requests made by one tool call
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with deadline(seconds):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,503 @@
+"""
+Normalized entity cache shared by all operations.
+
+Every response is split into entities (posts, users, publications, tags)
+keyed by type and ``id``, in the style of Apollo's normalized cache. Fields
+from different operations are merged into the same record, so a post seen in
+a search result and later in a details lookup is stored once, and a query
+can be answered without a request when every field it selects is already
+known. Mutation responses are merged the same way, which updates the stored
+entities in place.
+
+Responses carry no ``__typename``, so the type of an object is taken from
+the field it appears under (see ``ENTITY_FIELDS`` and ``CONNECTION_TYPES``).
+"""
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from hashnode_mcp.graphql import Field, is_mutation, parse_selection, resolve_arguments
+from hashnode_mcp.log import get_logger
+
+logger = get_logger(__name__)
+
+ENTITY_CACHE_ENABLED = os.getenv("HASHNODE_ENTITY_CACHE", "true").lower() in ("1", "true", "yes")
+ENTITY_CACHE_TTL = float(os.getenv("HASHNODE_ENTITY_CACHE_TTL", "120"))
+ENTITY_CACHE_SIZE = int(os.getenv("HASHNODE_ENTITY_CACHE_SIZE", "10000"))
+ENTITY_CACHE_MAX_BYTES = int(os.getenv("HASHNODE_ENTITY_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# Root query fields are stored as their own records, "ROOT_QUERY.<storage key>"
+ROOT = "ROOT_QUERY"
+
+# Type of the object returned by a field
+ENTITY_FIELDS: Dict[str, str] = {
+    "post": "Post",
+    "author": "User",
+    "user": "User",
+    "me": "User",
+    "publication": "Publication",
+    "tag": "Tag",
+    "tags": "Tag",
+}
+
+# Type of the ``edges.node`` objects of a connection field
+CONNECTION_TYPES: Dict[str, str] = {
+    "searchPostsOfPublication": "Post",
+    "feed": "Post",
+    "posts": "Post",
+    "publications": "Publication",
+}
+
+# Root fields that can be answered from an entity looked up by an argument,
+# e.g. ``post(id: X)`` reads ``Post:X`` even if that query was never sent
+ROOT_LOOKUPS: Dict[str, Tuple[str, str]] = {
+    "post": ("Post", "id"),
+    "user": ("User", "username"),
+}
+
+# Position of a value inside a record: the storage keys leading to it
+Path = Tuple[str, ...]
+
+
+def entity_key(typename: str, entity_id: Any) -> str:
+    """Return the store key of an entity, e.g. ``Post:64f...``"""
+    return f"{typename}:{entity_id}"
+
+
+def username_key(username: str) -> str:
+    """Return the key identifying a user by username"""
+    return f"User:username={username.lower()}"
+
+
+def tag_slug_key(slug: str) -> str:
+    """Return the key identifying a tag by slug"""
+    return f"Tag:slug={slug.lower()}"
+
+
+def storage_key(field: Field, variables: Optional[dict]) -> str:
+    """Return the key a field is stored under: its name plus resolved arguments"""
+    if not field.arguments:
+        return field.name
+    arguments = resolve_arguments(field.arguments, variables)
+    return f"{field.name}({json.dumps(arguments, sort_keys=True, separators=(',', ':'), default=str)})"
+
+
+def entity_type(field: Field, connection: Optional[str]) -> Optional[str]:
+    """Return the entity type of the object under a field, if it is an entity"""
+    if field.name == "node" and connection in CONNECTION_TYPES:
+        return CONNECTION_TYPES[connection]
+    return ENTITY_FIELDS.get(field.name)
+
+
+def inner_connection(field: Field, connection: Optional[str]) -> Optional[str]:
+    """Track the connection a field belongs to down to its ``edges.node``"""
+    if field.name in CONNECTION_TYPES:
+        return field.name
+    if field.name == "edges":
+        return connection
+    return None
+
+
+def entity_refs(query: str, result: dict) -> Set[str]:
+    """
+    Return the keys of every entity in a response, e.g. {"Post:1", "User:2"}
+
+    Users and tags are also listed by username and slug
+    ("User:username=<name>", "Tag:slug=<slug>") since some operations only
+    know them by those.
+    """
+    refs: Set[str] = set()
+
+    def walk(selections, data: Any, connection: Optional[str]) -> None:
+        if isinstance(data, list):
+            for item in data:
+                walk(selections, item, connection)
+            return
+        if not isinstance(data, dict):
+            return
+        for field in selections:
+            value = data.get(field.key)
+            if field.selections is None or value is None:
+                continue
+            typename = entity_type(field, connection)
+            for item in value if isinstance(value, list) else [value]:
+                if typename and isinstance(item, dict):
+                    if item.get("id") is not None:
+                        refs.add(entity_key(typename, item["id"]))
+                    if typename == "User" and item.get("username"):
+                        refs.add(username_key(item["username"]))
+                    if typename == "Tag" and item.get("slug"):
+                        refs.add(tag_slug_key(item["slug"]))
+            walk(field.selections, value, inner_connection(field, connection))
+
+    try:
+        walk(parse_selection(query), (result or {}).get("data"), None)
+    except ValueError:
+        pass
+    return refs
+
+
+def _merge(
+    target: Dict[str, Any],
+    fields: Dict[str, Any],
+    merge_ref: Callable[[str, Dict[str, Any]], None],
+    times: Optional[Dict[Path, float]] = None,
+    now: float = 0.0,
+    path: Path = (),
+) -> None:
+    """
+    Merge normalized fields, combining nested (non-entity) objects
+
+    An object without an ``id`` selected where a reference is stored (e.g.
+    ``author { name }``) is merged into the referenced entity through
+    ``merge_ref`` instead of replacing the reference. When ``times`` is
+    given, the path of every value written is stamped with ``now``.
+    """
+    for key, value in fields.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict) and "__ref" not in value:
+            if "__ref" in current:
+                merge_ref(current["__ref"], value)
+            else:
+                _merge(current, value, merge_ref, times, now, path + (key,))
+        else:
+            target[key] = value
+            if times is not None:
+                times[path + (key,)] = now
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+class _Miss(Exception):
+    """A selected field is not in the store"""
+
+
+class _Record:
+    """
+    A stored entity or root field
+
+    Entity fields are written by many operations, so each value keeps the
+    time it was last written (by its path in ``fields``) and goes stale on
+    its own. Root records are replaced whole and expire ``ttl`` seconds
+    after ``stored_at``, the TTL of the operation that wrote them.
+    """
+
+    __slots__ = ("fields", "times", "stored_at", "ttl", "size", "tags", "username")
+
+    def __init__(self, fields: Any, stored_at: float = 0.0, ttl: Optional[float] = None, tags: FrozenSet[str] = frozenset()):
+        self.fields = fields
+        self.times: Dict[Path, float] = {}
+        self.stored_at = stored_at
+        self.ttl = ttl
+        self.size = 0
+        self.tags = tags
+        self.username: Optional[str] = None
+
+    def written_at(self, path: Path) -> float:
+        """Return when the value at ``path`` was last written, directly or as part of an enclosing object"""
+        return max((self.times.get(path[:depth], 0.0) for depth in range(1, len(path) + 1)), default=0.0)
+
+
+class EntityStore:
+    """
+    Normalized store of the entities seen in GraphQL responses
+
+    Records are bounded both in number and in total size (their fields
+    serialized as JSON), since a post record may hold a whole article.
+
+    Args:
+        ttl: How long (in seconds) an entity field can answer queries after it was last written
+        max_entities: Maximum number of records kept (least recently used go first)
+        max_bytes: Memory ceiling for all records
+    """
+
+    def __init__(self, ttl: float = ENTITY_CACHE_TTL, max_entities: int = ENTITY_CACHE_SIZE, max_bytes: int = ENTITY_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_entities = max_entities
+        self.max_bytes = max_bytes
+        self._records: "OrderedDict[str, _Record]" = OrderedDict()
+        self._usernames: Dict[str, str] = {}
+        # Tag -> root records answering requests that carried it (see invalidate)
+        self._tagged: Dict[str, Set[str]] = {}
+        self.size = 0
+        # Counters for diagnostics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # Writing
+
+    def write(
+        self,
+        query: str,
+        variables: Optional[dict],
+        result: dict,
+        store_root: bool = True,
+        tags: Iterable[str] = (),
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Merge the entities of a response into the store
+
+        Args:
+            query: The GraphQL document the response answers
+            variables: The request variables
+            result: The response
+            store_root: Also record the root fields of a query so the same
+                query can be answered again (never done for mutations, whose
+                responses only update entities)
+            tags: Invalidation tags of the response, attached to its root records
+            ttl: How long (in seconds) the root records can answer the query,
+                normally the operation TTL (the entity TTL if not given)
+        """
+        data = (result or {}).get("data")
+        if not data or result.get("errors"):
+            return
+        try:
+            selections = parse_selection(query)
+        except ValueError:
+            return
+
+        root = self._normalize_fields(selections, data, variables, None)
+        if store_root and not is_mutation(query):
+            tags = frozenset(tags)
+            for key, value in root.items():
+                record = _Record(value, time.monotonic(), self.ttl if ttl is None else ttl, tags)
+                record.size = _json_size(value)
+                self._insert(f"{ROOT}.{key}", record)
+                for tag in tags:
+                    self._tagged.setdefault(tag, set()).add(f"{ROOT}.{key}")
+            self._shrink()
+
+    def update(self, typename: str, entity_id: Any, fields: Dict[str, Any]) -> None:
+        """Merge plain field values into one entity"""
+        self._store(entity_key(typename, entity_id), fields)
+
+    def evict(self, typename: str, entity_id: Any, fields: Optional[Iterable[str]] = None) -> None:
+        """Forget one entity, or only some of its fields"""
+        key = entity_key(typename, entity_id)
+        record = self._records.get(key)
+        if record is None:
+            return
+        if fields is None:
+            self._remove(key)
+            return
+        for name in fields:
+            # Drop the field under every set of arguments it was stored with
+            for stored in [k for k in record.fields if k == name or k.startswith(name + "(")]:
+                del record.fields[stored]
+                for path in [p for p in record.times if p[0] == stored]:
+                    del record.times[path]
+        self.size -= record.size
+        record.size = _json_size(record.fields)
+        self.size += record.size
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """
+        Forget the root records written with any of ``tags``
+
+        Entities stay; only the stored answers to whole queries (e.g. a
+        listing a new post should now appear in) are dropped.
+
+        Returns:
+            The number of root records removed
+        """
+        removed = 0
+        for tag in tags:
+            for key in list(self._tagged.get(tag, ())):
+                if key in self._records:
+                    self._remove(key)
+                    removed += 1
+            self._tagged.pop(tag, None)
+        return removed
+
+    def clear(self) -> None:
+        """Forget every entity"""
+        self._records.clear()
+        self._usernames.clear()
+        self._tagged.clear()
+        self.size = 0
+
+    def _store(self, key: str, fields: Dict[str, Any]) -> _Record:
+        record = self._records.get(key)
+        if record is None:
+            record = self._insert(key, _Record({}))
+        else:
+            self._records.move_to_end(key)
+        _merge(record.fields, fields, self._store, record.times, time.monotonic())
+        if self._records.get(key) is record:
+            self.size -= record.size
+            record.size = _json_size(record.fields)
+            self.size += record.size
+            self._shrink()
+        return record
+
+    def _insert(self, key: str, record: _Record) -> _Record:
+        if key in self._records:
+            self._remove(key)
+        self._records[key] = record
+        self.size += record.size
+        return record
+
+    def _shrink(self) -> None:
+        while self._records and (len(self._records) > self.max_entities or self.size > self.max_bytes):
+            self._remove(next(iter(self._records)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        record = self._records.pop(key)
+        self.size -= record.size
+        for tag in record.tags:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+        if record.username is not None and self._usernames.get(record.username) == key:
+            del self._usernames[record.username]
+
+    def _normalize_fields(self, selections, data: Dict[str, Any], variables: Optional[dict], connection: Optional[str]) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        for field in selections:
+            if field.key in data:
+                fields[storage_key(field, variables)] = self._normalize_value(field, data[field.key], variables, connection)
+        return fields
+
+    def _normalize_value(self, field: Field, value: Any, variables: Optional[dict], connection: Optional[str]) -> Any:
+        if field.selections is None or value is None:
+            return value
+        if isinstance(value, list):
+            return [self._normalize_value(field, item, variables, connection) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        typename = entity_type(field, connection)
+        fields = self._normalize_fields(field.selections, value, variables, inner_connection(field, connection))
+
+        if typename and value.get("id") is not None:
+            key = entity_key(typename, value["id"])
+            record = self._store(key, fields)
+            if typename == "User" and value.get("username") and key in self._records:
+                record.username = value["username"].lower()
+                self._usernames[record.username] = key
+            return {"__ref": key}
+        return fields
+
+    # Reading
+
+    def read(self, query: str, variables: Optional[dict] = None, max_age: Optional[float] = None) -> Optional[dict]:
+        """
+        Answer a query from the store
+
+        Args:
+            query: The GraphQL document
+            variables: The request variables
+            max_age: Oldest acceptable value in seconds, e.g. the TTL of the
+                operation when it is shorter than the entity TTL
+
+        Returns:
+            The response, or None if any selected field is missing or stale
+        """
+        if is_mutation(query):
+            return None
+        try:
+            selections = parse_selection(query)
+        except ValueError:
+            return None
+
+        now = time.monotonic()
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        data: Dict[str, Any] = {}
+        try:
+            for field in selections:
+                key = f"{ROOT}.{storage_key(field, variables)}"
+                record = self._records.get(key)
+                if record is not None and now - record.stored_at < (record.ttl if max_age is None else min(record.ttl, max_age)):
+                    self._records.move_to_end(key)
+                    value = record.fields
+                else:
+                    value = self._root_lookup(field, variables)
+                data[field.key] = self._materialize(field, value, variables, now - ttl)
+        except _Miss:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Hand out a copy so callers cannot change the stored records
+        result = json.loads(json.dumps({"data": data}))
+        result["extensions"] = {"cache": {"hit": True, "entity": True}}
+        return result
+
+    def get(self, typename: str, entity_id: Any) -> Optional[Dict[str, Any]]:
+        """Return a copy of the fresh fields of an entity (references left as is)"""
+        record = self._records.get(entity_key(typename, entity_id))
+        if record is None:
+            return None
+        cutoff = time.monotonic() - self.ttl
+        stale = {path[0] for path in record.times if record.written_at(path) <= cutoff}
+        fields = {key: value for key, value in record.fields.items() if key not in stale}
+        return json.loads(json.dumps(fields)) if fields else None
+
+    def _root_lookup(self, field: Field, variables: Optional[dict]) -> Any:
+        if field.name not in ROOT_LOOKUPS:
+            raise _Miss()
+        typename, argument = ROOT_LOOKUPS[field.name]
+        value = resolve_arguments(field.arguments, variables).get(argument)
+        if value is None:
+            raise _Miss()
+        if typename == "User" and argument == "username":
+            key = self._usernames.get(str(value).lower())
+        else:
+            key = entity_key(typename, value)
+        if key is None or key not in self._records:
+            raise _Miss()
+        return {"__ref": key}
+
+    def _materialize(
+        self,
+        field: Field,
+        value: Any,
+        variables: Optional[dict],
+        cutoff: float,
+        record: Optional[_Record] = None,
+        path: Path = (),
+    ) -> Any:
+        """
+        Rebuild the selection of ``field`` from ``value``
+
+        ``record`` is the entity ``value`` sits in, at ``path``. Every value
+        taken from it must have been written after ``cutoff``; a listing
+        refreshing a post's ``brief`` does not make its ``content`` fresh.
+        """
+        if field.selections is None or value is None:
+            return value
+        if isinstance(value, list):
+            # Lists are written whole, so their items are as fresh as the list
+            return [self._materialize(field, item, variables, cutoff) for item in value]
+        if "__ref" in value:
+            key = value["__ref"]
+            record = self._records.get(key)
+            if record is None:
+                raise _Miss()
+            self._records.move_to_end(key)
+            value, path = record.fields, ()
+
+        result: Dict[str, Any] = {}
+        for child in field.selections:
+            key = storage_key(child, variables)
+            if key not in value:
+                raise _Miss()
+            item = value[key]
+            merged = child.selections is not None and isinstance(item, dict) and "__ref" not in item
+            if record is not None and not merged and record.written_at(path + (key,)) <= cutoff:
+                # Nested objects are checked field by field further down
+                raise _Miss()
+            result[child.key] = self._materialize(child, item, variables, cutoff, record, path + (key,))
+        return result
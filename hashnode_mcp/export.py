@@ -0,0 +1,296 @@
+"""
+Streaming export of a whole publication to newline-delimited JSON.
+
+Posts are listed page by page with ``SEARCH_POSTS_OF_PUBLICATION_QUERY`` and
+their full details are fetched with ``GET_POST_BY_ID_QUERY`` under a bounded
+concurrency. Every post is written as one JSON line as soon as its page is
+complete, so memory use does not grow with the size of the publication.
+
+Progress is kept in a ``<output>.state`` file holding the cursor after the
+last page written and the size of the output at that point. An interrupted
+export resumes from there: anything written after the last checkpoint is
+truncated and the page is fetched again. Posts that could not be fetched
+are listed in the state and retried by the next run (even of a complete
+export), which appends them at the end of the file. If the output is
+missing or shorter than the saved size, the export starts over.
+
+The API calls are made through a ``PublicationApi`` handed in by the
+caller (the server provides one backed by its client and caches). The
+``export_publication`` tool only writes inside ``HASHNODE_EXPORT_DIR``
+(see ``export_path``).
+
+Usage:
+    python -m hashnode_mcp.export blog.example.com posts.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from dotenv import load_dotenv
+
+# Load .env before the configuration below is read (matters when run as a script)
+load_dotenv()
+
+from hashnode_mcp.log import configure_logging, get_logger
+from hashnode_mcp.pagination import LISTING_PAGE_SIZE, PageFetcher, iter_pages
+from hashnode_mcp.utils import GET_POST_BY_ID_QUERY
+
+logger = get_logger(__name__)
+
+EXPORT_CONCURRENCY = int(os.getenv("HASHNODE_EXPORT_CONCURRENCY", "5"))
+# Directory the export_publication tool writes to
+EXPORT_DIR = os.getenv("HASHNODE_EXPORT_DIR", "exports")
+
+
+class PublicationApi(NamedTuple):
+    """
+    The API calls made by an export or a mirror sync
+
+    resolve: Resolve a hostname to the publication's ID and title, or None
+    list_posts: Build the page fetcher (see ``iter_pages``) listing the
+        posts of a publication, given its ID, newest first
+    fetch: Send a read query and return the response, bypassing the caches
+    """
+    resolve: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+    list_posts: Callable[[str], PageFetcher]
+    fetch: Callable[[str, Optional[dict]], Awaitable[dict]]
+
+
+def export_path(name: str, directory: str = EXPORT_DIR) -> str:
+    """
+    Resolve the file an export requested through the tool writes
+
+    Args:
+        name: The file, relative to ``directory``
+        directory: The directory exports are confined to
+
+    Returns:
+        The absolute path of the file
+
+    Raises:
+        ValueError: If ``name`` is absolute or leads outside ``directory``
+    """
+    parts = name.replace("\\", "/").split("/")
+    if not name.strip() or os.path.isabs(name) or os.path.splitdrive(name)[0] or ".." in parts:
+        raise ValueError(f"Export path '{name}' must be a relative path inside the export directory")
+    root = os.path.realpath(directory)
+    path = os.path.realpath(os.path.join(root, name))
+    # Also catches symlinks pointing out of the directory
+    if path == root or os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Export path '{name}' must be a relative path inside the export directory")
+    return path
+
+
+def state_path(path: str) -> str:
+    """Return the path of the resume state kept next to an export file"""
+    return f"{path}.state"
+
+
+def load_state(path: str) -> Optional[Dict[str, Any]]:
+    """Load the resume state of an export, or None if there is none"""
+    try:
+        with open(state_path(path), "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def save_state(path: str, state: Dict[str, Any]) -> None:
+    """Atomically replace the resume state of an export"""
+    tmp_path = state_path(path) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, state_path(path))
+
+
+def append_lines(fh, lines: List[bytes]) -> int:
+    """Write lines to the output and flush them to disk; returns the new offset"""
+    fh.writelines(lines)
+    fh.flush()
+    os.fsync(fh.fileno())
+    return fh.tell()
+
+
+async def fetch_post(api: PublicationApi, post_id: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """
+    Fetch the full details of one post, limited by ``semaphore``
+
+    The response and entity caches are bypassed, so exporting a whole
+    publication does not fill them with post bodies.
+
+    Raises:
+        ValueError: If the API returned errors or no post
+    """
+    async with semaphore:
+        data = await api.fetch(GET_POST_BY_ID_QUERY, {"id": post_id})
+    if not data or "errors" in data:
+        raise ValueError(json.dumps((data or {}).get("errors")))
+    post = (data.get("data") or {}).get("post")
+    if not post:
+        raise ValueError("post not found")
+    return post
+
+
+async def export_publication(
+    api: PublicationApi,
+    hostname: str,
+    path: str,
+    concurrency: int = EXPORT_CONCURRENCY,
+    page_size: int = LISTING_PAGE_SIZE,
+    resume: bool = True,
+) -> Dict[str, Any]:
+    """
+    Export every post of a publication, with content, to a JSONL file
+
+    Args:
+        api: The API calls to make
+        hostname: The hostname of the publication (e.g., "blog.example.com")
+        path: The file to write, one post per line
+        concurrency: Maximum number of post details fetched at the same time
+        page_size: Number of posts listed per request
+        resume: Continue an interrupted export of the same publication
+
+    Returns:
+        The saved export state (publication, cursor, posts written, failed
+        post IDs, completion) plus the number of posts exported by this call
+    """
+    publication = await api.resolve(hostname)
+    if not publication:
+        raise ValueError(f"Could not find publication with hostname '{hostname}'")
+
+    state = load_state(path) if resume else None
+    if state and state.get("publication_id") != publication["id"]:
+        raise ValueError(f"'{path}' holds an export of another publication; use a new file or disable resume")
+    if state and (not os.path.exists(path) or os.path.getsize(path) < state["offset"]):
+        # The output no longer holds what the state says was written
+        logger.warning("'%s' is missing or shorter than its saved progress; starting the export over", path)
+        state = None
+    if state and state.get("complete") and not state["failed"]:
+        return {**state, "exported": 0}
+
+    if state:
+        logger.info("Resuming export of %s after %s posts", hostname, state["written"])
+    else:
+        state = {
+            "hostname": hostname,
+            "publication_id": publication["id"],
+            "publication": publication["title"] or hostname,
+            "cursor": None,
+            "offset": 0,
+            "written": 0,
+            "failed": [],
+            "complete": False,
+        }
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    exported = 0
+    mode = "r+b" if state["offset"] else "wb"
+    with open(path, mode) as fh:
+        # Drop anything written after the last checkpoint
+        fh.seek(state["offset"])
+        fh.truncate()
+
+        async def export_posts(post_ids: List[str]) -> List[str]:
+            """Append the given posts and checkpoint; returns the IDs that failed"""
+            nonlocal exported
+            results = await asyncio.gather(
+                *(fetch_post(api, post_id, semaphore) for post_id in post_ids),
+                return_exceptions=True,
+            )
+
+            lines: List[bytes] = []
+            failed: List[str] = []
+            for post_id, result in zip(post_ids, results):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    logger.warning("Could not export post %s: %s", post_id, result)
+                    failed.append(post_id)
+                    continue
+                lines.append(json.dumps(result, ensure_ascii=False).encode("utf-8") + b"\n")
+
+            # Disk writes run in a worker thread so other tool calls are not held up
+            offset = await asyncio.to_thread(append_lines, fh, lines)
+
+            exported += len(lines)
+            state["written"] += len(lines)
+            state["offset"] = offset
+            return failed
+
+        if state["failed"]:
+            # Posts that failed in an earlier run are appended out of order
+            logger.info("Retrying %s posts of %s that could not be exported", len(state["failed"]), hostname)
+            state["failed"] = await export_posts(state["failed"])
+            await asyncio.to_thread(save_state, path, state)
+
+        if not state["complete"]:
+            pages = iter_pages(api.list_posts(publication["id"]), None, page_size, after=state["cursor"])
+            try:
+                async for edges, cursor in pages:
+                    post_ids = [edge["node"]["id"] for edge in edges if edge.get("node")]
+                    state["failed"].extend(await export_posts(post_ids))
+                    state["cursor"] = cursor
+                    state["complete"] = cursor is None
+                    await asyncio.to_thread(save_state, path, state)
+                    logger.info("Exported %s posts of %s", state["written"], hostname)
+            finally:
+                await pages.aclose()
+
+    state["complete"] = True
+    await asyncio.to_thread(save_state, path, state)
+    return {**state, "exported": exported}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: export a publication to a JSONL file"""
+    from hashnode_mcp.http_client import close_client
+    # The command line uses the server's client and caches
+    from hashnode_mcp.mcp_server import publication_api
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Export every post of a Hashnode publication to JSONL")
+    parser.add_argument("hostname", help="Hostname of the publication, e.g. blog.example.com")
+    parser.add_argument("output", help="File to write, one post per line")
+    parser.add_argument("--concurrency", type=int, default=EXPORT_CONCURRENCY, help="Post details fetched at the same time")
+    parser.add_argument("--page-size", type=int, default=LISTING_PAGE_SIZE, help="Posts listed per request (max 20)")
+    parser.add_argument("--restart", action="store_true", help="Ignore any saved progress and start over")
+    args = parser.parse_args(argv)
+
+    async def run() -> Dict[str, Any]:
+        try:
+            return await export_publication(
+                publication_api,
+                args.hostname,
+                args.output,
+                concurrency=args.concurrency,
+                page_size=args.page_size,
+                resume=not args.restart,
+            )
+        finally:
+            await close_client()
+
+    try:
+        summary = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("Export interrupted; run the same command again to resume", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Export stopped: {e}; run the same command again to resume", file=sys.stderr)
+        return 1
+
+    print(
+        f"Exported {summary['written']} posts of {summary['publication']} to {args.output}"
+        + (f" ({len(summary['failed'])} failed)" if summary["failed"] else ""),
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,475 @@
+"""
+Lightweight helpers for inspecting and rewriting GraphQL documents.
+
+These only understand the subset of GraphQL used by the query constants in
+``hashnode_mcp.utils`` (a single operation, no named fragments), which is
+all the server needs to batch, classify and normalize requests.
+"""
+import functools
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+_OPERATION_RE = re.compile(r"^\s*(query|mutation|subscription)\b\s*([A-Za-z_]\w*)?", re.S)
+_VARIABLE_RE = re.compile(r"\$([A-Za-z_]\w*)")
+_TOKEN_RE = re.compile(r"@?[A-Za-z_]\w*|:")
+_NAME_RE = re.compile(r"[A-Za-z_]\w*")
+
+
+def operation_type(query: str) -> str:
+    """
+    Return the operation type of a GraphQL document
+
+    Args:
+        query: The GraphQL document
+
+    Returns:
+        "query", "mutation" or "subscription" (anonymous ``{ ... }`` documents are queries)
+    """
+    match = _OPERATION_RE.match(query)
+    return match.group(1) if match else "query"
+
+
+def operation_name(query: str) -> Optional[str]:
+    """Return the operation name of a GraphQL document, if it has one"""
+    match = _OPERATION_RE.match(query)
+    return match.group(2) if match else None
+
+
+def is_mutation(query: str) -> bool:
+    """Check whether a GraphQL document is a mutation"""
+    return operation_type(query) == "mutation"
+
+
+def request_key(query: str, variables: Optional[dict] = None) -> str:
+    """
+    Build a stable key identifying a GraphQL request
+
+    The key combines the operation name, a digest of the whitespace-normalised
+    document and the canonicalised (sorted, compact) JSON of the variables, so
+    identical requests map to the same key regardless of dict ordering.
+
+    Args:
+        query: The GraphQL document
+        variables: The request variables
+
+    Returns:
+        The request key
+    """
+    normalised = " ".join(query.split())
+    digest = hashlib.sha1(normalised.encode("utf-8")).hexdigest()[:12]
+    canonical = json.dumps(variables or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{operation_name(query) or 'anonymous'}:{digest}:{canonical}"
+
+
+def _skip_string(text: str, i: int) -> int:
+    """Return the index just past the string literal starting at ``text[i]``"""
+    if text.startswith('"""', i):
+        end = text.find('"""', i + 3)
+        return len(text) if end == -1 else end + 3
+    i += 1
+    while i < len(text):
+        if text[i] == "\\":
+            i += 2
+            continue
+        if text[i] == '"':
+            return i + 1
+        i += 1
+    return i
+
+
+def _matching(text: str, start: int, open_char: str, close_char: str) -> int:
+    """Return the index of the bracket closing the one at ``text[start]``"""
+    depth = 0
+    i = start
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            i = _skip_string(text, i)
+            continue
+        if char == "#":
+            end = text.find("\n", i)
+            i = len(text) if end == -1 else end
+            continue
+        if char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError(f"Unbalanced '{open_char}' in GraphQL document")
+
+
+def split_operation(query: str) -> Tuple[str, Optional[str], str, str]:
+    """
+    Split a single-operation GraphQL document into its parts
+
+    Args:
+        query: The GraphQL document
+
+    Returns:
+        A tuple of (operation type, operation name, variable definitions, selection body)
+        where the variable definitions and body are returned without their enclosing
+        brackets
+    """
+    if "fragment " in query:
+        raise ValueError("GraphQL documents with fragments are not supported")
+
+    op_type = operation_type(query)
+    name = operation_name(query)
+    body_start = query.find("{")
+    if body_start == -1:
+        raise ValueError("GraphQL document has no selection set")
+
+    var_defs = ""
+    paren_start = query.find("(")
+    if paren_start != -1 and paren_start < body_start:
+        paren_end = _matching(query, paren_start, "(", ")")
+        var_defs = query[paren_start + 1:paren_end]
+        body_start = query.find("{", paren_end)
+
+    body_end = _matching(query, body_start, "{", "}")
+    if query[body_end + 1:].strip():
+        raise ValueError("Only single-operation GraphQL documents are supported")
+
+    return op_type, name, var_defs.strip(), query[body_start + 1:body_end]
+
+
+def rename_variables(text: str, suffix: str) -> str:
+    """Append ``suffix`` to every ``$variable`` reference in ``text``"""
+    return _VARIABLE_RE.sub(lambda m: f"${m.group(1)}{suffix}", text)
+
+
+@functools.lru_cache(maxsize=128)
+def query_complexity(query: str) -> int:
+    """
+    Estimate the complexity of a query as the number of fields it selects
+
+    Aliases, arguments and directives are not counted. This mirrors the
+    per-field cost the API uses closely enough to decide how many queries
+    can be merged into one request.
+
+    Args:
+        query: The GraphQL query
+
+    Returns:
+        The number of selected fields (at least 1)
+    """
+    _, _, _, body = split_operation(query)
+    parts = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == '"':
+            i = _skip_string(body, i)
+        elif char == "#":
+            end = body.find("\n", i)
+            i = len(body) if end == -1 else end
+        elif char == "(":
+            i = _matching(body, i, "(", ")") + 1
+        else:
+            parts.append(char)
+            i += 1
+
+    tokens = _TOKEN_RE.findall("".join(parts))
+    fields = 0
+    for index, token in enumerate(tokens):
+        if token == ":" or token.startswith("@"):
+            continue
+        if index + 1 < len(tokens) and tokens[index + 1] == ":":
+            # An alias, the field name follows
+            continue
+        fields += 1
+    return max(1, fields)
+
+
+def alias_root_fields(body: str, prefix: str) -> Tuple[str, List[str]]:
+    """
+    Prefix every root field of a selection body with an alias
+
+    ``post(id: $id) { ... }`` becomes ``p0_post: post(id: $id) { ... }`` for the
+    prefix ``p0_``. Existing aliases are prefixed as well.
+
+    Args:
+        body: The selection body (without the enclosing braces)
+        prefix: The prefix used to build the aliases
+
+    Returns:
+        A tuple of (rewritten body, original response keys in order)
+    """
+    out = []
+    keys = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == '"':
+            end = _skip_string(body, i)
+            out.append(body[i:end])
+            i = end
+            continue
+        if char == "#":
+            end = body.find("\n", i)
+            end = len(body) if end == -1 else end
+            out.append(body[i:end])
+            i = end
+            continue
+        if char in "({":
+            end = _matching(body, i, char, ")" if char == "(" else "}") + 1
+            out.append(body[i:end])
+            i = end
+            continue
+        if body.startswith("...", i):
+            raise ValueError("Fragment spreads on root fields are not supported")
+        if char.isalpha() or char == "_":
+            start = i
+            while i < len(body) and (body[i].isalnum() or body[i] == "_"):
+                i += 1
+            name = body[start:i]
+            j = i
+            while j < len(body) and body[j].isspace():
+                j += 1
+            if j < len(body) and body[j] == ":":
+                # Already aliased: ``alias: field`` -> ``prefix_alias: field``
+                j += 1
+                while j < len(body) and body[j].isspace():
+                    j += 1
+                i = j
+                while i < len(body) and (body[i].isalnum() or body[i] == "_"):
+                    i += 1
+                out.append(f"{prefix}{name}: {body[j:i]}")
+            else:
+                out.append(f"{prefix}{name}: {name}")
+            keys.append(name)
+            continue
+        out.append(char)
+        i += 1
+
+    return "".join(out), keys
+
+
+class Field(NamedTuple):
+    """A field of a parsed selection set"""
+    name: str
+    alias: Optional[str]
+    arguments: str
+    selections: Optional[Tuple["Field", ...]]
+
+    @property
+    def key(self) -> str:
+        """The key of the field in the response"""
+        return self.alias or self.name
+
+
+def _skip_ignored(text: str, i: int) -> int:
+    """Skip whitespace, commas and comments"""
+    while i < len(text):
+        if text[i].isspace() or text[i] == ",":
+            i += 1
+        elif text[i] == "#":
+            end = text.find("\n", i)
+            i = len(text) if end == -1 else end
+        else:
+            break
+    return i
+
+
+def _parse_fields(body: str) -> Tuple[Field, ...]:
+    """Parse the inside of a selection set"""
+    fields: List[Field] = []
+    i = _skip_ignored(body, 0)
+    while i < len(body):
+        if body.startswith("...", i):
+            i = _skip_ignored(body, i + 3)
+            match = _NAME_RE.match(body, i)
+            if not match or match.group() != "on":
+                raise ValueError("Fragment spreads are not supported")
+            # Inline fragment: ``... on Type { ... }`` selects into the parent
+            i = _skip_ignored(body, match.end())
+            i = _skip_ignored(body, _NAME_RE.match(body, i).end())
+            end = _matching(body, i, "{", "}")
+            fields.extend(_parse_fields(body[i + 1:end]))
+            i = _skip_ignored(body, end + 1)
+            continue
+
+        match = _NAME_RE.match(body, i)
+        if not match:
+            raise ValueError(f"Unexpected character {body[i]!r} in selection set")
+        name, alias = match.group(), None
+        i = _skip_ignored(body, match.end())
+        if body.startswith(":", i):
+            i = _skip_ignored(body, i + 1)
+            match = _NAME_RE.match(body, i)
+            alias, name = name, match.group()
+            i = _skip_ignored(body, match.end())
+
+        arguments = ""
+        if body.startswith("(", i):
+            end = _matching(body, i, "(", ")")
+            arguments = " ".join(body[i + 1:end].split())
+            i = _skip_ignored(body, end + 1)
+
+        while body.startswith("@", i):
+            # Directives do not change the shape of the stored data
+            i = _skip_ignored(body, _NAME_RE.match(body, i + 1).end())
+            if body.startswith("(", i):
+                i = _skip_ignored(body, _matching(body, i, "(", ")") + 1)
+
+        selections = None
+        if body.startswith("{", i):
+            end = _matching(body, i, "{", "}")
+            selections = _parse_fields(body[i + 1:end])
+            i = _skip_ignored(body, end + 1)
+
+        fields.append(Field(name, alias, arguments, selections))
+    return tuple(fields)
+
+
+@functools.lru_cache(maxsize=128)
+def parse_selection(query: str) -> Tuple[Field, ...]:
+    """
+    Parse the selection set of a single-operation GraphQL document
+
+    Inline fragments are flattened into their parent selection.
+
+    Args:
+        query: The GraphQL document
+
+    Returns:
+        The root fields, each with its nested selections
+    """
+    return _parse_fields(split_operation(query)[3])
+
+
+def resolve_arguments(arguments: str, variables: Optional[dict] = None) -> Dict[str, Any]:
+    """
+    Resolve the arguments of a field against the request variables
+
+    Variables and string literals are resolved to their values; other
+    literals (numbers, enums, input objects) are kept as normalized text,
+    with any variables inside them substituted.
+
+    Args:
+        arguments: The argument text of a parsed field
+        variables: The request variables
+
+    Returns:
+        The arguments by name
+    """
+    resolved: Dict[str, Any] = {}
+    variables = variables or {}
+    i = _skip_ignored(arguments, 0)
+    while i < len(arguments):
+        match = _NAME_RE.match(arguments, i)
+        if not match:
+            raise ValueError(f"Cannot parse arguments: {arguments}")
+        name = match.group()
+        i = _skip_ignored(arguments, match.end())
+        if not arguments.startswith(":", i):
+            raise ValueError(f"Cannot parse arguments: {arguments}")
+        i = _skip_ignored(arguments, i + 1)
+
+        char = arguments[i]
+        if char == "$":
+            match = _NAME_RE.match(arguments, i + 1)
+            value = variables.get(match.group())
+            i = match.end()
+        elif char == '"':
+            end = _skip_string(arguments, i)
+            value = json.loads(arguments[i:end])
+            i = end
+        elif char in "{[":
+            end = _matching(arguments, i, char, "}" if char == "{" else "]") + 1
+            value = " ".join(arguments[i:end].split())
+            value = _VARIABLE_RE.sub(lambda m: json.dumps(variables.get(m.group(1)), sort_keys=True), value)
+            i = end
+        else:
+            end = i
+            while end < len(arguments) and not (arguments[end].isspace() or arguments[end] in ",)"):
+                end += 1
+            value = arguments[i:end]
+            i = end
+        resolved[name] = value
+        i = _skip_ignored(arguments, i)
+    return resolved
+
+
+def merge_queries(requests: List[Tuple[str, Optional[dict]]], name: str = "Batched") -> Tuple[str, dict, List[List[Tuple[str, str]]]]:
+    """
+    Merge several read queries into one aliased GraphQL document
+
+    Args:
+        requests: A list of (query, variables) tuples
+        name: The operation name of the merged document
+
+    Returns:
+        A tuple of (merged query, merged variables, per-request list of
+        (alias, original key) pairs) used by ``split_response``
+    """
+    var_defs = []
+    bodies = []
+    variables = {}
+    aliases = []
+
+    for index, (query, query_variables) in enumerate(requests):
+        op_type, _, defs, body = split_operation(query)
+        if op_type != "query":
+            raise ValueError("Only queries can be merged")
+
+        suffix = f"_b{index}"
+        prefix = f"b{index}_"
+        if defs:
+            var_defs.append(rename_variables(defs, suffix))
+        aliased_body, keys = alias_root_fields(rename_variables(body, suffix), prefix)
+        bodies.append(aliased_body)
+        aliases.append([(f"{prefix}{key}", key) for key in keys])
+
+        for key, value in (query_variables or {}).items():
+            variables[f"{key}{suffix}"] = value
+
+    header = f"query {name}"
+    if var_defs:
+        header += "(" + ", ".join(d.strip().rstrip(",") for d in var_defs) + ")"
+    merged = header + " {\n" + "\n".join(bodies) + "\n}"
+    return merged, variables, aliases
+
+
+def split_response(result: dict, aliases: List[List[Tuple[str, str]]]) -> List[dict]:
+    """
+    Split the response of a merged document back into per-request responses
+
+    Errors are routed to the request owning the alias at the start of their
+    ``path``; errors without a path are copied to every request.
+
+    Args:
+        result: The response returned for the merged document
+        aliases: The alias mapping returned by ``merge_queries``
+
+    Returns:
+        One GraphQL response dict per original request, in order
+    """
+    data = result.get("data")
+    owners: Dict[str, Tuple[int, str]] = {}
+    for index, pairs in enumerate(aliases):
+        for alias, key in pairs:
+            owners[alias] = (index, key)
+
+    responses: List[dict] = []
+    for pairs in aliases:
+        if data is None:
+            responses.append({"data": None})
+        else:
+            responses.append({"data": {key: data.get(alias) for alias, key in pairs}})
+
+    for error in result.get("errors") or []:
+        path = error.get("path") or []
+        if path and path[0] in owners:
+            index, key = owners[path[0]]
+            routed = dict(error, path=[key] + list(path[1:]))
+            responses[index].setdefault("errors", []).append(routed)
+        else:
+            for response in responses:
+                response.setdefault("errors", []).append(error)
+
+    return responses
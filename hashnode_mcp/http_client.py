@@ -0,0 +1,89 @@
+"""
+Shared, pooled HTTP client for talking to the Hashnode GraphQL API.
+
+A single ``httpx.AsyncClient`` is kept for the lifetime of the server so that
+TCP/TLS connections are reused between tool calls instead of being set up
+again for every request.
+"""
+import os
+from typing import Optional
+
+import httpx
+
+from hashnode_mcp.log import get_logger
+
+logger = get_logger(__name__)
+
+# Pool configuration (all values can be overridden through the environment)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HASHNODE_HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HASHNODE_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HASHNODE_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("HASHNODE_HTTP_TIMEOUT", "120"))
+HTTP2_ENABLED = os.getenv("HASHNODE_HTTP2", "false").lower() in ("1", "true", "yes")
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Create a new pooled client using the configured limits
+
+    Returns:
+        An ``httpx.AsyncClient`` with keep-alive enabled
+    """
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+
+    http2 = HTTP2_ENABLED
+    if http2 and not _http2_available():
+        logger.warning("HASHNODE_HTTP2 is enabled but the 'h2' package is not installed; falling back to HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT,
+        limits=limits,
+        http2=http2,
+        headers={
+            "Content-Type": "application/json",
+            "User-Agent": "Hashnode MCP Server/1.0"
+        }
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared client, creating it on first use
+
+    The client is normally opened by the server lifespan, but it is created
+    lazily as well so ``fetch_from_api`` keeps working outside the server
+    (scripts, the REPL, ...).
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+
+async def open_client() -> httpx.AsyncClient:
+    """Open the shared client (called when the server starts)"""
+    return get_client()
+
+
+async def close_client() -> None:
+    """Close the shared client and release all pooled connections"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
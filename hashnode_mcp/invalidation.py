@@ -0,0 +1,160 @@
+"""
+Cache invalidation driven by mutations.
+
+Every cached response is tagged with the entities it contains and with the
+publication, tag or user it was requested for (``response_tags``). Each
+mutation in ``hashnode_mcp.utils`` maps to the tags it makes stale and to the
+stored entity fields it changes (``mutation_effects``), so a write drops
+exactly the post details, search pages and latest lists that could show old
+data. Fields returned by the mutation are then written through to the entity
+store, which is what makes long TTLs safe.
+"""
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Set
+
+from hashnode_mcp.cache import query_label
+from hashnode_mcp.entities import entity_key, entity_refs, tag_slug_key, username_key
+
+# Post fields changed by each UpdatePostInput field; input fields not listed
+# here drop the whole stored post
+UPDATE_POST_FIELDS: Dict[str, Set[str]] = {
+    "id": set(),
+    "title": {"title"},
+    "subtitle": {"subtitle"},
+    "contentMarkdown": {"content", "brief", "readTimeInMinutes"},
+    "slug": {"slug", "url"},
+    "originalArticleURL": {"canonicalUrl"},
+    "coverImageOptions": {"coverImage"},
+    "tags": {"tags"},
+    "publishedAt": {"publishedAt"},
+}
+
+
+class MutationEffects(NamedTuple):
+    """What a mutation makes stale"""
+    tags: Set[str]
+    # Entity key -> fields to drop, or None to drop the whole entity
+    entities: Dict[str, Optional[Set[str]]]
+
+
+def response_tags(query: str, variables: Optional[dict], result: dict) -> Set[str]:
+    """
+    Return the tags of a cacheable response
+
+    Args:
+        query: The GraphQL query
+        variables: The request variables
+        result: The response
+
+    Returns:
+        Entity keys found in the response plus the publication, tag, post or
+        user the request was made for (so empty results are tagged too)
+    """
+    tags = entity_refs(query, result)
+    variables = variables or {}
+    search_filter = variables.get("filter")
+    if isinstance(search_filter, dict) and search_filter.get("publicationId"):
+        tags.add(entity_key("Publication", search_filter["publicationId"]))
+
+    label = query_label(query)
+    if label == "GET_POST_BY_ID_QUERY" and variables.get("id"):
+        tags.add(entity_key("Post", variables["id"]))
+    elif label == "GET_ARTICLES_BY_TAG_QUERY" and variables.get("tag"):
+        tags.add(tag_slug_key(variables["tag"]))
+    elif variables.get("username"):
+        tags.add(username_key(variables["username"]))
+    return tags
+
+
+def _input(variables: Optional[dict]) -> Dict[str, Any]:
+    return (variables or {}).get("input") or {}
+
+
+def _returned_post(result: dict) -> Dict[str, Any]:
+    """Return the ``post`` object of a mutation response such as publishPost"""
+    for value in ((result or {}).get("data") or {}).values():
+        if isinstance(value, dict) and isinstance(value.get("post"), dict):
+            return value["post"]
+    return {}
+
+
+def _tag_slugs(tags: Optional[Iterable[dict]]) -> Set[str]:
+    return {tag_slug_key(tag["slug"]) for tag in tags or [] if tag.get("slug")}
+
+
+# Listings a new post can show up in when its publication is unknown
+LISTING_TAGS = {
+    "op:SEARCH_POSTS_OF_PUBLICATION_QUERY",
+    "op:GET_PUBLICATION_POSTS_QUERY",
+    "op:GET_ARTICLES_BY_USERNAME_QUERY",
+    "op:GET_TOP_ARTICLES_QUERY",
+}
+
+
+def _publish_post(variables: Optional[dict], result: dict) -> MutationEffects:
+    post = _returned_post(result)
+    publication_id = _input(variables).get("publicationId") or (post.get("publication") or {}).get("id")
+    tags = {"op:GET_ARTICLES_BY_USERNAME_QUERY", "op:GET_TOP_ARTICLES_QUERY"} | _tag_slugs(_input(variables).get("tags"))
+    if publication_id:
+        tags.add(entity_key("Publication", publication_id))
+    else:
+        tags |= LISTING_TAGS
+    if post.get("id"):
+        tags.add(entity_key("Post", post["id"]))
+    return MutationEffects(tags, {})
+
+
+def _publish_draft(variables: Optional[dict], result: dict) -> MutationEffects:
+    post = _returned_post(result)
+    tags = set(LISTING_TAGS)
+    if post.get("id"):
+        tags.add(entity_key("Post", post["id"]))
+    return MutationEffects(tags, {})
+
+
+def _update_post(variables: Optional[dict], result: dict) -> MutationEffects:
+    update = _input(variables)
+    post_id = update.get("id") or _returned_post(result).get("id")
+    if not post_id:
+        return MutationEffects(set(LISTING_TAGS), {})
+
+    key = entity_key("Post", post_id)
+    # Every response showing the post, and the lists of any tag it now has
+    tags = {key} | _tag_slugs(update.get("tags"))
+    fields: Optional[Set[str]] = set()
+    for name in update:
+        if name not in UPDATE_POST_FIELDS:
+            fields = None
+            break
+        fields |= UPDATE_POST_FIELDS[name]
+    return MutationEffects(tags, {key: fields})
+
+
+def _toggle_follow(variables: Optional[dict], result: dict) -> MutationEffects:
+    username = (variables or {}).get("username")
+    return MutationEffects({username_key(username)} if username else set(), {})
+
+
+def _no_effect(variables: Optional[dict], result: dict) -> MutationEffects:
+    return MutationEffects(set(), {})
+
+
+# Effects of each mutation constant in hashnode_mcp.utils
+MUTATION_EFFECTS: Dict[str, Callable[[Optional[dict], dict], MutationEffects]] = {
+    "CREATE_ARTICLE_MUTATION": _publish_post,
+    "PUBLISH_DRAFT_MUTATION": _publish_draft,
+    "UPDATE_ARTICLE_MUTATION": _update_post,
+    "TOGGLE_FOLLOW_MUTATION": _toggle_follow,
+    "CREATE_WEBHOOK_MUTATION": _no_effect,
+}
+
+
+def mutation_effects(query: str, variables: Optional[dict], result: dict) -> MutationEffects:
+    """
+    Return what a mutation makes stale
+
+    Unknown mutations conservatively invalidate every cached listing.
+    """
+    effects = MUTATION_EFFECTS.get(query_label(query))
+    if effects is None:
+        return MutationEffects(set(LISTING_TAGS), {})
+    return effects(variables, result)
@@ -0,0 +1,100 @@
+"""
+Logging for the Hashnode MCP server.
+
+Diagnostics go through the standard ``logging`` module to stderr and/or a
+file, never to stdout, which the stdio transport uses for the MCP protocol.
+Records also propagate to the handlers of the host process unless
+``HASHNODE_LOG_PROPAGATE`` is off; the package's own stderr handler is then
+off by default, so records are not written to stderr twice.
+Request and response payloads are wrapped in ``Payload`` so they are only
+serialized when a record is actually emitted, and are truncated unless the
+call is sampled for a full-body dump.
+"""
+import json
+import logging
+import os
+import random
+import sys
+from typing import Any, Optional
+
+LOG_LEVEL = os.getenv("HASHNODE_LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.getenv("HASHNODE_LOG_FILE", "")
+LOG_PROPAGATE = os.getenv("HASHNODE_LOG_PROPAGATE", "true").lower() in ("1", "true", "yes")
+LOG_STDERR = os.getenv("HASHNODE_LOG_STDERR", "false" if LOG_PROPAGATE else "true").lower() in ("1", "true", "yes")
+LOG_MAX_PAYLOAD = int(os.getenv("HASHNODE_LOG_MAX_PAYLOAD", "500"))
+LOG_BODY_SAMPLE_RATE = float(os.getenv("HASHNODE_LOG_BODY_SAMPLE_RATE", "0"))
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+logger = logging.getLogger("hashnode_mcp")
+
+_configured = False
+
+
+def configure_logging() -> None:
+    """Attach the configured sinks to the package logger (only once)"""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    # Hand records on to whatever the host application configured
+    logger.propagate = LOG_PROPAGATE
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    if LOG_STDERR:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    if LOG_FILE:
+        handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a child of the package logger, e.g. ``get_logger(__name__)``"""
+    if name != logger.name and not name.startswith(logger.name + "."):
+        name = f"{logger.name}.{name}"
+    return logging.getLogger(name)
+
+
+def sample_body() -> bool:
+    """Decide whether this call should log its full payloads"""
+    return LOG_BODY_SAMPLE_RATE > 0 and random.random() < LOG_BODY_SAMPLE_RATE
+
+
+class Payload:
+    """
+    Lazily serialized, truncated log argument
+
+    ``str()`` is only called by ``logging`` when the record is emitted, so
+    wrapping a payload costs nothing when the level is disabled.
+
+    Args:
+        value: The object to log (JSON-serialized unless it is a string)
+        limit: Maximum number of characters to show; None logs everything
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: Optional[int] = LOG_MAX_PAYLOAD):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        if isinstance(self.value, str):
+            text = self.value
+        else:
+            try:
+                text = json.dumps(self.value, default=str)
+            except (TypeError, ValueError):
+                text = repr(self.value)
+        if self.limit is not None and len(text) > self.limit:
+            return f"{text[:self.limit]}... ({len(text) - self.limit} more chars)"
+        return text
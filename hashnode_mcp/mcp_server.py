@@ -1,15 +1,74 @@
 import os
 import json
+import asyncio
 import httpx
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple, Union
 from mcp.server.fastmcp import FastMCP, Context
+from hashnode_mcp.log import Payload, configure_logging, get_logger, sample_body, LOG_MAX_PAYLOAD
+from hashnode_mcp.http_client import get_client, open_client, close_client
+from hashnode_mcp.batching import QueryBatcher, BATCHING_ENABLED
+from hashnode_mcp.graphql import is_mutation, request_key
+from hashnode_mcp.singleflight import SingleFlight
+from hashnode_mcp.entities import EntityStore, ENTITY_CACHE_ENABLED
+from hashnode_mcp.invalidation import mutation_effects, response_tags
+from hashnode_mcp.retry import RetryPolicy
+from hashnode_mcp.ratelimit import AdaptiveRateLimiter
+from hashnode_mcp.export import EXPORT_CONCURRENCY, EXPORT_DIR, PublicationApi, export_path, export_publication as run_export
+from hashnode_mcp.sync import LOCAL_CURSOR_PREFIX, PostMirror, SYNC_DB, SYNC_HOSTS, SYNC_SERVE, parse_hosts, sync_loop
+from hashnode_mcp.content import CONTENT_SLICE_BYTES, ContentSlice, ContentStore, Section
+from hashnode_mcp.budget import CONTINUATION_RESERVE, bytes_left, fit_items, json_size, min_size, parse_budget, text_size
+from hashnode_mcp.output import (
+    BRIEF_PREVIEW_CHARS,
+    DEFAULT_OUTPUT,
+    LATEST_ARTICLE_KEYS,
+    SEARCH_RESULT_KEYS,
+    USER_SUMMARY_KEYS,
+    fit_post_details,
+    mutation_post,
+    output_mode,
+    post_details,
+    post_details_keys,
+    render,
+    render_error,
+    summary_levels,
+    user_details,
+    user_summary,
+)
+from hashnode_mcp.projection import normalize_fields, post_query, project_post
+from hashnode_mcp.pagination import CursorMap, PageFetchError, PageFetcher, SEARCH_PAGE_SIZE, clamp_page_size, iter_pages
+from hashnode_mcp.circuit import CircuitBreakerRegistry, CircuitOpenError, CIRCUIT_ENABLED, is_failure
+from hashnode_mcp.deadlines import (
+    DeadlineExceeded,
+    TimeoutTier,
+    operation_tier,
+    remaining,
+    request_timeout,
+    with_deadline,
+    TOOL_DEADLINE,
+    WRITE_TOOL_DEADLINE,
+    EXPORT_TOOL_DEADLINE,
+)
+from hashnode_mcp.cache import (
+    ResponseCache,
+    ViewerCache,
+    PublicationHostCache,
+    CACHE_ENABLED,
+    query_label,
+    operation_ttl,
+    parse_host_seed,
+)
 from hashnode_mcp.utils import (
     format_article_creation,
     format_article_update,
     format_search_results,
+    format_latest_articles,
+    budget_note,
+    LATEST_ARTICLE_LEVELS,
     format_post_details,
     format_user_info,
+    format_user_summary,
     format_top_articles,
     format_articles_by_tag,
     TEST_QUERY,
@@ -17,7 +76,7 @@ from hashnode_mcp.utils import (
     UPDATE_ARTICLE_MUTATION,
     SEARCH_POSTS_OF_PUBLICATION_QUERY,
     GET_PUBLICATION_ID_QUERY,
-    GET_POST_BY_ID_QUERY,
+    GET_VIEWER_PUBLICATION_QUERY,
     GET_ARTICLES_BY_USERNAME_QUERY,
     GET_USER_INFO_QUERY,
     GET_TOP_ARTICLES_QUERY,
@@ -25,12 +84,56 @@ from hashnode_mcp.utils import (
 )
 
 load_dotenv()
+configure_logging()
+logger = get_logger(__name__)
 
 HASHNODE_API_URL = os.getenv("HASHNODE_API_URL", "https://gql.hashnode.com")
-print(f"Using Hashnode API URL: {HASHNODE_API_URL}")
+logger.info("Using Hashnode API URL: %s", HASHNODE_API_URL)
+
+PRELOAD_VIEWER = os.getenv("HASHNODE_PRELOAD_VIEWER", "false").lower() in ("1", "true", "yes")
+# Publications to resolve at startup: "blog.a.com=<publication id>,blog.b.com"
+PUBLICATION_HOSTS = os.getenv("HASHNODE_PUBLICATION_HOSTS", "")
+# Most article IDs get_article_details_batch looks up in one call
+MAX_BATCH_ARTICLES = 20
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Open the shared HTTP client and the sync mirror on startup and close them on shutdown"""
+    client = await open_client()
+    if PRELOAD_VIEWER:
+        try:
+            await get_viewer_publication()
+        except Exception as e:
+            logger.warning("Could not preload the user's publication: %s", e)
+    if PUBLICATION_HOSTS:
+        await seed_publication_hosts(PUBLICATION_HOSTS)
+    
+    global post_mirror
+    sync_task = None
+    if SYNC_DB:
+        post_mirror = PostMirror(SYNC_DB)
+        sync_hosts = parse_hosts(SYNC_HOSTS)
+        if sync_hosts:
+            sync_task = asyncio.create_task(sync_loop(post_mirror, publication_api, sync_hosts))
+    try:
+        yield {"http_client": client}
+    finally:
+        if sync_task is not None:
+            sync_task.cancel()
+            try:
+                await sync_task
+            except asyncio.CancelledError:
+                pass
+        if post_mirror is not None:
+            post_mirror.close()
+            post_mirror = None
+        await close_client()
+
 
 mcp = FastMCP(
     "Hashnode API",
+    lifespan=server_lifespan,
     instructions="""
     # Hashnode API Server
     
@@ -40,10 +143,19 @@ mcp = FastMCP(
     - `test_api_connection()` - Test the connection to the Hashnode API
     - `create_article(title, body_markdown, tags="", published=False)` - Create and publish a new article on Hashnode
     - `update_article(article_id, title=None, body_markdown=None, tags=None, published=None)` - Update an existing article on Hashnode
-    - `get_latest_articles(hostname, limit=10)` - Get the latest articles from a Hashnode publication by hostname
-    - `search_articles(query, page=1)` - Search for articles on Hashnode
-    - `get_article_details(article_id)` - Get detailed information about a specific article
+    - `get_latest_articles(hostname, limit=10, cursor=None)` - Get the latest articles from a Hashnode publication by hostname
+    - `search_articles(query, page=1, per_page=5, cursor=None, mode="auto")` - Search for articles on Hashnode (mode="local" searches the full text of mirrored posts)
+    - `get_article_details(article_id, fields=None, content_format="text")` - Get detailed information about a specific article, fetching only the given fields
+    - `get_article_details_batch(article_ids, fields=None, content_format="text")` - Get detailed information about several articles in one call
+    - `get_article_content(article_id, content_format="markdown", offset=0, length=8000, section=None)` - Read the full body of an article by byte range or section (length=0 lists the sections)
     - `get_user_info(username)` - Get information about a Hashnode user
+    - `get_users_info(usernames)` - Get compact information about several Hashnode users in one call
+    - `export_publication(hostname, output_path, concurrency=5, restart=False)` - Export every post of a publication, with content, to a JSONL file
+    
+    Every tool takes `output="markdown"` (default), `output="json"` or `output="compact"`;
+    use the JSON formats when the result is processed by a program rather than read.
+    The listing and reading tools also take `budget` (bytes, or e.g. "2000 tokens") to bound
+    the size of the response; a listing cut short returns a cursor to continue from.
     
     ## When to use what
     - For testing API connection: Use `test_api_connection()`
@@ -52,7 +164,11 @@ mcp = FastMCP(
     - For getting latest articles: Use `get_latest_articles(hostname, limit)`
     - For searching articles: Use `search_articles(query, page)`
     - For getting a specific article: Use `get_article_details(article_id)` for detailed information
+    - For getting several articles at once: Use `get_article_details_batch([id1, id2, ...])` instead of one call per ID
+    - For reading a long article in full: Use `get_article_content(article_id, length=0)` to list its sections, then `get_article_content(article_id, section=N)` or follow the byte offsets (also available as `hashnode://post/{id}/markdown` resources)
     - For getting user profile information: Use `get_user_info(username)`
+    - For looking up many users (e.g. the authors of a team publication): Use `get_users_info([username1, username2, ...])`
+    - For backing up a whole publication: Use `export_publication(hostname, output_path)`; call it again to resume an interrupted export
     
     ## Example Queries
     - "Test the API connection" → Use `test_api_connection()`
@@ -66,7 +182,8 @@ mcp = FastMCP(
 )
 
 @mcp.tool()
-async def update_article(article_id: str, title: str = None, body_markdown: str = None, tags: str = None, published: bool = None) -> str:
+@with_deadline(WRITE_TOOL_DEADLINE)
+async def update_article(article_id: str, title: str = None, body_markdown: str = None, tags: str = None, published: bool = None, output: str = DEFAULT_OUTPUT) -> str:
     """
     Update an existing article on Hashnode
     
@@ -76,8 +193,12 @@ async def update_article(article_id: str, title: str = None, body_markdown: str
         body_markdown: New content in markdown format (optional)
         tags: New comma-separated list of tags (optional)
         published: Change publish status (optional)
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
     """
     try:
+        output = output_mode(output)
+        
         # Prepare the input variables
         input_vars = {
             "id": article_id
@@ -116,22 +237,24 @@ async def update_article(article_id: str, title: str = None, body_markdown: str
             "input": input_vars
         }
         
-        print(f"Updating article with ID '{article_id}'")
-        print(f"Query: {UPDATE_ARTICLE_MUTATION}")
-        print(f"Variables: {json.dumps(variables)}")
+        logger.info("Updating article with ID '%s'", article_id)
+        logger.debug("Variables: %s", Payload(variables))
         
-        data = await fetch_from_api(UPDATE_ARTICLE_MUTATION, variables)
-        print(f"Response from API: {json.dumps(data)}")
+        # Updating with the same input twice leaves the post in the same state,
+        # so this mutation is safe to retry
+        data = await fetch_from_api(UPDATE_ARTICLE_MUTATION, variables, idempotent=True)
         
         if not data or "data" not in data:
-            return f"Error: No data returned from API. Full response: {json.dumps(data)}"
+            return render_error(f"Error: No data returned from API. Full response: {json.dumps(data)}", output)
         
         if "errors" in data:
-            return f"API returned errors: {json.dumps(data['errors'])}"
+            return render_error(f"API returned errors: {json.dumps(data['errors'])}", output)
         
+        if output != "markdown":
+            return render(mutation_post(data, "updatePost"), output)
         return format_article_update(data)
     except Exception as e:
-        print(f"Error updating article: {str(e)}")
+        logger.error("Error updating article: %s", e)
         error_message = f"Error updating article with ID '{article_id}': {str(e)}"
         
         if hasattr(e, 'response') and e.response is not None:
@@ -141,60 +264,591 @@ async def update_article(article_id: str, title: str = None, body_markdown: str
             except:
                 pass
         
-        return error_message
+        return render_error(error_message, output)
 
-async def fetch_from_api(query: str, variables: dict = None) -> dict:
-    """Helper function to fetch data from Hashnode API using GraphQL"""
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Hashnode MCP Server/1.0"
-    }
+async def _send_graphql(query: str, variables: dict = None, label: Optional[str] = None) -> dict:
+    """Send one GraphQL request over the shared client, raising on HTTP errors"""
+    # Content-Type and User-Agent are set on the shared client
+    headers = {}
     
     token = os.getenv("HASHNODE_PERSONAL_ACCESS_TOKEN")
     if token:
         headers["Authorization"] = token
     
+    label = label or query_label(query)
+    tier_name, tier = operation_tier(label)
+    
+    # Fail immediately while the upstream is known to be unhealthy
+    breaker = circuit_breakers.get(label) if CIRCUIT_ENABLED else None
+    if breaker is not None:
+        breaker.before_request()
+    
+    try:
+        result = await _send_graphql_attempt(query, variables, headers, label, tier_name, tier)
+    except BaseException as e:
+        # Cancellations and client errors release a half-open probe slot
+        # without counting against the upstream
+        if breaker is not None:
+            if isinstance(e, Exception) and is_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_ignored()
+        raise
+    if breaker is not None:
+        breaker.record_success()
+    return result
+
+
+async def _send_graphql_attempt(query: str, variables: dict, headers: dict, label: str, tier_name: str, tier: TimeoutTier) -> dict:
+    """Perform one HTTP attempt of a GraphQL request"""
     request_data = {"query": query, "variables": variables}
-    print(f"Sending request to {HASHNODE_API_URL} with data: {json.dumps(request_data)}")
+    # Occasionally log complete payloads; otherwise they are truncated
+    limit = None if sample_body() else LOG_MAX_PAYLOAD
+    logger.debug("Sending request to %s with data: %s", HASHNODE_API_URL, Payload(request_data, limit))
     
-    async with httpx.AsyncClient(timeout=120.0) as client:  # Increased timeout to 120 seconds
+    # Wait for our turn instead of firing requests that will be throttled,
+    # but never past the tool's deadline
+    budget = remaining()
+    if budget is None:
+        await rate_limiter.acquire()
+    else:
         try:
-            response = await client.post(
+            await asyncio.wait_for(rate_limiter.acquire(), max(budget, 0))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"Deadline exceeded while waiting for the rate limiter before {label}")
+    
+    total, timeout = request_timeout(tier, label)
+    
+    # Reuse the pooled client so keep-alive connections survive between calls
+    client = get_client()
+    try:
+        response = await asyncio.wait_for(
+            client.post(
                 HASHNODE_API_URL,
                 json=request_data,
-                headers=headers
-            )
-            response.raise_for_status()
-            result = response.json()
-            print(f"Response: {json.dumps(result)}")
-            return result
-        except httpx.TimeoutException:
-            print("Request timed out. Consider optimizing the query or increasing the timeout.")
-            raise Exception("API request timed out after 120 seconds. The Hashnode API might be experiencing high load.")
-        except Exception as e:
-            print(f"Error in API request: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    print(f"Response content: {e.response.text}")
-                except:
-                    print("Could not get response content")
-            raise
+                headers=headers,
+                timeout=timeout
+            ),
+            total
+        )
+    except asyncio.TimeoutError:
+        raise httpx.TimeoutException(f"{label} exceeded its {total:g}s total timeout ('{tier_name}' tier)")
+    rate_limiter.on_response(response.status_code, response.headers)
+    if response.status_code in (401, 403):
+        # The token was rejected, so anything resolved for it is suspect
+        viewer_cache.invalidate(os.getenv("HASHNODE_PERSONAL_ACCESS_TOKEN"))
+    response.raise_for_status()
+    result = response.json()
+    logger.debug("Response: %s", Payload(result, limit))
+    return result
+
+
+async def _post_graphql(query: str, variables: dict = None, idempotent: Optional[bool] = None, label: Optional[str] = None) -> dict:
+    """
+    Send a single GraphQL request to the Hashnode API, retrying transient failures
+    
+    Args:
+        query: The GraphQL document
+        variables: The request variables
+        idempotent: Whether the request may be retried; defaults to True for
+            queries and False for mutations
+        label: Operation label selecting the timeout tier and circuit
+            breaker; defaults to the label of ``query`` (see query_label)
+    """
+    if idempotent is None:
+        idempotent = not is_mutation(query)
+    
+    try:
+        return await retry_policy.call(lambda: _send_graphql(query, variables, label), idempotent=idempotent)
+    except httpx.TimeoutException as e:
+        label = label or query_label(query)
+        tier_name, _ = operation_tier(label)
+        logger.warning("Request timed out (%s). Consider optimizing the query or increasing the timeout.", str(e) or e.__class__.__name__)
+        raise Exception(f"API request for {label} timed out (timeout tier '{tier_name}'). The Hashnode API might be experiencing high load.")
+    except (DeadlineExceeded, CircuitOpenError) as e:
+        logger.warning("%s", e)
+        raise
+    except Exception as e:
+        logger.error("Error in API request: %s", e)
+        if hasattr(e, 'response') and e.response is not None:
+            try:
+                logger.error("Response content: %s", Payload(e.response.text))
+            except:
+                logger.error("Could not get response content")
+        raise
+
+
+# Read queries that may be merged into one aliased request when issued together
+# (by label, so projected post lookups are batched as well)
+BATCHABLE_QUERIES = {
+    "GET_POST_BY_ID_QUERY",
+    "GET_USER_INFO_QUERY",
+    "GET_PUBLICATION_ID_QUERY",
+}
+
+retry_policy = RetryPolicy()
+circuit_breakers = CircuitBreakerRegistry()
+rate_limiter = AdaptiveRateLimiter()
+batcher = QueryBatcher(_post_graphql)
+single_flight = SingleFlight()
+response_cache = ResponseCache()
+entity_store = EntityStore()
+viewer_cache = ViewerCache()
+host_cache = PublicationHostCache()
+search_cursors = CursorMap()
+content_store = ContentStore(lambda post_id, content_format: load_post_body(post_id, content_format))
+# Local mirror of HASHNODE_SYNC_HOSTS, opened by the server lifespan when HASHNODE_SYNC_DB is set
+post_mirror: Optional[PostMirror] = None
+
+
+async def _dispatch(query: str, variables: dict = None) -> dict:
+    """Send a request, batching it with concurrent lookups where possible"""
+    if BATCHING_ENABLED and query_label(query) in BATCHABLE_QUERIES:
+        return await batcher.load(query, variables)
+    return await _post_graphql(query, variables)
+
+
+async def _fetch_and_cache(query: str, variables: dict, key: str, label: str, ttl: float) -> dict:
+    """Fetch a read query and store the response when the operation is cacheable"""
+    result = await _dispatch(query, variables)
+    tags = response_tags(query, variables, result) | {f"op:{label}"}
+    if ttl > 0:
+        response_cache.set(key, result, ttl, label, tags=tags)
+    if ENTITY_CACHE_ENABLED:
+        entity_store.write(query, variables, result, store_root=ttl > 0, tags=tags, ttl=ttl)
+    return result
+
+
+def _apply_mutation(query: str, variables: Optional[dict], result: dict) -> None:
+    """Drop everything a mutation made stale, then write its returned fields through"""
+    effects = mutation_effects(query, variables, result)
+    dropped = response_cache.invalidate(effects.tags) + entity_store.invalidate(effects.tags)
+
+    publications = {tag.split(":", 1)[1] for tag in effects.tags if tag.startswith("Publication:")}
+    if publications:
+        # Pages shifted, so the remembered cursors point at the wrong posts
+        search_cursors.invalidate(lambda key: key[0] in publications)
+    elif "op:SEARCH_POSTS_OF_PUBLICATION_QUERY" in effects.tags:
+        search_cursors.invalidate(lambda key: True)
+
+    for key, fields in effects.entities.items():
+        typename, entity_id = key.split(":", 1)
+        entity_store.evict(typename, entity_id, fields)
+        if typename == "Post" and (fields is None or "content" in fields):
+            content_store.evict(entity_id)
+        if typename == "Post" and post_mirror is not None:
+            # The mirrored copy is outdated until the next sync fetches it again
+            post_mirror.mark_dirty(entity_id)
+
+    if ENTITY_CACHE_ENABLED:
+        # Returned fields update the stored entities in place
+        entity_store.write(query, variables, result)
+    logger.debug("%s invalidated %s cached responses", query_label(query), dropped)
+
+
+async def fetch_from_api(query: str, variables: dict = None, idempotent: bool = False) -> dict:
+    """
+    Helper function to fetch data from Hashnode API using GraphQL
+    
+    Args:
+        query: The GraphQL query or mutation
+        variables: The request variables
+        idempotent: Mark a mutation as safe to retry on transient failures
+            (queries are always retried)
+    """
+    # Mutations always go upstream on their own
+    if is_mutation(query):
+        result = await _post_graphql(query, variables, idempotent=idempotent)
+        _apply_mutation(query, variables, result)
+        return result
+
+    key = request_key(query, variables)
+    label = query_label(query)
+    ttl = operation_ttl(label) if CACHE_ENABLED else 0
+    if ttl > 0:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+        if ENTITY_CACHE_ENABLED:
+            # Every selected field may already be known from other responses
+            cached = entity_store.read(query, variables, max_age=ttl)
+            if cached is not None:
+                return cached
+
+    # Identical concurrent reads share a single in-flight request
+    try:
+        return await single_flight.do(key, lambda: _fetch_and_cache(query, variables, key, label, ttl))
+    except CircuitOpenError:
+        # Serve whatever we still have cached, even if expired, while the upstream is down
+        if ttl > 0:
+            stale = response_cache.get(key, allow_stale=True)
+            if stale is not None:
+                logger.warning("Serving cached %s response while the circuit is open", label)
+                return stale
+        raise
+
+
+async def fetch_uncached(query: str, variables: dict = None) -> dict:
+    """
+    Fetch a read query without reading or filling the caches
+    
+    For bulk reads of full posts (the content store, exports, the mirror
+    sync): their bodies would crowd everything else out of the response and
+    entity caches, and a copy read from a cache may be older than wanted.
+    Also for lookups kept in a cache of their own (publication hostnames).
+    Identical concurrent requests are still shared.
+    
+    Args:
+        query: The GraphQL query
+        variables: The request variables
+    """
+    return await single_flight.do(request_key(query, variables), lambda: _dispatch(query, variables))
+
+
+async def resolve_publication(hostname: str) -> Optional[Dict[str, Any]]:
+    """
+    Resolve a publication hostname to its ID and title
+    
+    Resolutions, including unknown hostnames, are kept in the host cache
+    only; the response cache is bypassed so an unknown host is looked up
+    again once its shorter negative TTL has passed. Publications seeded by
+    ID (HASHNODE_PUBLICATION_HOSTS) get their title on first use.
+    
+    Args:
+        hostname: The hostname of the publication (e.g., "blog.example.com")
+        
+    Returns:
+        A dict with the publication "id" and "title", or None if the host is
+        unknown. The title of a seeded publication is None while it cannot
+        be looked up.
+    """
+    found, seeded = host_cache.lookup(hostname)
+    if found and (seeded is None or seeded["title"] is not None):
+        return seeded
+    
+    logger.info("Getting publication ID for hostname '%s'", hostname)
+    publication_data = await fetch_uncached(GET_PUBLICATION_ID_QUERY, {"host": hostname})
+    
+    if not publication_data or publication_data.get("errors") or not publication_data.get("data"):
+        # Do not cache failures that might be transient
+        return seeded
+    
+    publication = publication_data["data"].get("publication")
+    if not publication or "id" not in publication:
+        if seeded:
+            # Trust the configured ID over a lookup that found nothing
+            return seeded
+        host_cache.set(hostname, None)
+        return None
+    
+    host_cache.set(hostname, publication)
+    return {"id": publication["id"], "title": publication.get("title")}
+
+
+async def seed_publication_hosts(seed: str) -> None:
+    """
+    Seed the host cache from a list such as "blog.a.com=<publication id>,blog.b.com"
+    
+    Entries with an ID are stored directly; bare hostnames are resolved concurrently.
+    """
+    known, unresolved = parse_host_seed(seed)
+    for hostname, publication in known.items():
+        host_cache.set(hostname, publication)
+    
+    results = await asyncio.gather(*(resolve_publication(host) for host in unresolved), return_exceptions=True)
+    for hostname, result in zip(unresolved, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not resolve publication '%s': %s", hostname, result)
+
+
+async def fetch_search_page(publication_id: str, query: str, page: int, per_page: int, after: Optional[str] = None) -> dict:
+    """
+    Fetch one page of a publication search using real Hashnode cursors
+    
+    The cursor after every page seen is kept in the cursor map, so page N
+    costs a single request once page N-1 has been fetched. Otherwise the
+    pages in between are walked from the nearest known cursor.
+    
+    Args:
+        publication_id: The publication to search
+        query: The search term
+        page: The 1-based page number (ignored when ``after`` is given)
+        per_page: Number of results per page
+        after: Explicit cursor to fetch the page after; the cursor after the
+            fetched page is only remembered when ``after`` is a known page
+            boundary, since the page number is unknown otherwise
+        
+    Returns:
+        The GraphQL response for the requested page
+    """
+    listing = (publication_id, query, per_page)
+    
+    def variables(cursor: Optional[str]) -> dict:
+        return {
+            "first": per_page,
+            "after": cursor,
+            "filter": {
+                "publicationId": publication_id,
+                "query": query
+            }
+        }
+    
+    start = page
+    if after is not None:
+        # Only a cursor seen at a page boundary tells which page follows it;
+        # others (e.g. from a listing cut short by its budget) start mid-page
+        previous = search_cursors.page_before(listing, after)
+        page = previous + 1 if previous is not None else None
+    elif page > 1:
+        start, after = search_cursors.nearest(listing, page)
+        
+        # Walk forward from the nearest page whose cursor is known
+        for walk_page in range(start, page):
+            data = await fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, variables(after))
+            if not data or data.get("errors") or not data.get("data"):
+                return data
+            page_info = (data["data"].get("searchPostsOfPublication") or {}).get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                # The requested page is past the end of the results
+                return {"data": {"searchPostsOfPublication": {"edges": [], "pageInfo": {"hasNextPage": False}}}}
+            after = page_info["endCursor"]
+            search_cursors.set(listing, walk_page, after)
+    
+    data = await fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, variables(after))
+    if data and not data.get("errors") and data.get("data"):
+        page_info = (data["data"].get("searchPostsOfPublication") or {}).get("pageInfo") or {}
+        if page_info.get("endCursor") and page is not None:
+            search_cursors.set(listing, page, page_info["endCursor"])
+    return data
+
+
+def latest_articles_fetcher(publication_id: str) -> PageFetcher:
+    """
+    Build the page fetcher used by ``iter_pages`` to list a publication's posts
+    
+    Args:
+        publication_id: The publication to list, newest posts first
+    """
+    async def fetch_page(first: int, after: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        data = await fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, {
+            "first": first,
+            "after": after,
+            "filter": {
+                "publicationId": publication_id,
+                "query": ""  # Empty query to get all articles
+            }
+        })
+        if not data or "errors" in data or not data.get("data"):
+            raise PageFetchError("Could not fetch a page of articles", data)
+        
+        connection = data["data"].get("searchPostsOfPublication") or {}
+        page_info = connection.get("pageInfo") or {}
+        cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+        return connection.get("edges") or [], cursor
+    
+    return fetch_page
+
+
+# The API calls of exports and mirror syncs
+publication_api = PublicationApi(resolve=resolve_publication, list_posts=latest_articles_fetcher, fetch=fetch_uncached)
+
+
+def post_response_error(article_id: str, article_data: dict) -> Optional[str]:
+    """
+    Check a post lookup response
+    
+    Args:
+        article_id: The ID that was requested
+        article_data: The GraphQL response for it
+        
+    Returns:
+        The error message returned by the tools, or None if the post was found
+    """
+    if not article_data or "data" not in article_data:
+        return f"Error: No data returned from API. Full response: {json.dumps(article_data)}"
+    
+    if "errors" in article_data:
+        return f"API returned errors: {json.dumps(article_data['errors'])}"
+    
+    if "post" not in article_data["data"] or not article_data["data"]["post"]:
+        return f"No article found with ID '{article_id}'"
+    
+    return None
+
+
+async def load_post_body(post_id: str, content_format: str) -> Optional[str]:
+    """
+    Fetch the body of a post in one format for the content store
+    
+    The response and entity caches are bypassed: the store keeps the body
+    compressed, and a second uncompressed copy would defeat that.
+    
+    Returns:
+        The body, or None if there is no such post
+    """
+    mirrored = post_mirror.post(post_id) if post_mirror is not None and SYNC_SERVE else None
+    if mirrored and (mirrored.get("content") or {}).get(content_format) is not None:
+        return mirrored["content"][content_format]
+    
+    query = post_query(("id", "content"), content_format)
+    variables = {"id": post_id}
+    logger.info("Fetching the %s body of article '%s'", content_format, post_id)
+    data = await fetch_uncached(query, variables)
+    if not data or data.get("errors"):
+        raise ValueError(f"API returned errors: {json.dumps((data or {}).get('errors'))}")
+    post = (data.get("data") or {}).get("post")
+    if not post:
+        return None
+    return (post.get("content") or {}).get(content_format) or ""
+
+
+def describe_content_slice(article_id: str, content_format: str, piece: ContentSlice) -> str:
+    """Render a slice of a body with its position, for the get_article_content tool"""
+    if piece.section is not None:
+        title = piece.section.title or "(before the first heading)"
+        result = f"# {title}\n\nBytes {piece.start}-{piece.end} of {piece.size}\n\n"
+    else:
+        result = f"# Article {article_id} ({content_format})\n\nBytes {piece.start}-{piece.end} of {piece.size}\n\n"
+    result += piece.text
+    if piece.section is None and piece.end < piece.size:
+        result += f"\n\n(More content available: continue with offset={piece.end})"
+    return result
+
+
+def describe_sections(article_id: str, content_format: str, sections: List[Section], size: int) -> str:
+    """Render the section index of a body"""
+    result = f"# Sections of article {article_id} ({content_format}, {size} bytes)\n\n"
+    for index, section in enumerate(sections):
+        indent = "  " * max(0, section.level - 1)
+        title = section.title or "(before the first heading)"
+        result += f"{index}. {indent}{title} (bytes {section.start}-{section.end})\n"
+    return result
+
+
+def describe_search_page(search_data: dict, page: int, cursor: Optional[str], output: str = "markdown", limit: Optional[int] = None) -> str:
+    """
+    Turn a page of search results into the text returned by search_articles
+    
+    Args:
+        search_data: A searchPostsOfPublication response
+        page: The 1-based page number that was requested
+        cursor: The cursor the page was requested with, if any
+        output: "markdown", "json" or "compact"
+        limit: Output budget in bytes; posts that do not fit are left for the
+            next call, which continues from the returned end cursor
+    """
+    connection = (search_data.get("data") or {}).get("searchPostsOfPublication") or {}
+    page_info = connection.get("pageInfo") or {}
+    next_page = page + 1 if page_info.get("hasNextPage") and not cursor else None
+    if output != "markdown":
+        edges = [edge for edge in connection.get("edges") or [] if edge.get("node")]
+        fitted = fit_items(edges, summary_levels(SEARCH_RESULT_KEYS), bytes_left(limit, CONTINUATION_RESERVE), json_size)
+        if not fitted.complete:
+            # Continue right after the last post shown
+            page_info = {"hasNextPage": True, "endCursor": edges[len(fitted.items) - 1].get("cursor")}
+            next_page = None
+        return render({
+            "items": fitted.items,
+            "hasNextPage": bool(page_info.get("hasNextPage")),
+            "endCursor": page_info.get("endCursor") if page_info.get("hasNextPage") else None,
+            "nextPage": next_page,
+        }, output, {"items": SEARCH_RESULT_KEYS})
+    
+    return format_search_results(search_data, limit, next_page)
+
+
+def search_mirror(query: str, publication_id: Optional[str], page: int, per_page: int, cursor: Optional[str] = None, output: str = "markdown", limit: Optional[int] = None) -> str:
+    """
+    Search the full-text index of the local mirror
+    
+    Args:
+        query: Words to find; "quoted words" match as a phrase and word* as a prefix
+        publication_id: Only search this publication; None searches every mirrored one
+        page: The 1-based page number (ignored when ``cursor`` is given)
+        per_page: Number of results per page
+        cursor: A "local:<offset>" end cursor returned with the previous page
+        output: "markdown", "json" or "compact"
+        limit: Output budget in bytes
+    """
+    if cursor and cursor.startswith(LOCAL_CURSOR_PREFIX):
+        offset = int(cursor[len(LOCAL_CURSOR_PREFIX):])
+    else:
+        offset = (max(1, page) - 1) * per_page
+    
+    search_data = post_mirror.search(query, publication_id, limit=per_page, offset=offset)
+    logger.debug("Searched the local index for '%s' (offset %s)", query, offset)
+    return describe_search_page(search_data, page, cursor, output, limit)
+
+
+def is_viewer_error(errors: list) -> bool:
+    """Check whether GraphQL errors point to a stale token or publication"""
+    for error in errors or []:
+        code = str((error.get("extensions") or {}).get("code", "")).upper()
+        message = str(error.get("message", "")).lower()
+        if code in ("UNAUTHENTICATED", "FORBIDDEN", "NOT_FOUND"):
+            return True
+        if any(marker in message for marker in ("not found", "unauthorized", "not authorized", "unauthenticated")):
+            return True
+    return False
+
+
+async def get_viewer_publication(refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get the first publication of the authenticated user
+    
+    The publication is kept in the viewer cache per access token, so the API
+    is only queried on the first call, after the TTL expires or on refresh.
+    
+    Args:
+        refresh: Drop the cached publication and look it up again
+        
+    Returns:
+        A dict with the publication "id" and "title", or None if none was found
+    """
+    token = os.getenv("HASHNODE_PERSONAL_ACCESS_TOKEN")
+    if refresh:
+        viewer_cache.invalidate(token)
+    else:
+        publication = viewer_cache.get(token)
+        if publication:
+            return publication
+    
+    logger.info("Getting user's publications (limited to first publication)")
+    user_data = await fetch_from_api(GET_VIEWER_PUBLICATION_QUERY)
+    
+    me = ((user_data or {}).get("data") or {}).get("me") or {}
+    edges = (me.get("publications") or {}).get("edges") or []
+    if not edges or not edges[0].get("node"):
+        return None
+    
+    publication = edges[0]["node"]
+    viewer_cache.set(token, publication)
+    return {"id": publication["id"], "title": publication.get("title")}
 
 
 @mcp.tool()
-async def test_api_connection() -> str:
+@with_deadline(TOOL_DEADLINE)
+async def test_api_connection(output: str = DEFAULT_OUTPUT) -> str:
     """
     Test the connection to the Hashnode API
+    
+    Args:
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
     """
     try:
+        output = output_mode(output)
         data = await fetch_from_api(TEST_QUERY)
+        if output != "markdown":
+            return render({"ok": True, "response": data}, output)
         return f"API connection successful! Response: {json.dumps(data)}"
     except Exception as e:
-        return f"API connection failed: {str(e)}"
+        return render_error(f"API connection failed: {str(e)}", output)
 
 
 @mcp.tool()
-async def create_article(title: str, body_markdown: str, tags: str = "", published: bool = False) -> str:
+@with_deadline(WRITE_TOOL_DEADLINE)
+async def create_article(title: str, body_markdown: str, tags: str = "", published: bool = False, output: str = DEFAULT_OUTPUT) -> str:
     """
     Create and publish a new article on Hashnode
     
@@ -203,41 +857,21 @@ async def create_article(title: str, body_markdown: str, tags: str = "", publish
         body_markdown: The content of the article in markdown format
         tags: Comma-separated list of tags (e.g., "python,tutorial,webdev")
         published: Whether to publish immediately (True) or save as draft (False)
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
     """
     try:
-        print(f"Starting article creation process for '{title}'")
-        
-        # Optimized query that combines getting publication info and creating article
-        # First, we need to get the user's publications
-        user_query = """
-        query {
-          me {
-            publications(first: 1) {
-              edges {
-                node {
-                  id
-                  title
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        print("Getting user's publications (limited to first publication)")
-        user_data = await fetch_from_api(user_query)
+        output = output_mode(output)
+        logger.info("Starting article creation process for '%s'", title)
         
-        if not user_data or "data" not in user_data or not user_data["data"] or "me" not in user_data["data"] or not user_data["data"]["me"] or "publications" not in user_data["data"]["me"] or not user_data["data"]["me"]["publications"] or "edges" not in user_data["data"]["me"]["publications"] or not user_data["data"]["me"]["publications"]["edges"]:
-            return "Could not find user's publications. Please make sure you have a publication set up on Hashnode."
+        # The user's publication is resolved once and then served from the viewer cache
+        publication = await get_viewer_publication()
+        if not publication:
+            return render_error("Could not find user's publications. Please make sure you have a publication set up on Hashnode.", output)
         
-        # Use the first publication in the list
-        if len(user_data["data"]["me"]["publications"]["edges"]) == 0:
-            return "No publications found for the user. Please create a publication on Hashnode first."
-        
-        publication = user_data["data"]["me"]["publications"]["edges"][0]["node"]
         publication_id = publication["id"]
         publication_title = publication["title"]
-        print(f"Found publication: {publication_title} (ID: {publication_id})")
+        logger.debug("Found publication: %s (ID: %s)", publication_title, publication_id)
         
         # Prepare the input variables
         input_vars = {
@@ -271,25 +905,35 @@ async def create_article(title: str, body_markdown: str, tags: str = "", publish
             if tag_list:
                 variables["input"]["tags"] = tag_list
         
-        print(f"Creating article with title '{title}'")
-        print(f"Variables: {json.dumps(variables)}")
+        logger.info("Creating article with title '%s'", title)
+        logger.debug("Variables: %s", Payload(variables))
         
         try:
             data = await fetch_from_api(CREATE_ARTICLE_MUTATION, variables)
             
+            if data and is_viewer_error(data.get("errors")):
+                # The cached publication may be stale, so look it up again and
+                # retry once if it changed (the failed call created nothing)
+                refreshed = await get_viewer_publication(refresh=True)
+                if refreshed and refreshed["id"] != publication_id:
+                    variables["input"]["publicationId"] = refreshed["id"]
+                    data = await fetch_from_api(CREATE_ARTICLE_MUTATION, variables)
+            
             if not data or "data" not in data:
-                return f"Error: No data returned from API. Full response: {json.dumps(data)}"
+                return render_error(f"Error: No data returned from API. Full response: {json.dumps(data)}", output)
             
             if "errors" in data:
-                return f"API returned errors: {json.dumps(data['errors'])}"
+                return render_error(f"API returned errors: {json.dumps(data['errors'])}", output)
             
+            if output != "markdown":
+                return render(mutation_post(data, "publishPost"), output)
             return format_article_creation(data)
         except Exception as e:
             if "timeout" in str(e).lower():
-                return f"The article creation request timed out, but the article might still have been created. Please check your Hashnode dashboard. Error details: {str(e)}"
+                return render_error(f"The article creation request timed out, but the article might still have been created. Please check your Hashnode dashboard. Error details: {str(e)}", output)
             raise
     except Exception as e:
-        print(f"Error creating article: {str(e)}")
+        logger.error("Error creating article: %s", e)
         error_message = f"Error creating article '{title}': {str(e)}"
         
         if hasattr(e, 'response') and e.response is not None:
@@ -299,88 +943,86 @@ async def create_article(title: str, body_markdown: str, tags: str = "", publish
             except:
                 pass
         
-        return error_message
+        return render_error(error_message, output)
 
 
 @mcp.tool()
-async def search_articles(query: str, page: int = 1) -> str:
+@with_deadline(TOOL_DEADLINE)
+async def search_articles(query: str, page: int = 1, per_page: int = SEARCH_PAGE_SIZE, cursor: str = None, mode: str = "auto", output: str = DEFAULT_OUTPUT, budget: Optional[Union[int, str]] = None) -> str:
     """
     Search for articles on Hashnode
     
     Args:
         query: Search term to find articles
         page: Page number for pagination (default: 1)
+        per_page: Number of results per page (default: 5, maximum: 20)
+        cursor: End cursor returned with the previous page; takes precedence over page
+        mode: "remote" searches through the Hashnode API, "local" searches the full text
+            of every locally mirrored post, "auto" (default) uses the local index when
+            your publication is mirrored and the API otherwise
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+        budget: Maximum size of the response, as a number of bytes or e.g.
+            "2000 tokens"; 0 for no limit (default: HASHNODE_OUTPUT_BUDGET)
+            Results that do not fit are left for the next call, which
+            continues from the returned end cursor
     """
     try:
-        print(f"Starting article search for query '{query}', page {page}")
-        
-        # Optimized query that gets only the first publication
-        user_query = """
-        query {
-          me {
-            publications(first: 1) {
-              edges {
-                node {
-                  id
-                  title
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        print("Getting user's publications for search (limited to first publication)")
-        user_data = await fetch_from_api(user_query)
-        
-        if not user_data or "data" not in user_data or not user_data["data"] or "me" not in user_data["data"] or not user_data["data"]["me"] or "publications" not in user_data["data"]["me"] or not user_data["data"]["me"]["publications"] or "edges" not in user_data["data"]["me"]["publications"] or not user_data["data"]["me"]["publications"]["edges"]:
-            return "Could not find user's publications. Please make sure you have a publication set up on Hashnode."
+        output = output_mode(output)
+        limit = parse_budget(budget)
+        logger.info("Starting article search for query '%s', page %s", query, page)
+        per_page = clamp_page_size(per_page)
+        mode = mode.lower()
+        if mode not in ("auto", "local", "remote"):
+            return render_error(f"Unknown search mode '{mode}'. Use 'auto', 'local' or 'remote'.", output)
+        
+        if mode == "local":
+            if post_mirror is None:
+                return render_error("The local search index is not available. Set HASHNODE_SYNC_DB and HASHNODE_SYNC_HOSTS to mirror publications.", output)
+            return search_mirror(query, None, page, per_page, cursor, output, limit)
+        
+        # The user's publication is resolved once and then served from the viewer cache
+        publication = await get_viewer_publication()
+        if not publication:
+            return render_error("Could not find user's publications. Please make sure you have a publication set up on Hashnode.", output)
         
-        # Use the first publication in the list
-        if len(user_data["data"]["me"]["publications"]["edges"]) == 0:
-            return "No publications found for the user. Please create a publication on Hashnode first."
-        
-        publication = user_data["data"]["me"]["publications"]["edges"][0]["node"]
         publication_id = publication["id"]
         publication_title = publication["title"]
-        print(f"Found publication: {publication_title} (ID: {publication_id})")
-        
-        # Calculate pagination parameters - limit to 5 results per page to reduce response size
-        per_page = 5  # Reduced number of results per page
-        first = per_page
-        after = None
-        if page > 1:
-            after = f"offset_{(page-1)*per_page}"
-        
-        # Search for posts in this publication
-        search_variables = {
-            "first": first,
-            "after": after,
-            "filter": {
-                "publicationId": publication_id,
-                "query": query  # The search query
-            }
-        }
-        
-        print(f"Searching for articles with query '{query}' in publication '{publication_title}'")
+        logger.debug("Found publication: %s (ID: %s)", publication_title, publication_id)
+        
+        if (
+            mode == "auto"
+            and post_mirror is not None
+            and SYNC_SERVE
+            and (cursor is None or cursor.startswith(LOCAL_CURSOR_PREFIX))
+            and post_mirror.is_synced(publication_id)
+        ):
+            return search_mirror(query, publication_id, page, per_page, cursor, output, limit)
+        logger.debug("Searching for articles with query '%s' in publication '%s'", query, publication_title)
         
         try:
-            search_data = await fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, search_variables)
+            search_data = await fetch_search_page(publication_id, query, page, per_page, cursor)
+            
+            if search_data and is_viewer_error(search_data.get("errors")):
+                # The cached publication may be stale, so look it up again and retry once
+                refreshed = await get_viewer_publication(refresh=True)
+                if refreshed and refreshed["id"] != publication_id:
+                    search_data = await fetch_search_page(refreshed["id"], query, page, per_page, cursor)
             
             if not search_data or "data" not in search_data:
-                return f"Error: No data returned from API. Full response: {json.dumps(search_data)}"
+                return render_error(f"Error: No data returned from API. Full response: {json.dumps(search_data)}", output)
             
             if "errors" in search_data:
-                return f"API returned errors: {json.dumps(search_data['errors'])}"
+                return render_error(f"API returned errors: {json.dumps(search_data['errors'])}", output)
             
             # Format the search results
-            return format_search_results(search_data)
+            return describe_search_page(search_data, page, cursor, output, limit)
         except Exception as e:
             if "timeout" in str(e).lower():
-                return f"The search request timed out. Try a more specific search query or try again later. Error details: {str(e)}"
+                return render_error(f"The search request timed out. Try a more specific search query or try again later. Error details: {str(e)}", output)
             raise
     except Exception as e:
-        print(f"Error searching articles: {str(e)}")
+        logger.error("Error searching articles: %s", e)
         error_message = f"Error searching for articles with query '{query}': {str(e)}"
         
         if hasattr(e, 'response') and e.response is not None:
@@ -390,39 +1032,55 @@ async def search_articles(query: str, page: int = 1) -> str:
             except:
                 pass
         
-        return error_message
+        return render_error(error_message, output)
 
 
 @mcp.tool()
-async def get_article_details(article_id: str) -> str:
+@with_deadline(TOOL_DEADLINE)
+async def get_article_details(article_id: str, fields: Optional[List[str]] = None, content_format: str = "text", output: str = DEFAULT_OUTPUT, budget: Optional[Union[int, str]] = None) -> str:
     """
     Get detailed information about a specific article
     
     Args:
         article_id: The ID of the article to retrieve
+        fields: Post fields to fetch and show, e.g. ["title", "author", "content"]
+            (default: every field shown in the details)
+        content_format: Which form of the body to fetch: "text", "markdown",
+            "html", or "none" to skip the body
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+        budget: Maximum size of the response, as a number of bytes or e.g.
+            "2000 tokens"; 0 for no limit (default: HASHNODE_OUTPUT_BUDGET)
+            The body is cut to what the other fields leave of it
     """
     try:
+        output = output_mode(output)
+        limit = parse_budget(budget)
         variables = {
             "id": article_id  # Hashnode API expects string IDs
         }
         
-        print(f"Getting detailed article information with ID '{article_id}'")
-        article_data = await fetch_from_api(GET_POST_BY_ID_QUERY, variables)
-        print(f"Article data response: {json.dumps(article_data)}")
+        # Only fetch what is shown, and only one copy of the body
+        fields, content_format = normalize_fields(fields, content_format)
         
-        if not article_data or "data" not in article_data:
-            return f"Error: No data returned from API. Full response: {json.dumps(article_data)}"
+        mirrored = post_mirror.post(article_id) if post_mirror is not None and SYNC_SERVE else None
+        if mirrored:
+            article_data = {"data": {"post": project_post(mirrored, fields, content_format)}}
+        else:
+            logger.info("Getting detailed article information with ID '%s'", article_id)
+            article_data = await fetch_from_api(post_query(fields, content_format), variables)
         
-        if "errors" in article_data:
-            return f"API returned errors: {json.dumps(article_data['errors'])}"
+        error = post_response_error(article_id, article_data)
+        if error:
+            return render_error(error, output)
         
-        if "post" not in article_data["data"] or not article_data["data"]["post"]:
-            return f"No article found with ID '{article_id}'"
+        if output != "markdown":
+            return render({"post": fit_post_details(article_data["data"]["post"], fields, content_format, bytes_left(limit, CONTINUATION_RESERVE))}, output)
         
         # Format the post details
-        return format_post_details(article_data)
+        return format_post_details(article_data, limit)
     except Exception as e:
-        print(f"Error getting article details: {str(e)}")
+        logger.error("Error getting article details: %s", e)
         error_message = f"Error getting article details with ID '{article_id}': {str(e)}"
         
         if hasattr(e, 'response') and e.response is not None:
@@ -432,39 +1090,208 @@ async def get_article_details(article_id: str) -> str:
             except:
                 pass
         
-        return error_message
+        return render_error(error_message, output)
 
 
 @mcp.tool()
-async def get_user_info(username: str) -> str:
+@with_deadline(TOOL_DEADLINE)
+async def get_article_details_batch(article_ids: List[str], fields: Optional[List[str]] = None, content_format: str = "text", output: str = DEFAULT_OUTPUT, budget: Optional[Union[int, str]] = None) -> str:
+    """
+    Get detailed information about several articles in one call
+    
+    Args:
+        article_ids: The IDs of the articles to retrieve (at most 20); results keep this order
+        fields: Post fields to fetch and show (default: every field shown in the details)
+        content_format: Which form of the body to fetch: "text", "markdown",
+            "html", or "none" to skip the body
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+        budget: Maximum size of the response, as a number of bytes or e.g.
+            "2000 tokens"; 0 for no limit (default: HASHNODE_OUTPUT_BUDGET)
+            Every article gets an equal share for its body; articles that do
+            not fit are listed so they can be requested again
+    """
+    try:
+        output = output_mode(output)
+        limit = parse_budget(budget)
+        if len(article_ids) > MAX_BATCH_ARTICLES:
+            return render_error(f"Too many article IDs ({len(article_ids)}). Request at most {MAX_BATCH_ARTICLES} per call.", output)
+        fields, content_format = normalize_fields(fields, content_format)
+        query = post_query(fields, content_format)
+        
+        # Look every distinct ID up once; the batcher packs concurrent lookups
+        # into as few aliased requests as the complexity limit allows
+        unique_ids = list(dict.fromkeys(article_ids))
+        logger.info("Getting detailed article information for %s IDs", len(unique_ids))
+        responses = dict(zip(unique_ids, await asyncio.gather(
+            *(fetch_from_api(query, {"id": article_id}) for article_id in unique_ids),
+            return_exceptions=True,
+        )))
+        
+        result = f"# Article Details ({len(article_ids)} requested)\n\n"
+        available = bytes_left(limit, text_size(result) + CONTINUATION_RESERVE)
+        share = None if available is None else available // max(1, len(article_ids))
+        
+        # Rendered lazily, so nothing is rendered past the budget
+        details = {}
+        
+        def describe(article_id: str) -> Any:
+            if article_id in details:
+                return details[article_id]
+            response = responses[article_id]
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                error = f"Error getting article details with ID '{article_id}': {str(response)}"
+            else:
+                error = post_response_error(article_id, response)
+            
+            if output != "markdown":
+                post = None if error else response["data"]["post"]
+                details[article_id] = {**fit_post_details(post, fields, content_format, share), "id": article_id, "error": error}
+            elif error:
+                details[article_id] = f"# Article {article_id}\n\n{error}\n"
+            else:
+                details[article_id] = format_post_details(response, share)
+            return details[article_id]
+        
+        if output != "markdown":
+            fitted = fit_items(article_ids, (describe,), available, json_size)
+            return render({"posts": fitted.items, "omitted": article_ids[len(fitted.items):]}, output, {"posts": post_details_keys(fields)})
+        
+        separator = "\n---\n\n"
+        fitted = fit_items(article_ids, (describe,), available, lambda text: text_size(text) + len(separator))
+        result += separator.join(fitted.items)
+        if not fitted.complete:
+            omitted = article_ids[len(fitted.items):]
+            result += budget_note(len(fitted.items), len(article_ids), "articles", f"Not shown: {', '.join(omitted)}.")
+        return result
+    except Exception as e:
+        logger.error("Error getting article details: %s", e)
+        return render_error(f"Error getting article details: {str(e)}", output)
+
+
+@mcp.tool()
+@with_deadline(TOOL_DEADLINE)
+async def get_article_content(article_id: str, content_format: str = "markdown", offset: int = 0, length: int = CONTENT_SLICE_BYTES, section: Optional[int] = None, output: str = DEFAULT_OUTPUT, budget: Optional[Union[int, str]] = None) -> str:
+    """
+    Read the body of an article piece by piece
+    
+    The body is fetched once and kept, so reading further slices is cheap.
+    
+    Args:
+        article_id: The ID of the article
+        content_format: "markdown", "html" or "text"
+        offset: Byte offset to start reading at
+        length: Number of bytes to read
+        section: Read this section (by index, see the section list returned
+            with length=0) instead of a byte range
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+        budget: Maximum size of the response, as a number of bytes or e.g.
+            "2000 tokens"; 0 for no limit (default: HASHNODE_OUTPUT_BUDGET)
+            A byte range or section longer than the budget is shortened to fit
+    """
+    try:
+        output = output_mode(output)
+        limit = parse_budget(budget)
+        # Bytes of the body that fit in the budget next to the position lines
+        fits = None if limit is None else max(1, limit - CONTINUATION_RESERVE)
+        if section is not None:
+            piece = await content_store.read_section(article_id, content_format, section)
+            if fits is not None and piece.end - piece.start > fits:
+                # Read the start of the section as a byte range, which continues by offset
+                piece = await content_store.read(article_id, content_format, piece.start, fits)
+        elif length <= 0:
+            sections, size = await content_store.sections(article_id, content_format)
+            if output != "markdown":
+                return render({
+                    "id": article_id,
+                    "format": content_format,
+                    "size": size,
+                    "sections": [section._asdict() for section in sections],
+                }, output)
+            return describe_sections(article_id, content_format, sections, size)
+        else:
+            piece = await content_store.read(article_id, content_format, offset, length if fits is None else min(length, fits))
+        
+        if output != "markdown":
+            return render({
+                "id": article_id,
+                "format": content_format,
+                "start": piece.start,
+                "end": piece.end,
+                "size": piece.size,
+                "section": piece.section._asdict() if piece.section else None,
+                "text": piece.text,
+            }, output)
+        return describe_content_slice(article_id, content_format, piece)
+    except Exception as e:
+        logger.error("Error reading article content: %s", e)
+        return render_error(f"Error reading the content of article '{article_id}': {str(e)}", output)
+
+
+@mcp.resource("hashnode://post/{post_id}/{content_format}")
+async def post_body(post_id: str, content_format: str) -> str:
+    """The whole body of a post, in "markdown", "html" or "text" format"""
+    return (await content_store.read(post_id, content_format)).text
+
+
+@mcp.resource("hashnode://post/{post_id}/{content_format}/bytes/{offset}/{length}")
+async def post_body_bytes(post_id: str, content_format: str, offset: str, length: str) -> str:
+    """A byte range of the body of a post, cut at UTF-8 character boundaries"""
+    return (await content_store.read(post_id, content_format, int(offset), int(length))).text
+
+
+@mcp.resource("hashnode://post/{post_id}/{content_format}/sections")
+async def post_sections(post_id: str, content_format: str) -> str:
+    """The headings of the body of a post, with the index and byte range of each section"""
+    sections, size = await content_store.sections(post_id, content_format)
+    return describe_sections(post_id, content_format, sections, size)
+
+
+@mcp.resource("hashnode://post/{post_id}/{content_format}/sections/{index}")
+async def post_section(post_id: str, content_format: str, index: str) -> str:
+    """One section of the body of a post: a heading and everything under it"""
+    return (await content_store.read_section(post_id, content_format, int(index))).text
+
+
+@mcp.tool()
+@with_deadline(TOOL_DEADLINE)
+async def get_user_info(username: str, output: str = DEFAULT_OUTPUT) -> str:
     """
     Get information about a Hashnode user
     
     Args:
         username: The username of the user
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
     """
     try:
+        output = output_mode(output)
         variables = {
             "username": username
         }
         
-        print(f"Getting user information for username '{username}'")
+        logger.info("Getting user information for username '%s'", username)
         user_info_data = await fetch_from_api(GET_USER_INFO_QUERY, variables)
-        print(f"User info data response: {json.dumps(user_info_data)}")
         
         if not user_info_data or "data" not in user_info_data:
-            return f"Error: No data returned from API. Full response: {json.dumps(user_info_data)}"
+            return render_error(f"Error: No data returned from API. Full response: {json.dumps(user_info_data)}", output)
         
         if "errors" in user_info_data:
-            return f"API returned errors: {json.dumps(user_info_data['errors'])}"
+            return render_error(f"API returned errors: {json.dumps(user_info_data['errors'])}", output)
         
         if "user" not in user_info_data["data"] or not user_info_data["data"]["user"]:
-            return f"No user found with username '{username}'"
+            return render_error(f"No user found with username '{username}'", output)
+        
+        if output != "markdown":
+            return render({"user": user_details(user_info_data["data"]["user"])}, output)
         
         # Format the user information
         return format_user_info(user_info_data)
     except Exception as e:
-        print(f"Error getting user info: {str(e)}")
+        logger.error("Error getting user info: %s", e)
         error_message = f"Error getting user information for username '{username}': {str(e)}"
         
         if hasattr(e, 'response') and e.response is not None:
@@ -474,11 +1301,85 @@ async def get_user_info(username: str) -> str:
             except:
                 pass
         
-        return error_message
+        return render_error(error_message, output)
+
+
+@mcp.tool()
+@with_deadline(TOOL_DEADLINE)
+async def get_users_info(usernames: List[str], output: str = DEFAULT_OUTPUT, budget: Optional[Union[int, str]] = None) -> str:
+    """
+    Get compact information about several Hashnode users in one call
+    
+    Args:
+        usernames: The usernames of the users; repeated names are looked up once
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+        budget: Maximum size of the response, as a number of bytes or e.g.
+            "2000 tokens"; 0 for no limit (default: HASHNODE_OUTPUT_BUDGET)
+            Users that do not fit are listed so they can be requested again
+    """
+    try:
+        output = output_mode(output)
+        limit = parse_budget(budget)
+        
+        # Usernames are case-insensitive, so keep the first spelling of each
+        unique = {}
+        for username in usernames:
+            username = username.strip().lstrip("@")
+            if username:
+                unique.setdefault(username.lower(), username)
+        
+        logger.info("Getting user information for %s usernames", len(unique))
+        # Concurrent lookups are packed into aliased requests by the batcher
+        # and served from the response cache when seen recently
+        responses = await asyncio.gather(
+            *(fetch_from_api(GET_USER_INFO_QUERY, {"username": username}) for username in unique.values()),
+            return_exceptions=True,
+        )
+        
+        result = f"# Users ({len(unique)})\n\n"
+        responses = dict(zip(unique.values(), responses))
+        
+        def describe(username: str) -> Any:
+            user, error = None, None
+            response = responses[username]
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                error = f"Error: {str(response)}"
+            elif not response or "errors" in response:
+                error = f"Error: {json.dumps((response or {}).get('errors'))}"
+            elif not (response.get("data") or {}).get("user"):
+                error = "Not found"
+            else:
+                user = response["data"]["user"]
+            
+            if output != "markdown":
+                return user_summary(username, user, error)
+            elif error:
+                return f"- @{username}: {error}\n"
+            return format_user_summary(user)
+        
+        names = list(unique.values())
+        available = bytes_left(limit, text_size(result) + CONTINUATION_RESERVE)
+        if output != "markdown":
+            fitted = fit_items(names, (describe,), available, json_size)
+            return render({"users": fitted.items, "omitted": names[len(fitted.items):]}, output, {"users": USER_SUMMARY_KEYS})
+        
+        fitted = fit_items(names, (describe,), available)
+        result += "".join(fitted.items)
+        if not fitted.complete:
+            omitted = names[len(fitted.items):]
+            result += budget_note(len(fitted.items), len(names), "users", f"Not shown: {', '.join(omitted)}.")
+        return result
+    except Exception as e:
+        logger.error("Error getting user info: %s", e)
+        return render_error(f"Error getting user information: {str(e)}", output)
 
 
 @mcp.tool()
-async def get_latest_articles(hostname: str, limit: int = 10) -> str:
+@with_deadline(TOOL_DEADLINE)
+async def get_latest_articles(hostname: str, limit: int = 10, output: str = DEFAULT_OUTPUT, cursor: str = None, budget: Optional[Union[int, str]] = None) -> str:
     """
     Get the latest articles from a Hashnode publication by hostname
     
@@ -486,94 +1387,80 @@ async def get_latest_articles(hostname: str, limit: int = 10) -> str:
         hostname: The hostname of the publication (e.g., "blog.example.com")
         limit: The number of articles to retrieve (default: 10)
         
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+        cursor: Cursor returned when the previous call did not fit in its
+            budget; continues right after the last article shown
+        budget: Maximum size of the response, as a number of bytes or e.g.
+            "2000 tokens"; 0 for no limit (default: HASHNODE_OUTPUT_BUDGET)
+            Articles are shown with fewer fields and shorter descriptions
+            before any are left out
     Note:
         If limit is higher than the actual number of available articles,
         all available articles will be returned.
     """
     try:
-        # First, get the publication ID from the hostname
-        variables = {
-            "host": hostname
-        }
-        
-        print(f"Getting publication ID for hostname '{hostname}'")
-        publication_data = await fetch_from_api(GET_PUBLICATION_ID_QUERY, variables)
-        print(f"Publication data response: {json.dumps(publication_data)}")
-        
-        if not publication_data or "data" not in publication_data or not publication_data["data"] or "publication" not in publication_data["data"] or not publication_data["data"]["publication"] or "id" not in publication_data["data"]["publication"]:
-            return f"Could not find publication with hostname '{hostname}'. Please make sure the hostname is correct."
-        
-        publication_id = publication_data["data"]["publication"]["id"]
-        publication_title = publication_data["data"]["publication"]["title"]
-        print(f"Found publication: {publication_title} (ID: {publication_id})")
-        
-        # Simplified approach: just make a single request to get all articles at once
-        all_edges = []
-        
-        # Search for posts in this publication
-        search_variables = {
-            "first": limit,  # Request all articles at once
-            "sortBy": "DATE_PUBLISHED_DESC",
-            "filter": {
-                "publicationId": publication_id,
-                "query": ""  # Empty query to get all articles
-            }
-        }
-        
-        print(f"Searching for {limit} articles in publication '{publication_title}'")
-        search_data = await fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, search_variables)
-        
-        if not search_data or "data" not in search_data:
-            return f"Error: No data returned from API. Full response: {json.dumps(search_data)}"
-        
-        if "errors" in search_data:
-            return f"API returned errors: {json.dumps(search_data['errors'])}"
-        
-        if "searchPostsOfPublication" in search_data["data"] and "edges" in search_data["data"]["searchPostsOfPublication"]:
-            edges = search_data["data"]["searchPostsOfPublication"]["edges"]
-            all_edges.extend(edges)
-            print(f"Found {len(edges)} articles")
+        output = output_mode(output)
+        max_bytes = parse_budget(budget)
+        local_cursor = cursor is not None and cursor.startswith(LOCAL_CURSOR_PREFIX)
+        mirrored = None
+        if post_mirror is not None and SYNC_SERVE and (cursor is None or local_cursor):
+            mirrored = post_mirror.publication(hostname)
+        if mirrored:
+            # Served from the local mirror kept up to date by the sync task
+            publication_title = mirrored["title"]
+            offset = int(cursor[len(LOCAL_CURSOR_PREFIX):]) if local_cursor else 0
+            all_edges = post_mirror.latest(mirrored["id"], limit, offset)
+        elif local_cursor:
+            return render_error(f"The cursor '{cursor}' is only valid while '{hostname}' is served from the local mirror. Please start again without a cursor.", output)
         else:
-            print("No articles found in response")
-        
-        # Format the search results
-        result = f"# Latest Articles from {publication_title}\n\n"
+            # First, get the publication ID from the hostname (served from the host cache when known)
+            publication = await resolve_publication(hostname)
+            if not publication:
+                return render_error(f"Could not find publication with hostname '{hostname}'. Please make sure the hostname is correct.", output)
+        
+            publication_id = publication["id"]
+            publication_title = publication["title"] or hostname
+            logger.debug("Found publication: %s (ID: %s)", publication_title, publication_id)
+        
+            logger.debug("Fetching %s articles in publication '%s'", limit, publication_title)
+            all_edges = []
+            # Size of the articles so far at their briefest, to stop once no more can fit
+            levels, measure = (LATEST_ARTICLE_LEVELS, text_size) if output == "markdown" else (summary_levels(LATEST_ARTICLE_KEYS, BRIEF_PREVIEW_CHARS), json_size)
+            floor = 0
+            # Walk bounded pages instead of asking for everything in one response
+            pages = iter_pages(latest_articles_fetcher(publication_id), limit, after=cursor)
+            try:
+                async for edges, _ in pages:
+                    all_edges.extend(edges)
+                    logger.debug("Fetched %s articles (%s so far)", len(edges), len(all_edges))
+                    if max_bytes is not None:
+                        floor += min_size([edge for edge in edges if edge.get("node")], levels, measure)
+                        if floor > max_bytes:
+                            break
+            except PageFetchError as e:
+                if e.response and "errors" in e.response:
+                    return render_error(f"API returned errors: {json.dumps(e.response['errors'])}", output)
+                return render_error(f"Error: No data returned from API. Full response: {json.dumps(e.response)}", output)
+            finally:
+                await pages.aclose()
+        
+        if output != "markdown":
+            edges = [edge for edge in all_edges if edge.get("node")]
+            fitted = fit_items(edges, summary_levels(LATEST_ARTICLE_KEYS, BRIEF_PREVIEW_CHARS), bytes_left(max_bytes, CONTINUATION_RESERVE), json_size)
+            return render({
+                "publication": publication_title,
+                "items": fitted.items,
+                # Where to continue when not every article fit in the budget
+                "endCursor": None if fitted.complete else edges[len(fitted.items) - 1].get("cursor"),
+            }, output, {"items": LATEST_ARTICLE_KEYS})
         
         if not all_edges:
-            return f"No articles found for publication '{publication_title}'."
-        
-        for edge in all_edges:
-            if "node" in edge:
-                node = edge["node"]
-                title = node.get("title", "Untitled")
-                result += f"## {title}\n"
-                
-                if "id" in node:
-                    result += f"ID: {node['id']}\n"
-                
-                if "author" in node and node["author"] and "name" in node["author"]:
-                    result += f"Author: {node['author']['name']}\n"
-                
-                if "publishedAt" in node and node["publishedAt"]:
-                    from datetime import datetime
-                    try:
-                        published_date = datetime.fromisoformat(node["publishedAt"].replace("Z", "+00:00"))
-                        result += f"Published: {published_date.strftime('%b %d')}\n"
-                    except:
-                        result += f"Published: {node['publishedAt']}\n"
-                
-                if "brief" in node and node["brief"]:
-                    brief = node["brief"]
-                    max_length = 200
-                    if len(brief) > max_length:
-                        brief = brief[:max_length] + "..."
-                    result += f"Description: {brief}\n"
-                
-                result += "\n"
+            return render_error(f"No articles found for publication '{publication_title}'.", output)
         
-        return result
+        return format_latest_articles(publication_title, all_edges, max_bytes)
     except Exception as e:
-        print(f"Error getting latest articles: {str(e)}")
+        logger.error("Error getting latest articles: %s", e)
         error_message = f"Error getting latest articles for hostname '{hostname}': {str(e)}"
         
         if hasattr(e, 'response') and e.response is not None:
@@ -583,12 +1470,59 @@ async def get_latest_articles(hostname: str, limit: int = 10) -> str:
             except:
                 pass
         
-        return error_message
+        return render_error(error_message, output)
+
+
+@mcp.tool()
+@with_deadline(EXPORT_TOOL_DEADLINE)
+async def export_publication(hostname: str, output_path: str, concurrency: int = EXPORT_CONCURRENCY, restart: bool = False, output: str = DEFAULT_OUTPUT) -> str:
+    """
+    Export every post of a publication, with content, to a JSONL file
+    
+    Args:
+        hostname: The hostname of the publication (e.g., "blog.example.com")
+        output_path: The file to write, one post per line, relative to the
+            export directory (HASHNODE_EXPORT_DIR)
+        concurrency: Maximum number of posts fetched at the same time (default: 5)
+        restart: Ignore the progress of an earlier, interrupted export (default: False)
+        output: "markdown" (default), "json" for a minimal JSON document, or
+            "compact" for the same JSON with listings as tables
+    """
+    try:
+        output = output_mode(output)
+        path = export_path(output_path, EXPORT_DIR)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        summary = await run_export(publication_api, hostname, path, concurrency=concurrency, resume=not restart)
+        
+        if output != "markdown":
+            return render({
+                "publication": summary["publication"],
+                "file": path,
+                "written": summary["written"],
+                "exported": summary["exported"],
+                "failed": summary["failed"],
+                "complete": summary["complete"],
+            }, output)
+        
+        result = f"# Export of {summary['publication']}\n\n"
+        result += f"File: {path}\n"
+        result += f"Posts Written: {summary['written']} ({summary['exported']} in this run)\n"
+        if summary["failed"]:
+            result += f"Failed Posts: {', '.join(summary['failed'])}\n"
+        result += f"Complete: {summary['complete']}\n"
+        return result
+    except Exception as e:
+        logger.error("Error exporting publication: %s", e)
+        return render_error(
+            f"Error exporting publication '{hostname}' to '{output_path}': {str(e)}\n"
+            "Progress up to the last completed page is saved; run the export again to resume.",
+            output,
+        )
 
 
 def main():
     """Entry point for the package."""
-    print("Starting Hashnode MCP server...")
+    logger.info("Starting Hashnode MCP server...")
     mcp.run()
 
 if __name__ == "__main__":
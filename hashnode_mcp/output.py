@@ -0,0 +1,244 @@
+"""
+Structured JSON output for the tools.
+
+Every tool takes an ``output`` argument. "markdown" (the default) returns
+the text built by the ``format_*`` functions in ``hashnode_mcp.utils``. For
+programs calling the tools, "json" returns a minimal JSON document built
+straight from the response data, with no Markdown rendering. It carries the
+same fields as the Markdown text (long text is cut at the same lengths),
+without the labels and layout. "compact" is the same document with the
+listings turned into a table of ``fields`` and ``rows``, so the keys are not
+repeated for every item.
+
+The shapes below fix the keys of every object, and every tool fixes the
+columns of its tables, so a document always has the same shape for the same
+tool whatever the number of items. Missing values are null.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from hashnode_mcp.budget import SHORT_BRIEF_CHARS, bytes_left, clip, json_size
+
+OUTPUT_FORMATS = ("markdown", "json", "compact")
+DEFAULT_OUTPUT = os.getenv("HASHNODE_OUTPUT", "markdown").lower()
+
+# Lengths at which the Markdown output cuts long text (see hashnode_mcp.utils)
+CONTENT_PREVIEW_CHARS = 1000
+BIO_PREVIEW_CHARS = 100
+BRIEF_PREVIEW_CHARS = 200
+
+# Keys of the objects in a JSON document, in order
+POST_SUMMARY_KEYS = ("id", "title", "url", "slug", "publishedAt", "author", "brief")
+# The fields of a post the Markdown listings show (the slug is the end of the URL)
+SEARCH_RESULT_KEYS = ("id", "title", "url", "publishedAt", "author", "brief")
+LATEST_ARTICLE_KEYS = ("id", "title", "publishedAt", "author", "brief")
+USER_KEYS = ("id", "username", "name", "profilePicture", "bio", "followersCount", "followingsCount", "links", "publications")
+USER_SUMMARY_KEYS = ("username", "name", "followersCount", "followingsCount", "links", "publications", "bio", "error")
+PUBLICATION_KEYS = ("title", "url")
+MUTATION_POST_KEYS = ("id", "title", "slug", "url", "brief", "publishedAt")
+# Keys of a listing item still filled in when it is cut down to fit the output budget
+BRIEF_SUMMARY_KEYS = ("id", "title", "brief")
+
+
+def output_mode(output: Optional[str]) -> str:
+    """
+    Validate an ``output`` argument
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    output = (output or DEFAULT_OUTPUT).lower()
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output}'; use one of: {', '.join(OUTPUT_FORMATS)}")
+    return output
+
+
+def is_structured(output: Optional[str]) -> bool:
+    """Check whether an ``output`` argument asks for JSON"""
+    return (output or DEFAULT_OUTPUT).lower() in ("json", "compact")
+
+
+def compact(value: Dict[str, Any], tables: Mapping[str, Sequence[str]]) -> Dict[str, Any]:
+    """
+    Turn the listings of a document into tables
+
+    With ``tables={"items": ("id", "title")}``, ``{"items": [{"id": 1, "title": "a"}, {"id": 2}]}``
+    becomes ``{"items": {"fields": ["id", "title"], "rows": [[1, "a"], [2, null]]}}``.
+    The columns are the ones given, even for an empty or one-item listing,
+    and every other value is kept as is, nulls included.
+
+    Args:
+        value: A "json" document
+        tables: The columns of each listing, by key
+    """
+    result = dict(value)
+    for key, fields in tables.items():
+        if isinstance(result.get(key), list):
+            result[key] = {
+                "fields": list(fields),
+                "rows": [[item.get(field) for field in fields] for item in result[key]],
+            }
+    return result
+
+
+def render(value: Dict[str, Any], output: str, tables: Optional[Mapping[str, Sequence[str]]] = None) -> str:
+    """
+    Serialize a JSON document in the "json" or "compact" format
+
+    Args:
+        value: The document
+        output: "json" or "compact"
+        tables: The columns of each listing of the document, by key, for "compact"
+    """
+    if output == "compact":
+        value = compact(value, tables or {})
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_error(message: str, output: Optional[str]) -> str:
+    """Return an error message as text, or as ``{"error": ...}`` in the JSON formats"""
+    if is_structured(output):
+        return json.dumps({"error": message}, ensure_ascii=False, separators=(",", ":"))
+    return message
+
+
+def preview(text: Optional[str], limit: int) -> Optional[str]:
+    """Cut long text like the Markdown output does"""
+    if text and len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
+def _pick(obj: Optional[Dict[str, Any]], keys: Iterable[str]) -> Dict[str, Any]:
+    obj = obj or {}
+    return {key: obj.get(key) for key in keys}
+
+
+def post_summary(node: Dict[str, Any], keys: Sequence[str] = POST_SUMMARY_KEYS) -> Dict[str, Any]:
+    """
+    Shape a post from a listing (search, latest articles)
+
+    Every key of ``keys`` is included, null when the listing does not carry
+    it (mirror listings select fewer fields than the API).
+    """
+    summary = _pick(node, keys)
+    if "author" in summary:
+        author = node.get("author") or {}
+        summary["author"] = author.get("username") or author.get("name")
+    return summary
+
+
+def post_details(
+    post: Optional[Dict[str, Any]],
+    fields: Iterable[str],
+    content_format: str,
+    content_bytes: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Shape a post from a details lookup
+
+    The keys are the projected ``fields`` (see ``hashnode_mcp.projection``).
+    ``content`` is the body in ``content_format`` as a string, cut like the
+    Markdown output, and further to ``content_bytes`` bytes when given (see
+    ``fit_post_details``); ``contentSize`` is the length of the whole body,
+    which get_article_content reads in full.
+    """
+    details = _pick(post, fields)
+    if "content" in details:
+        body = ((post or {}).get("content") or {}).get(content_format)
+        if body is None or content_bytes is None:
+            details["content"] = preview(body, CONTENT_PREVIEW_CHARS)
+        else:
+            shown = clip(body[:CONTENT_PREVIEW_CHARS], content_bytes)
+            details["content"] = shown + "..." if len(shown) < len(body) else body
+        details["contentSize"] = len(body) if body is not None else None
+    return details
+
+
+def fit_post_details(post: Optional[Dict[str, Any]], fields: Iterable[str], content_format: str, limit: Optional[int]) -> Dict[str, Any]:
+    """
+    Shape a post from a details lookup, cutting the body to fit ``limit`` bytes
+
+    The body gets whatever the other fields leave of the budget.
+    """
+    if limit is None:
+        return post_details(post, fields, content_format)
+    details = post_details(post, fields, content_format, content_bytes=0)
+    return post_details(post, fields, content_format, content_bytes=bytes_left(limit, json_size(details)))
+
+
+def post_details_keys(fields: Iterable[str]) -> Tuple[str, ...]:
+    """Return the keys of a post of a batch lookup (see ``post_details``), for its table"""
+    fields = tuple(fields)
+    extra = ("contentSize",) if "content" in fields else ()
+    return tuple(dict.fromkeys(fields + extra + ("id", "error")))
+
+
+def user_details(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a user from GET_USER_INFO_QUERY"""
+    details = _pick(user, USER_KEYS)
+    details["bio"] = (user.get("bio") or {}).get("text")
+    details["links"] = {key: value for key, value in (user.get("socialMediaLinks") or {}).items() if value}
+    details["publications"] = publications(user.get("publications"))
+    return details
+
+
+def user_summary(username: str, user: Optional[Dict[str, Any]], error: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Shape one row of a listing of many users (see ``format_user_summary``)
+
+    Args:
+        username: The username that was looked up
+        user: The user found, or None
+        error: Why no user is given, e.g. "Not found"
+    """
+    summary = _pick(user, USER_SUMMARY_KEYS)
+    summary["username"] = username
+    if user:
+        summary["links"] = [value for value in (user.get("socialMediaLinks") or {}).values() if value]
+        summary["publications"] = [publication["title"] for publication in publications(user.get("publications"))]
+        summary["bio"] = preview(" ".join(((user.get("bio") or {}).get("text") or "").split()) or None, BIO_PREVIEW_CHARS)
+    summary["error"] = error
+    return summary
+
+
+def publications(connection: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Shape the publications of a user"""
+    return [_pick(edge["node"], PUBLICATION_KEYS) for edge in (connection or {}).get("edges") or [] if edge.get("node")]
+
+
+def summary_levels(keys: Sequence[str], brief_chars: Optional[int] = None) -> Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], ...]:
+    """
+    Shapers of a connection edge at each level of detail, for ``fit_items``
+
+    The full summary comes first, then the same keys with only the ID, title
+    and brief filled in (the others null), then the same with the brief cut
+    to ``SHORT_BRIEF_CHARS``, so every item of a listing has the same keys.
+
+    Args:
+        keys: The keys of full summaries
+        brief_chars: Length to cut the briefs of full summaries at, if any
+    """
+    def full(edge: Dict[str, Any]) -> Dict[str, Any]:
+        summary = post_summary(edge["node"], keys)
+        if brief_chars is not None and "brief" in summary:
+            summary["brief"] = preview(summary["brief"], brief_chars)
+        return summary
+
+    def brief(limit: int) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        def shape(edge: Dict[str, Any]) -> Dict[str, Any]:
+            node = edge["node"]
+            summary = {key: node.get(key) if key in BRIEF_SUMMARY_KEYS else None for key in keys}
+            if "brief" in summary:
+                summary["brief"] = preview(summary["brief"], limit)
+            return summary
+        return shape
+
+    return full, brief(brief_chars or BRIEF_PREVIEW_CHARS), brief(SHORT_BRIEF_CHARS)
+
+
+def mutation_post(data: Dict[str, Any], field: str) -> Dict[str, Any]:
+    """Shape the post returned by a mutation such as ``publishPost``"""
+    post = (((data.get("data") or {}).get(field)) or {}).get("post")
+    return {"post": _pick(post, MUTATION_POST_KEYS) if post else None}
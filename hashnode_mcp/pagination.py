@@ -0,0 +1,148 @@
+"""
+Cursor-based pagination helpers for Hashnode connections.
+
+Hashnode connections are paginated with opaque ``endCursor`` values, so page
+N can only be requested once the cursor after page N-1 is known.
+``CursorMap`` remembers the cursors seen for each (publication, query, page
+size, page) so a later request for page N costs one round trip instead of
+walking every page before it. ``iter_pages`` walks a connection page by
+page and requests the next page while the caller processes the current one.
+"""
+import asyncio
+import os
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Hashnode rejects connection pages larger than this
+MAX_PAGE_SIZE = 20
+SEARCH_PAGE_SIZE = min(MAX_PAGE_SIZE, int(os.getenv("HASHNODE_SEARCH_PAGE_SIZE", "5")))
+CURSOR_MAP_SIZE = int(os.getenv("HASHNODE_CURSOR_MAP_SIZE", "1000"))
+LISTING_PAGE_SIZE = min(MAX_PAGE_SIZE, int(os.getenv("HASHNODE_LISTING_PAGE_SIZE", "20")))
+
+
+def clamp_page_size(per_page: int) -> int:
+    """Clamp a requested page size to what the API accepts"""
+    return max(1, min(MAX_PAGE_SIZE, per_page))
+
+
+class CursorMap:
+    """
+    Bounded LRU map of the cursor found after each page of a listing
+
+    Args:
+        max_entries: Maximum number of cursors to remember
+    """
+
+    def __init__(self, max_entries: int = CURSOR_MAP_SIZE):
+        self.max_entries = max_entries
+        self._cursors: "OrderedDict[Tuple[Hashable, ...], str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def get(self, listing: Tuple[Hashable, ...], page: int) -> Optional[str]:
+        """Return the cursor after ``page`` of a listing, if known"""
+        cursor = self._cursors.get(listing + (page,))
+        if cursor is not None:
+            self._cursors.move_to_end(listing + (page,))
+        return cursor
+
+    def set(self, listing: Tuple[Hashable, ...], page: int, cursor: str) -> None:
+        """Remember the cursor after ``page`` of a listing"""
+        key = listing + (page,)
+        self._cursors[key] = cursor
+        self._cursors.move_to_end(key)
+        while len(self._cursors) > self.max_entries:
+            self._cursors.popitem(last=False)
+
+    def page_before(self, listing: Tuple[Hashable, ...], cursor: str) -> Optional[int]:
+        """Return the page a cursor was seen after, if it is a known page boundary of a listing"""
+        size = len(listing)
+        for key, known in self._cursors.items():
+            if known == cursor and key[:size] == listing:
+                return key[size]
+        return None
+
+    def nearest(self, listing: Tuple[Hashable, ...], page: int) -> Tuple[int, Optional[str]]:
+        """
+        Find where to start fetching to reach ``page``
+
+        Returns:
+            A tuple of (first page to fetch, cursor to fetch it after). When
+            the cursor after ``page - 1`` is known this is ``(page, cursor)``.
+        """
+        for previous in range(page - 1, 0, -1):
+            cursor = self.get(listing, previous)
+            if cursor is not None:
+                return previous + 1, cursor
+        return 1, None
+
+    def invalidate(self, predicate) -> None:
+        """Forget every cursor whose key matches ``predicate(key)``"""
+        for key in [key for key in self._cursors if predicate(key)]:
+            del self._cursors[key]
+
+
+class PageFetchError(Exception):
+    """
+    Raised when a page of a connection could not be fetched
+
+    Args:
+        response: The GraphQL response that was returned, if any
+    """
+
+    def __init__(self, message: str, response: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.response = response
+
+
+# fetch_page(first, after) -> (edges, cursor after the page or None on the last page)
+PageFetcher = Callable[[int, Optional[str]], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]]
+
+
+async def iter_pages(
+    fetch_page: PageFetcher,
+    limit: Optional[int] = None,
+    page_size: int = LISTING_PAGE_SIZE,
+    after: Optional[str] = None,
+) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """
+    Walk a connection page by page until ``limit`` edges have been yielded
+
+    Pages are at most ``page_size`` edges and the last one only asks for what
+    is still missing. As soon as a page arrives the request for the next one
+    is started, so it is in flight while the caller handles the current page.
+    The pending request is cancelled if the caller stops early.
+
+    Args:
+        fetch_page: Coroutine function fetching ``first`` edges after a cursor
+        limit: Total number of edges wanted; None walks the whole connection
+        page_size: Maximum number of edges per request
+        after: Cursor to start after, e.g. to resume an interrupted walk
+
+    Yields:
+        Tuples of (edges of the page, cursor after the page or None on the last page)
+    """
+    page_size = clamp_page_size(page_size)
+    remaining = limit
+
+    def next_size() -> int:
+        return page_size if remaining is None else min(page_size, remaining)
+
+    pending: Optional["asyncio.Task"] = None
+    if remaining is None or remaining > 0:
+        pending = asyncio.ensure_future(fetch_page(next_size(), after))
+    try:
+        while pending is not None:
+            edges, cursor = await pending
+            pending = None
+            if remaining is not None:
+                edges = edges[:remaining]
+                remaining -= len(edges)
+            if (remaining is None or remaining > 0) and cursor and edges:
+                pending = asyncio.ensure_future(fetch_page(next_size(), cursor))
+            if edges:
+                yield edges, cursor
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,110 @@
+"""
+Field projection for post lookups.
+
+``GET_POST_BY_ID_QUERY`` selects every field of a post, including the body
+three times over (``content { markdown html text }``), while the tools only
+render part of it. Here each top-level post field is a fragment in
+``POST_FRAGMENTS`` and a lookup document is assembled from just the fields a
+tool renders (or the caller asks for) and the one content format it shows.
+Compiled documents are cached. They keep the ``Post`` operation name of
+``GET_POST_BY_ID_QUERY``, which labels them like it (see
+``hashnode_mcp.cache.OPERATION_LABELS``), so they are cached, batched,
+timed and invalidated like it.
+"""
+import functools
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Selection of each top-level post field
+POST_FRAGMENTS: Dict[str, str] = {
+    "id": "id",
+    "slug": "slug",
+    "previousSlugs": "previousSlugs",
+    "title": "title",
+    "subtitle": "subtitle",
+    "author": "author { id username name profilePicture }",
+    "url": "url",
+    "canonicalUrl": "canonicalUrl",
+    "publication": "publication { id title displayTitle url }",
+    "cuid": "cuid",
+    "coverImage": "coverImage { url isPortrait attribution photographer isAttributionHidden }",
+    "brief": "brief",
+    "readTimeInMinutes": "readTimeInMinutes",
+    "views": "views",
+    "content": "content { %s }",
+    "publishedAt": "publishedAt",
+    "updatedAt": "updatedAt",
+}
+
+CONTENT_FORMATS = ("text", "markdown", "html", "none")
+
+# Fields rendered by format_post_details
+DETAILS_FIELDS: Tuple[str, ...] = (
+    "id", "slug", "title", "subtitle", "author", "url", "canonicalUrl", "publication",
+    "coverImage", "brief", "readTimeInMinutes", "views", "content", "publishedAt", "updatedAt",
+)
+
+
+def normalize_fields(fields: Optional[Iterable[str]], content_format: str = "text") -> Tuple[Tuple[str, ...], str]:
+    """
+    Validate a field selection
+
+    Args:
+        fields: Post fields to select (see ``POST_FRAGMENTS``); None selects
+            ``DETAILS_FIELDS``
+        content_format: Which copy of the body to fetch: "text", "markdown",
+            "html", or "none" for no body at all
+
+    Returns:
+        A tuple of (fields in registry order, always including "id" and
+        excluding "content" when no format is wanted, content format)
+
+    Raises:
+        ValueError: If a field or the content format is unknown
+    """
+    content_format = (content_format or "text").lower()
+    if content_format not in CONTENT_FORMATS:
+        raise ValueError(f"Unknown content format '{content_format}'; use one of: {', '.join(CONTENT_FORMATS)}")
+
+    wanted = set(DETAILS_FIELDS if fields is None else fields)
+    unknown = wanted - set(POST_FRAGMENTS)
+    if unknown:
+        raise ValueError(f"Unknown post fields: {', '.join(sorted(unknown))}; available: {', '.join(POST_FRAGMENTS)}")
+
+    wanted.add("id")
+    if content_format == "none":
+        wanted.discard("content")
+    return tuple(name for name in POST_FRAGMENTS if name in wanted), content_format
+
+
+@functools.lru_cache(maxsize=64)
+def post_query(fields: Tuple[str, ...], content_format: str = "text") -> str:
+    """
+    Compile a post lookup selecting only ``fields``
+
+    Args:
+        fields: Normalized fields (see ``normalize_fields``)
+        content_format: The content format to select inside ``content``
+
+    Returns:
+        A document taking the same ``$id`` variable as ``GET_POST_BY_ID_QUERY``
+    """
+    selections = "\n    ".join(
+        POST_FRAGMENTS[name] % content_format if name == "content" else POST_FRAGMENTS[name]
+        for name in fields
+    )
+    query = f"""
+query Post($id: ID!) {{
+  post(id: $id) {{
+    {selections}
+  }}
+}}
+"""
+    return query
+
+
+def project_post(post: Dict[str, Any], fields: Tuple[str, ...], content_format: str = "text") -> Dict[str, Any]:
+    """Cut a full post object (e.g. from the local mirror) down to a projection"""
+    projected = {name: post[name] for name in fields if name in post}
+    if isinstance(projected.get("content"), dict):
+        projected["content"] = {content_format: projected["content"].get(content_format)}
+    return projected
@@ -0,0 +1,171 @@
+"""
+Client-side adaptive rate limiting for requests to the Hashnode API.
+
+An async token bucket paces outgoing requests. Callers wait in FIFO order
+instead of failing, and the rate backs off when the API answers with 429 or
+reports an exhausted quota through rate-limit headers.
+"""
+import asyncio
+import os
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+RATE_LIMIT_RPS = float(os.getenv("HASHNODE_RATE_LIMIT_RPS", "10"))
+RATE_LIMIT_BURST = int(os.getenv("HASHNODE_RATE_LIMIT_BURST", "10"))
+RATE_LIMIT_MIN_RPS = float(os.getenv("HASHNODE_RATE_LIMIT_MIN_RPS", "0.5"))
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the delay requested by a ``Retry-After`` header in seconds
+
+    Both the delta-seconds and the HTTP-date forms are supported.
+    """
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_reset(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the seconds until the quota resets when the rate-limit headers say
+    it is used up, otherwise None
+    """
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if float(remaining) > 0:
+            return None
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    # Some APIs send an epoch timestamp, others the seconds left
+    if reset_value > 1e9:
+        return max(0.0, reset_value - time.time())
+    return max(0.0, reset_value)
+
+
+class AdaptiveRateLimiter:
+    """
+    Async token bucket whose rate adapts to upstream throttling
+
+    On a 429 the rate is halved and requests pause for the ``Retry-After``
+    delay; every successful response raises it again by a small step until
+    the configured rate is reached.
+
+    Args:
+        rate: Requests per second allowed when the API is not throttling (0 disables limiting)
+        burst: Bucket capacity, i.e. how many requests may be sent back to back
+        min_rate: Lower bound the rate never drops below
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT_RPS, burst: int = RATE_LIMIT_BURST, min_rate: float = RATE_LIMIT_MIN_RPS):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate) if rate > 0 else 0
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        # Counters for diagnostics
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_rate > 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent
+
+        Waiters are served in arrival order (``asyncio.Lock`` is FIFO).
+
+        Returns:
+            The time spent waiting in seconds
+        """
+        if not self.enabled:
+            return 0.0
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        start = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if self._paused_until > now:
+                        await asyncio.sleep(self._paused_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def on_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the rate to an upstream response"""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if status_code == 429:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            delay = parse_retry_after(headers)
+            if delay is None:
+                delay = 1 / self.rate
+            self._paused_until = max(self._paused_until, now + delay)
+            self._tokens = 0.0
+            return
+
+        reset = parse_rate_limit_reset(headers)
+        if reset is not None:
+            self._paused_until = max(self._paused_until, now + reset)
+            return
+
+        if self.rate < self.max_rate:
+            # Additive increase back to the configured rate
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the limiter counters"""
+        return {
+            "rate": round(self.rate, 3),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait": round(self.total_wait, 3),
+            "avg_wait": round(self.total_wait / self.acquired, 3) if self.acquired else 0.0,
+            "max_wait": round(self.max_wait, 3),
+        }
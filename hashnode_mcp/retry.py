@@ -0,0 +1,173 @@
+"""
+Retry policy for requests to the Hashnode API.
+
+Retryable failures (connection errors, 5xx and 429 responses) are retried
+with exponential backoff and full jitter. A process-wide retry budget caps
+retries to a fraction of the overall request volume so that retries cannot
+amplify an upstream outage.
+"""
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from hashnode_mcp.deadlines import remaining
+from hashnode_mcp.log import get_logger
+from hashnode_mcp.ratelimit import parse_retry_after
+
+logger = get_logger(__name__)
+
+RETRY_MAX_ATTEMPTS = int(os.getenv("HASHNODE_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("HASHNODE_RETRY_BASE_DELAY", "0.2"))
+RETRY_MAX_DELAY = float(os.getenv("HASHNODE_RETRY_MAX_DELAY", "5"))
+RETRY_BUDGET_RATIO = float(os.getenv("HASHNODE_RETRY_BUDGET_RATIO", "0.2"))
+RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("HASHNODE_RETRY_BUDGET_MIN_PER_SECOND", "1"))
+
+# Transport errors where the request may not have reached the server or the
+# connection broke before a response was read
+RETRYABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+    httpx.ReadError,
+    httpx.WriteError,
+)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Check whether a failed request may be retried
+
+    Args:
+        exc: The exception raised by the request
+
+    Returns:
+        True for connection errors and for 5xx and 429 responses
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, RETRYABLE_EXCEPTIONS)
+
+
+def backoff_delay(attempt: int, base_delay: float = RETRY_BASE_DELAY, max_delay: float = RETRY_MAX_DELAY) -> float:
+    """
+    Return the delay before retry number ``attempt`` (starting at 1)
+
+    Uses "full jitter": a uniformly random delay between zero and the
+    exponential backoff ceiling.
+    """
+    ceiling = min(max_delay, base_delay * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """
+    Process-wide budget limiting retries to a share of all requests
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one.
+    A small floor of ``min_per_second`` retries keeps retries possible when
+    traffic is low.
+
+    Args:
+        ratio: Retries allowed per request (0.2 means at most 20% extra load)
+        min_per_second: Retries always allowed per second
+        max_tokens: Upper bound for the saved-up retry tokens
+    """
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_per_second: float = RETRY_BUDGET_MIN_PER_SECOND, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        # Counters for diagnostics
+        self.retries = 0
+        self.exhausted = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def record_request(self) -> None:
+        """Deposit the share earned by one request"""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take one retry from the budget, returning False when it is exhausted"""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+
+class RetryPolicy:
+    """
+    Retry an async call on retryable failures
+
+    Args:
+        max_attempts: Total number of attempts including the first one
+        base_delay: Backoff ceiling for the first retry in seconds
+        max_delay: Upper bound for the backoff ceiling in seconds
+        budget: Shared retry budget
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+
+    async def call(self, func: Callable[[], Awaitable[Any]], idempotent: bool = True) -> Any:
+        """
+        Run ``func``, retrying it on retryable failures
+
+        Args:
+            func: Zero-argument coroutine function performing one attempt
+            idempotent: Whether repeating the call is safe; non-idempotent
+                calls (unmarked mutations) are never retried
+
+        Returns:
+            The result of the first successful attempt
+        """
+        self.budget.record_request()
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if (
+                    not idempotent
+                    or attempt >= self.max_attempts
+                    or not is_retryable(e)
+                    or not self.budget.try_withdraw()
+                ):
+                    raise
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                if isinstance(e, httpx.HTTPStatusError):
+                    # Never retry earlier than the server asked us to
+                    retry_after = parse_retry_after(e.response.headers)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                budget = remaining()
+                if budget is not None and delay >= budget:
+                    # The retry could not finish within the caller's deadline
+                    raise
+                logger.info("Retrying request in %.2fs after error (attempt %s/%s): %s", delay, attempt + 1, self.max_attempts, e)
+                await asyncio.sleep(delay)
+                attempt += 1
@@ -0,0 +1,57 @@
+"""
+Single-flight deduplication of identical in-flight requests.
+
+While a request for a key is in flight, further callers asking for the same
+key wait for that request instead of starting their own.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from hashnode_mcp.deadlines import start_shared, wait_shared
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers using the same key
+
+    The shared call runs in its own task without a deadline, so a caller
+    being cancelled or running out of time does not fail the request for
+    everybody else; each caller stops waiting at its own deadline. All
+    callers receive the same result object, which must therefore be treated
+    as read-only.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Counters for diagnostics
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``func`` for ``key`` unless a call for the same key is already running
+
+        Args:
+            key: The deduplication key
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = start_shared(func)
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+        else:
+            self.shared += 1
+        return await wait_shared(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished call so later callers start a fresh request"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller has gone away
+            task.exception()
@@ -0,0 +1,555 @@
+"""
+Local SQLite mirror of publications, kept up to date incrementally.
+
+``PostMirror`` stores the posts of the configured publications, metadata and
+content, in a SQLite database in WAL mode so the tools can read them locally.
+``sync_publication`` walks ``searchPostsOfPublication`` newest first and
+stops at the publication's ``publishedAt`` watermark, so a regular run only
+lists posts published since the last one. Full details are only fetched for
+posts that are new, whose ``updatedAt`` changed or that were changed through
+this server (see ``PostMirror.mark_dirty``). A periodic full run walks
+the whole publication to pick up edits to older posts and drop deleted ones.
+
+The title, brief and content text of mirrored posts are also kept in an
+FTS5 full-text index, maintained by triggers as posts change, which
+``PostMirror.search`` queries with BM25 ranking.
+
+``sync_loop`` runs the sync in the background inside the server; the module
+can also be run on its own:
+
+Usage:
+    python -m hashnode_mcp.sync blog.example.com [blog.other.com ...]
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+# Load .env before the configuration below is read (matters when run as a script)
+load_dotenv()
+
+from hashnode_mcp.export import PublicationApi, fetch_post
+from hashnode_mcp.log import configure_logging, get_logger
+from hashnode_mcp.pagination import LISTING_PAGE_SIZE, PageFetchError, iter_pages
+from hashnode_mcp.utils import SYNC_POSTS_OF_PUBLICATION_QUERY
+
+logger = get_logger(__name__)
+
+# Path of the mirror database; the mirror is disabled when unset
+SYNC_DB = os.getenv("HASHNODE_SYNC_DB", "")
+# Publications to mirror: "blog.a.com,blog.b.com"
+SYNC_HOSTS = os.getenv("HASHNODE_SYNC_HOSTS", "")
+SYNC_INTERVAL = float(os.getenv("HASHNODE_SYNC_INTERVAL", "900"))
+SYNC_FULL_INTERVAL = float(os.getenv("HASHNODE_SYNC_FULL_INTERVAL", "86400"))
+SYNC_CONCURRENCY = int(os.getenv("HASHNODE_SYNC_CONCURRENCY", "5"))
+# Let get_latest_articles and get_article_details answer from the mirror
+SYNC_SERVE = os.getenv("HASHNODE_SYNC_SERVE", "true").lower() in ("1", "true", "yes")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS publications (
+    id TEXT PRIMARY KEY,
+    host TEXT UNIQUE NOT NULL,
+    title TEXT,
+    watermark TEXT,
+    synced_at REAL,
+    full_synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    publication_id TEXT NOT NULL,
+    title TEXT,
+    brief TEXT,
+    author_name TEXT,
+    published_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_by_publication ON posts (publication_id, published_at DESC);
+CREATE TABLE IF NOT EXISTS dirty_posts (
+    id TEXT PRIMARY KEY
+);
+"""
+
+# Full-text index over the mirrored posts; rowids follow the posts table and
+# the triggers keep both in step on every insert, update and delete
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, brief, content, tokenize = 'porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+    INSERT INTO posts_fts (rowid, title, brief, content)
+    VALUES (new.rowid, new.title, new.brief, json_extract(new.data, '$.content.text'));
+END;
+CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE ON posts BEGIN
+    UPDATE posts_fts SET title = new.title, brief = new.brief, content = json_extract(new.data, '$.content.text')
+    WHERE rowid = old.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+    DELETE FROM posts_fts WHERE rowid = old.rowid;
+END;
+"""
+
+# BM25 weights of the title, brief and content columns
+FTS_WEIGHTS = (10.0, 4.0, 1.0)
+# Marks the cursors of local listings and search results, "local:<offset>"
+LOCAL_CURSOR_PREFIX = "local:"
+
+_FTS_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn a user search into an FTS5 query
+
+    Every word must match; ``"quoted words"`` match as a phrase and a
+    trailing ``*`` matches any word starting with the prefix. Everything is
+    quoted, so punctuation in the input cannot break the FTS5 syntax.
+
+    Args:
+        text: The search as typed by the user
+
+    Returns:
+        The FTS5 MATCH expression, or "" if the search has no words
+    """
+    terms = []
+    for phrase, word in _FTS_TOKEN_RE.findall(text):
+        value = phrase if phrase else word
+        prefix = not phrase and value.endswith("*")
+        value = value.rstrip("*").replace('"', '""').strip()
+        if value:
+            terms.append(f'"{value}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def parse_hosts(value: str) -> List[str]:
+    """Parse a comma-separated list of publication hostnames"""
+    return [host.strip().lower() for host in value.split(",") if host.strip()]
+
+
+class PostMirror:
+    """
+    SQLite store of mirrored publications and their posts
+
+    Reads are plain indexed lookups on one connection and are cheap enough to
+    run directly on the event loop. The connection is in autocommit mode;
+    writes spanning several statements run in ``_transaction``.
+
+    Args:
+        path: The database file
+    """
+
+    def __init__(self, path: str = SYNC_DB):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        # WAL lets readers (the tools) run while a sync writes
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        indexed = self._db.execute("SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'").fetchone()
+        self._db.executescript(FTS_SCHEMA)
+        if not indexed:
+            # Index the posts of a mirror created before the index existed
+            self._db.execute(
+                "INSERT INTO posts_fts (rowid, title, brief, content) "
+                "SELECT rowid, title, brief, json_extract(data, '$.content.text') FROM posts"
+            )
+
+    def close(self) -> None:
+        """Close the database"""
+        self._db.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Run a block of writes atomically
+
+        In autocommit mode ``with connection:`` opens no transaction, so
+        posts, their index and the dirty flags could be left out of step by
+        a failure halfway through.
+        """
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def publication(self, host: str) -> Optional[Dict[str, Any]]:
+        """Return the mirrored publication for a hostname, if it has been synced"""
+        row = self._db.execute(
+            "SELECT * FROM publications WHERE host = ? AND synced_at IS NOT NULL", (host.strip().lower(),)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def save_publication(self, host: str, publication: Dict[str, Any]) -> None:
+        """Register a publication to mirror"""
+        self._db.execute(
+            "INSERT INTO publications (id, host, title) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET host = excluded.host, title = excluded.title",
+            (publication["id"], host.strip().lower(), publication.get("title")),
+        )
+
+    def watermark(self, publication_id: str) -> Optional[str]:
+        """Return the newest ``publishedAt`` mirrored for a publication"""
+        row = self._db.execute("SELECT watermark FROM publications WHERE id = ?", (publication_id,)).fetchone()
+        return row["watermark"] if row else None
+
+    def mark_synced(self, publication_id: str, full: bool, before: Optional[str] = None) -> None:
+        """
+        Record a completed sync and move the watermark to the newest post
+
+        Args:
+            publication_id: The publication
+            full: Whether the sync walked every post
+            before: Keep the watermark below this ``publishedAt``, e.g. that of
+                a post that could not be fetched, so the next sync lists it again
+        """
+        now = time.time()
+        self._db.execute(
+            "UPDATE publications SET synced_at = ?, full_synced_at = CASE WHEN ? THEN ? ELSE full_synced_at END, "
+            "watermark = (SELECT MAX(published_at) FROM posts WHERE publication_id = ? AND (? IS NULL OR published_at < ?)) "
+            "WHERE id = ?",
+            (now, full, now, publication_id, before, before, publication_id),
+        )
+
+    def updated_at(self, post_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Return the stored ``updatedAt`` of the given posts that are mirrored"""
+        if not post_ids:
+            return {}
+        rows = self._db.execute(
+            f"SELECT id, updated_at FROM posts WHERE id IN ({','.join('?' * len(post_ids))})", post_ids
+        ).fetchall()
+        return {row["id"]: row["updated_at"] for row in rows}
+
+    def save_posts(self, publication_id: str, posts: List[Dict[str, Any]]) -> None:
+        """Insert or replace full post objects (as returned by GET_POST_BY_ID_QUERY)"""
+        with self._transaction():
+            self._db.executemany(
+                "INSERT INTO posts "
+                "(id, publication_id, title, brief, author_name, published_at, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET publication_id = excluded.publication_id, title = excluded.title, "
+                "brief = excluded.brief, author_name = excluded.author_name, published_at = excluded.published_at, "
+                "updated_at = excluded.updated_at, data = excluded.data",
+                [
+                    (
+                        post["id"],
+                        publication_id,
+                        post.get("title"),
+                        post.get("brief"),
+                        (post.get("author") or {}).get("name"),
+                        post.get("publishedAt"),
+                        post.get("updatedAt"),
+                        json.dumps(post),
+                    )
+                    for post in posts
+                ],
+            )
+            self._db.executemany("DELETE FROM dirty_posts WHERE id = ?", [(post["id"],) for post in posts])
+
+    def mark_dirty(self, post_id: str) -> None:
+        """
+        Flag a mirrored post as outdated, e.g. after it was changed through this server
+
+        The post stays in listings and search, but ``post`` no longer returns
+        it, and the next sync fetches it again whatever its ``updatedAt``.
+        """
+        self._db.execute("INSERT OR IGNORE INTO dirty_posts (id) SELECT id FROM posts WHERE id = ?", (post_id,))
+
+    def dirty(self, publication_id: str) -> List[str]:
+        """Return the IDs of the outdated posts of a publication"""
+        rows = self._db.execute(
+            "SELECT dirty_posts.id FROM dirty_posts JOIN posts ON posts.id = dirty_posts.id WHERE posts.publication_id = ?",
+            (publication_id,),
+        ).fetchall()
+        return [row["id"] for row in rows]
+
+    def delete_post(self, post_id: str) -> None:
+        """Forget a post"""
+        with self._transaction():
+            self._db.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+            self._db.execute("DELETE FROM dirty_posts WHERE id = ?", (post_id,))
+
+    def prune(self, publication_id: str, keep: List[str]) -> int:
+        """Delete the posts of a publication that are not in ``keep``; returns how many"""
+        with self._transaction():
+            self._db.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT PRIMARY KEY)")
+            self._db.execute("DELETE FROM keep_ids")
+            self._db.executemany("INSERT OR IGNORE INTO keep_ids VALUES (?)", [(post_id,) for post_id in keep])
+            cursor = self._db.execute(
+                "DELETE FROM posts WHERE publication_id = ? AND id NOT IN (SELECT id FROM keep_ids)",
+                (publication_id,),
+            )
+            self._db.execute("DELETE FROM dirty_posts WHERE id NOT IN (SELECT id FROM posts)")
+        return cursor.rowcount
+
+    def latest(self, publication_id: str, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Return the newest posts of a publication
+
+        Args:
+            publication_id: The publication
+            limit: Number of posts to return
+            offset: Number of posts to skip
+
+        Returns:
+            Edges shaped like the ``searchPostsOfPublication`` response, each
+            with a "local:<offset>" cursor pointing after it
+        """
+        rows = self._db.execute(
+            "SELECT id, title, brief, author_name, published_at FROM posts "
+            "WHERE publication_id = ? ORDER BY published_at DESC LIMIT ? OFFSET ?",
+            (publication_id, limit, offset),
+        ).fetchall()
+        return [
+            {
+                "node": {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "brief": row["brief"],
+                    "publishedAt": row["published_at"],
+                    "author": {"name": row["author_name"]},
+                },
+                "cursor": f"{LOCAL_CURSOR_PREFIX}{offset + index + 1}",
+            }
+            for index, row in enumerate(rows)
+        ]
+
+    def is_synced(self, publication_id: str) -> bool:
+        """Check whether a publication has been mirrored"""
+        row = self._db.execute(
+            "SELECT 1 FROM publications WHERE id = ? AND synced_at IS NOT NULL", (publication_id,)
+        ).fetchone()
+        return row is not None
+
+    def search(self, query: str, publication_id: Optional[str] = None, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        """
+        Search the mirrored posts, best BM25 matches first
+
+        Args:
+            query: The search (see ``fts_query`` for the syntax)
+            publication_id: Only search this publication; None searches all
+            limit: Number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            A response shaped like ``searchPostsOfPublication``, with the
+            matching snippet as each post's brief. The cursor of each edge
+            and the end cursor are "local:<offset after it>".
+        """
+        match = fts_query(query)
+        if not match:
+            return {"data": {"searchPostsOfPublication": {"edges": [], "pageInfo": {"hasNextPage": False}}}}
+
+        sql = (
+            "SELECT posts.data, snippet(posts_fts, -1, '**', '**', '...', 16) AS snippet "
+            "FROM posts_fts JOIN posts ON posts.rowid = posts_fts.rowid "
+            "WHERE posts_fts MATCH ?"
+        )
+        params: List[Any] = [match]
+        if publication_id is not None:
+            sql += " AND posts.publication_id = ?"
+            params.append(publication_id)
+        sql += " ORDER BY bm25(posts_fts, ?, ?, ?) LIMIT ? OFFSET ?"
+        # Fetch one extra row to know whether there is a next page
+        params.extend([*FTS_WEIGHTS, limit + 1, offset])
+
+        rows = self._db.execute(sql, params).fetchall()
+        edges = []
+        for index, row in enumerate(rows[:limit]):
+            post = json.loads(row["data"])
+            edges.append({"node": {
+                "id": post.get("id"),
+                "title": post.get("title"),
+                "url": post.get("url"),
+                "slug": post.get("slug"),
+                "publishedAt": post.get("publishedAt"),
+                "author": post.get("author"),
+                "brief": row["snippet"],
+            }, "cursor": f"{LOCAL_CURSOR_PREFIX}{offset + index + 1}"})
+        page_info = {"hasNextPage": len(rows) > limit}
+        if page_info["hasNextPage"]:
+            page_info["endCursor"] = f"{LOCAL_CURSOR_PREFIX}{offset + limit}"
+        return {"data": {"searchPostsOfPublication": {"edges": edges, "pageInfo": page_info}}}
+
+    def post(self, post_id: str) -> Optional[Dict[str, Any]]:
+        """Return the full mirrored post, if any and not outdated (see ``mark_dirty``)"""
+        row = self._db.execute(
+            "SELECT data FROM posts WHERE id = ? AND id NOT IN (SELECT id FROM dirty_posts)", (post_id,)
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+
+async def sync_publication(mirror: PostMirror, api: PublicationApi, hostname: str, full: bool = False, concurrency: int = SYNC_CONCURRENCY) -> Dict[str, Any]:
+    """
+    Bring the mirror of one publication up to date
+
+    Args:
+        mirror: The mirror to write to
+        api: The API calls to make
+        hostname: The hostname of the publication
+        full: Walk every post instead of stopping at the watermark, and
+            delete mirrored posts that no longer exist
+        concurrency: Maximum number of post details fetched at the same time
+
+    Returns:
+        A summary with the number of posts listed, saved and removed, and
+        the IDs of the posts that could not be fetched. Those are skipped
+        and the watermark is kept below them, so the next sync retries them.
+    """
+    publication = await api.resolve(hostname)
+    if not publication:
+        raise ValueError(f"Could not find publication with hostname '{hostname}'")
+    publication_id = publication["id"]
+    mirror.save_publication(hostname, publication)
+
+    watermark = None if full else mirror.watermark(publication_id)
+    if watermark is None:
+        full = True
+
+    async def fetch_page(first: int, after: Optional[str]):
+        data = await api.fetch(SYNC_POSTS_OF_PUBLICATION_QUERY, {
+            "first": first,
+            "after": after,
+            "filter": {"publicationId": publication_id, "query": ""},
+        })
+        if not data or "errors" in data or not data.get("data"):
+            raise PageFetchError("Could not list the posts of the publication", data)
+        connection = data["data"].get("searchPostsOfPublication") or {}
+        page_info = connection.get("pageInfo") or {}
+        return connection.get("edges") or [], page_info.get("endCursor") if page_info.get("hasNextPage") else None
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    listed: List[str] = []
+    failed: List[str] = []
+    saved = 0
+
+    async def fetch_posts(post_ids: List[str]) -> int:
+        # A post that cannot be fetched is skipped; the others are still saved
+        results = await asyncio.gather(*(fetch_post(api, post_id, semaphore) for post_id in post_ids), return_exceptions=True)
+        posts = []
+        for post_id, result in zip(post_ids, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning("Could not sync post %s: %s", post_id, result)
+                failed.append(post_id)
+                continue
+            posts.append(result)
+        mirror.save_posts(publication_id, posts)
+        return len(posts)
+
+    # publishedAt of the oldest listed post that could not be fetched
+    retry_from: Optional[str] = None
+    pages = iter_pages(fetch_page, None, LISTING_PAGE_SIZE)
+    try:
+        async for edges, _ in pages:
+            nodes = [edge["node"] for edge in edges if edge.get("node")]
+            if not full:
+                # Posts are listed newest first, so stop at the watermark
+                fresh = [node for node in nodes if (node.get("publishedAt") or "") > watermark]
+                reached_watermark = len(fresh) < len(nodes)
+                nodes = fresh
+            listed.extend(node["id"] for node in nodes)
+
+            stored = mirror.updated_at([node["id"] for node in nodes])
+            dirty = set(mirror.dirty(publication_id))
+            changed = [
+                node["id"] for node in nodes
+                if node["id"] not in stored or stored[node["id"]] != node.get("updatedAt") or node["id"] in dirty
+            ]
+            saved += await fetch_posts(changed)
+            published = {node["id"]: node.get("publishedAt") or "" for node in nodes}
+            for post_id in failed:
+                if post_id in published and (retry_from is None or published[post_id] < retry_from):
+                    retry_from = published[post_id]
+
+            if not full and reached_watermark:
+                break
+    finally:
+        await pages.aclose()
+
+    # Posts changed through this server but older than the watermark
+    dirty = [post_id for post_id in mirror.dirty(publication_id) if post_id not in listed]
+    if dirty:
+        saved += await fetch_posts(dirty)
+
+    removed = mirror.prune(publication_id, listed) if full else 0
+    mirror.mark_synced(publication_id, full, before=retry_from)
+    logger.info(
+        "Synced %s: %s listed, %s saved, %s failed, %s removed (full=%s)",
+        hostname, len(listed), saved, len(failed), removed, full,
+    )
+    return {"host": hostname, "listed": len(listed), "saved": saved, "failed": failed, "removed": removed, "full": full}
+
+
+async def sync_loop(mirror: PostMirror, api: PublicationApi, hosts: List[str], interval: float = SYNC_INTERVAL, full_interval: float = SYNC_FULL_INTERVAL) -> None:
+    """
+    Keep the mirror of ``hosts`` up to date until cancelled
+
+    Every ``interval`` seconds each publication is synced incrementally;
+    once ``full_interval`` seconds have passed since its last full sync, a
+    full sync is run instead.
+    """
+    while True:
+        for host in hosts:
+            known = mirror.publication(host)
+            full = not known or not known["full_synced_at"] or time.time() - known["full_synced_at"] >= full_interval
+            try:
+                await sync_publication(mirror, api, host, full=full)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Could not sync %s: %s", host, e)
+        await asyncio.sleep(interval)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: sync publications into the mirror once"""
+    from hashnode_mcp.http_client import close_client
+    # The command line uses the server's client and caches
+    from hashnode_mcp.mcp_server import publication_api
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Mirror Hashnode publications into a local SQLite database")
+    parser.add_argument("hosts", nargs="*", default=parse_hosts(SYNC_HOSTS), help="Publication hostnames (default: HASHNODE_SYNC_HOSTS)")
+    parser.add_argument("--db", default=SYNC_DB, help="Database file (default: HASHNODE_SYNC_DB)")
+    parser.add_argument("--full", action="store_true", help="Walk every post and drop deleted ones")
+    args = parser.parse_args(argv)
+    if not args.db or not args.hosts:
+        parser.error("a database (--db or HASHNODE_SYNC_DB) and at least one hostname are required")
+
+    mirror = PostMirror(args.db)
+
+    async def run() -> bool:
+        ok = True
+        try:
+            for host in args.hosts:
+                try:
+                    await sync_publication(mirror, publication_api, host, full=args.full)
+                except Exception as e:
+                    logger.error("Could not sync %s: %s", host, e)
+                    ok = False
+        finally:
+            await close_client()
+        return ok
+
+    try:
+        return 0 if asyncio.run(run()) else 1
+    finally:
+        mirror.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,115 @@
 Utility functions for the Hashnode MCP server.
 """
 import json
+from typing import Optional
+
+from hashnode_mcp.budget import CONTINUATION_RESERVE, SHORT_BRIEF_CHARS, bytes_left, clip, fit_items, text_size
+from hashnode_mcp.formatting import Block, Each, Text, Value, compile_renderer, date, truncate
+
+# Field specs of the Markdown documents (see hashnode_mcp.formatting)
+
+
+def _post_listing_entry(heading: str) -> tuple:
+    """Specs of a post in a publication listing or search results"""
+    return (
+        Value("title", heading + " {}\n", when="always", default="Untitled"),
+        Value("url", "URL: {}\n"),
+        Value("slug", "Slug: {}\n", when="always", default=""),
+        Value("publishedAt", "Date: {}\n"),
+        Block("author", (
+            Value("name", "Author: {}\n", when="always", default="Unknown"),
+            Value("username", "Author Username: {}\n", when="present"),
+            Value("profilePicture", "Author Profile Picture: {}\n"),
+        )),
+        Block("coverImage", (
+            Value("url", "Cover Image: {}\n", when="present"),
+        )),
+        Value("brief", "Brief: {}\n\n", when="always", default="No description available."),
+    )
+
+
+def _feed_entry(date_format: str, author: tuple, with_url: bool = True) -> tuple:
+    """Specs of a post in a feed (top articles, articles by tag, latest articles)"""
+    return (
+        Value("title", "## {}\n", when="always", default="Untitled"),
+        Value("id", "ID: {}\n", when="present"),
+    ) + ((Value("url", "URL: {}\n", when="present"),) if with_url else ()) + (
+        Block("author", author),
+        Value("publishedAt", "Published: {}\n", transform=date(date_format)),
+        Value("brief", "Description: {}\n", transform=truncate(200)),
+        Text("\n"),
+    )
+
+
+def _brief_entry(heading: str, brief_label: str, brief_chars: int) -> tuple:
+    """Specs of a post cut down to fit the output budget: title, ID and a short brief"""
+    return (
+        Value("title", heading + " {}\n", when="always", default="Untitled"),
+        Value("id", "ID: {}\n", when="present"),
+        Value("brief", brief_label + ": {}\n", transform=truncate(brief_chars)),
+        Text("\n"),
+    )
+
+
+def _edge_levels(*variants: tuple) -> tuple:
+    """
+    Compile the specs of a post at each level of detail, most detailed first
+    
+    Returns:
+        Renderers of a connection edge, for ``fit_items``
+    """
+    renderers = [compile_renderer(specs) for specs in variants]
+    return tuple((lambda edge, render=render: render(edge["node"])) for render in renderers)
+
+
+_render_publication_posts = compile_renderer((
+    Value("title", "# Publication: {}\n\n", when="always", default="Untitled"),
+    Value("isTeam", "Team Publication: {}\n\n", when="always", default=False,
+          transform=lambda is_team: "Yes" if is_team else "No"),
+    Block("posts", (
+        Each("edges", _post_listing_entry("###"), header="## Posts\n\n"),
+    ), when="present"),
+))
+
+_SEARCH_RESULT_LEVELS = _edge_levels(
+    _post_listing_entry("##"),
+    _brief_entry("##", "Brief", 200),
+    _brief_entry("##", "Brief", SHORT_BRIEF_CHARS),
+)
+
+_render_pagination = compile_renderer((
+    Block("pageInfo", (
+        Text("## Pagination\n"),
+        Value("hasNextPage", "Has Next Page: {}\n", when="always", default=False),
+        Value("endCursor", "End Cursor: {}\n",
+              when=lambda page_info: page_info.get("hasNextPage", False) and "endCursor" in page_info),
+        Text("\n"),
+    ), when="present"),
+))
+
+# Top articles and articles by tag show the author with the username
+_FEED_AUTHOR = (
+    Value("name", "Author: {}", when="always", default="Unknown"),
+    Value("username", " (@{})", when="present"),
+    Text("\n"),
+)
+
+_render_feed_posts = compile_renderer((
+    Each("edges", _feed_entry("%b %d, %Y", _FEED_AUTHOR)),
+))
+
+# Also used by get_latest_articles to stop paging once the budget is spent
+LATEST_ARTICLE_LEVELS = _edge_levels(
+    _feed_entry("%b %d", (Value("name", "Author: {}\n", when="present"),), with_url=False),
+    _brief_entry("##", "Description", 200),
+    _brief_entry("##", "Description", SHORT_BRIEF_CHARS),
+)
+
+
+def budget_note(shown: int, total: int, noun: str, rest: str) -> str:
+    """Explain that a listing was cut short to fit the output budget"""
+    return f"\n(Output budget reached: showing {shown} of {total} {noun}. {rest})\n"
+
 
 def format_posts(posts_data: dict) -> str:
     """
@@ -17,100 +126,74 @@ def format_posts(posts_data: dict) -> str:
         return "No data found."
     
     if "publication" in posts_data["data"] and posts_data["data"]["publication"]:
-        publication = posts_data["data"]["publication"]
-        result = f"# Publication: {publication.get('title', 'Untitled')}\n\n"
-        result += f"Team Publication: {'Yes' if publication.get('isTeam', False) else 'No'}\n\n"
-        
-        if "posts" in publication and "edges" in publication["posts"]:
-            result += "## Posts\n\n"
-            for edge in publication["posts"]["edges"]:
-                if "node" in edge:
-                    node = edge["node"]
-                    result += f"### {node.get('title', 'Untitled')}\n"
-                    
-                    if "url" in node and node["url"]:
-                        result += f"URL: {node['url']}\n"
-                    
-                    result += f"Slug: {node.get('slug', '')}\n"
-                    
-                    if "publishedAt" in node and node["publishedAt"]:
-                        result += f"Date: {node['publishedAt']}\n"
-                    
-                    if "author" in node and node["author"]:
-                        author = node["author"]
-                        result += f"Author: {author.get('name', 'Unknown')}\n"
-                        if "username" in author:
-                            result += f"Author Username: {author['username']}\n"
-                        if "profilePicture" in author and author["profilePicture"]:
-                            result += f"Author Profile Picture: {author['profilePicture']}\n"
-                    
-                    if "coverImage" in node and node["coverImage"] and "url" in node["coverImage"]:
-                        result += f"Cover Image: {node['coverImage']['url']}\n"
-                    
-                    result += f"Brief: {node.get('brief', 'No description available.')}\n\n"
-        
-        return result
+        return _render_publication_posts(posts_data["data"]["publication"])
     
     return "No publication data found."
 
-def format_search_results(search_data: dict) -> str:
+def format_search_results(search_data: dict, limit: Optional[int] = None, next_page: Optional[int] = None) -> str:
     """
     Format search results data for display
     
     Args:
         search_data: The data returned from the Hashnode API search
+        limit: Output budget in bytes (see hashnode_mcp.budget); None for no limit
+        next_page: Page number to suggest for the next page, if any
         
     Returns:
-        A formatted string representation of the search results
+        A formatted string representation of the search results. When not
+        every post fits in ``limit``, the end cursor points after the last
+        post shown.
     """
     if not search_data or "data" not in search_data or not search_data["data"]:
         return "No search results found."
     
     if "searchPostsOfPublication" in search_data["data"]:
         search_results = search_data["data"]["searchPostsOfPublication"]
-        result = "# Search Results\n\n"
         
         if "edges" in search_results and search_results["edges"]:
-            for edge in search_results["edges"]:
-                if "node" in edge:
-                    node = edge["node"]
-                    result += f"## {node.get('title', 'Untitled')}\n"
-                    
-                    if "url" in node and node["url"]:
-                        result += f"URL: {node['url']}\n"
-                    
-                    result += f"Slug: {node.get('slug', '')}\n"
-                    
-                    if "publishedAt" in node and node["publishedAt"]:
-                        result += f"Date: {node['publishedAt']}\n"
-                    
-                    if "author" in node and node["author"]:
-                        author = node["author"]
-                        result += f"Author: {author.get('name', 'Unknown')}\n"
-                        if "username" in author:
-                            result += f"Author Username: {author['username']}\n"
-                        if "profilePicture" in author and author["profilePicture"]:
-                            result += f"Author Profile Picture: {author['profilePicture']}\n"
-                    
-                    if "coverImage" in node and node["coverImage"] and "url" in node["coverImage"]:
-                        result += f"Cover Image: {node['coverImage']['url']}\n"
-                    
-                    result += f"Brief: {node.get('brief', 'No description available.')}\n\n"
-            
-            if "pageInfo" in search_results:
-                page_info = search_results["pageInfo"]
-                result += "## Pagination\n"
-                result += f"Has Next Page: {page_info.get('hasNextPage', False)}\n"
-                if page_info.get('hasNextPage', False) and "endCursor" in page_info:
-                    result += f"End Cursor: {page_info['endCursor']}\n"
-                result += "\n"
-            
+            result = "# Search Results\n\n"
+            edges = [edge for edge in search_results["edges"] if edge and edge.get("node")]
+            fitted = fit_items(edges, _SEARCH_RESULT_LEVELS, bytes_left(limit, text_size(result) + CONTINUATION_RESERVE))
+            result += "".join(fitted.items)
+            
+            if fitted.complete:
+                result += _render_pagination(search_results)
+                if next_page:
+                    result += f"Next Page: {next_page}\n"
+            else:
+                # Continue right after the last post shown
+                cursor = edges[len(fitted.items) - 1].get("cursor")
+                result += _render_pagination({"pageInfo": {"hasNextPage": True, "endCursor": cursor}})
+                result += budget_note(len(fitted.items), len(edges), "results", "Pass the end cursor to continue.")
             return result
         else:
             return "No matching posts found."
     
     return "No search results found."
 
+def format_latest_articles(publication_title: str, edges: list, limit: Optional[int] = None) -> str:
+    """
+    Format the latest articles of a publication for display
+    
+    Args:
+        publication_title: The title of the publication
+        edges: The edges of the publication's posts connection
+        limit: Output budget in bytes (see hashnode_mcp.budget); None for no limit
+        
+    Returns:
+        A formatted string representation of the articles, ending with the
+        cursor to continue from when not every article fits in ``limit``
+    """
+    result = f"# Latest Articles from {publication_title}\n\n"
+    edges = [edge for edge in edges if edge and edge.get("node")]
+    fitted = fit_items(edges, LATEST_ARTICLE_LEVELS, bytes_left(limit, text_size(result) + CONTINUATION_RESERVE))
+    result += "".join(fitted.items)
+    
+    if not fitted.complete:
+        cursor = edges[len(fitted.items) - 1].get("cursor")
+        result += budget_note(len(fitted.items), len(edges), "articles", f'Call again with cursor="{cursor}" for the rest.')
+    return result
+
 # GraphQL query constants
 TEST_QUERY = """
 query {
@@ -246,6 +329,21 @@ query Post($id: ID!) {
 }
 """
 
+GET_VIEWER_PUBLICATION_QUERY = """
+query ViewerPublication {
+  me {
+    publications(first: 1) {
+      edges {
+        node {
+          id
+          title
+        }
+      }
+    }
+  }
+}
+"""
+
 GET_PUBLICATION_ID_QUERY = """
 query GetPublicationByHost($host: String!) {
     publication(host: $host) {
@@ -305,6 +403,33 @@ query SearchPostsOfPublication(
 }
 """
 
+SYNC_POSTS_OF_PUBLICATION_QUERY = """
+query SyncPostsOfPublication(
+  $first: Int!,
+  $after: String,
+  $filter: SearchPostsOfPublicationFilter!
+) {
+  searchPostsOfPublication(
+    first: $first,
+    after: $after,
+    sortBy: DATE_PUBLISHED_DESC,
+    filter: $filter
+  ) {
+    edges {
+      node {
+        id
+        publishedAt
+        updatedAt
+      }
+    }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+  }
+}
+"""
+
 GET_TOP_ARTICLES_QUERY = """
 query GetTopArticles($first: Int!) {
   feed(first: $first) {
@@ -586,12 +711,98 @@ def format_create_webhook_result(webhook_data: dict) -> str:
     
     return "Failed to create webhook."
 
-def format_post_details(post_data: dict) -> str:
+def _post_content(post: dict, limit: Optional[int] = None) -> str:
+    """
+    Render the Content section of post details
+    
+    Args:
+        post: The post
+        limit: Bytes available for the section; None for no limit. The body
+            is cut to its first 1000 characters either way
+    """
+    if not ("content" in post and post["content"]):
+        return ""
+    content = post["content"]
+    result = "\n## Content\n\n"
+    
+    # Show the text when fetched, otherwise whichever format was requested
+    shown = next((name for name in ("text", "markdown", "html") if content.get(name)), None)
+    others = [name for name in ("markdown", "html") if name != shown and content.get(name)]
+    
+    if shown:
+        # Limit the content to a reasonable length for display
+        text = content[shown]
+        max_length = 1000
+        shown_text = text[:max_length]
+        if limit is not None:
+            # Leave room for the heading and the notes around the body
+            shown_text = clip(shown_text, limit - text_size(result) - CONTINUATION_RESERVE)
+        if len(shown_text) < len(text):
+            text = shown_text + "...\n\n(Content truncated for display."
+            if others:
+                text += f" Full content available in the {' or '.join(others)} fields.)"
+            else:
+                text += f" Read the rest with get_article_content or the hashnode://post/{post.get('id')}/{shown} resource.)"
+        result += text
+    
+    # Note: We're not including the full markdown or HTML content in the display
+    # as they could be very large, but we note their availability
+    if "markdown" in others:
+        result += "\n\n(Full markdown content available but not displayed due to length)"
+    
+    if "html" in others:
+        result += "\n\n(Full HTML content available but not displayed due to length)"
+    
+    return result
+
+
+_render_post_details = compile_renderer((
+    Value("title", "# {}\n\n", when="always", default="Untitled"),
+    Value("subtitle", "## {}\n\n"),
+    # Basic post information
+    Text("## Post Information\n\n"),
+    Value("id", "ID: {}\n", when="always", default="Unknown"),
+    Value("slug", "Slug: {}\n", when="present"),
+    Value("url", "URL: {}\n"),
+    Value("canonicalUrl", "Canonical URL: {}\n"),
+    Value("publishedAt", "Published: {}\n"),
+    Value("updatedAt", "Last Updated: {}\n"),
+    Value("readTimeInMinutes", "Read Time: {} minutes\n", when="present"),
+    Value("views", "Views: {}\n", when="present"),
+    Block("author", (
+        Text("\n## Author\n\n"),
+        Value("name", "Name: {}\n", when="always", default="Unknown"),
+        Value("username", "Username: {}\n", when="present"),
+        Value("id", "ID: {}\n", when="present"),
+        Value("profilePicture", "Profile Picture: {}\n"),
+    )),
+    Block("publication", (
+        Text("\n## Publication\n\n"),
+        Value("title", "Title: {}\n", when="always", default="Unknown"),
+        Value("displayTitle", "Display Title: {}\n", when="present"),
+        Value("id", "ID: {}\n", when="present"),
+        Value("url", "URL: {}\n", when="present"),
+    )),
+    Block("coverImage", (
+        Text("\n## Cover Image\n\n"),
+        Value("url", "URL: {}\n", when="present"),
+        Value("isPortrait", "Is Portrait: {}\n", when="present"),
+        Value("photographer", "Photographer: {}\n"),
+        Value("attribution", "Attribution: {}\n"),
+    )),
+    Value("brief", "\n## Brief\n\n{}\n"),
+))
+
+
+def format_post_details(post_data: dict, limit: Optional[int] = None) -> str:
     """
     Format post details data for display
     
     Args:
         post_data: The data returned from the Hashnode API for a specific post
+        limit: Output budget in bytes (see hashnode_mcp.budget); the body is
+            cut to what is left of it after the other fields. None shows the
+            first 1000 characters of the body.
         
     Returns:
         A formatted string representation of the post details
@@ -601,107 +812,8 @@ def format_post_details(post_data: dict) -> str:
     
     if "post" in post_data["data"] and post_data["data"]["post"]:
         post = post_data["data"]["post"]
-        result = f"# {post.get('title', 'Untitled')}\n\n"
-        
-        if "subtitle" in post and post["subtitle"]:
-            result += f"## {post['subtitle']}\n\n"
-        
-        # Basic post information
-        result += "## Post Information\n\n"
-        result += f"ID: {post.get('id', 'Unknown')}\n"
-        result += f"Slug: {post.get('slug', 'Unknown')}\n"
-        
-        if "url" in post and post["url"]:
-            result += f"URL: {post['url']}\n"
-        
-        if "canonicalUrl" in post and post["canonicalUrl"]:
-            result += f"Canonical URL: {post['canonicalUrl']}\n"
-        
-        if "publishedAt" in post and post["publishedAt"]:
-            result += f"Published: {post['publishedAt']}\n"
-        
-        if "updatedAt" in post and post["updatedAt"]:
-            result += f"Last Updated: {post['updatedAt']}\n"
-        
-        if "readTimeInMinutes" in post:
-            result += f"Read Time: {post['readTimeInMinutes']} minutes\n"
-        
-        if "views" in post:
-            result += f"Views: {post['views']}\n"
-        
-        # Author information
-        if "author" in post and post["author"]:
-            author = post["author"]
-            result += "\n## Author\n\n"
-            result += f"Name: {author.get('name', 'Unknown')}\n"
-            
-            if "username" in author:
-                result += f"Username: {author['username']}\n"
-            
-            if "id" in author:
-                result += f"ID: {author['id']}\n"
-            
-            if "profilePicture" in author and author["profilePicture"]:
-                result += f"Profile Picture: {author['profilePicture']}\n"
-        
-        # Publication information
-        if "publication" in post and post["publication"]:
-            publication = post["publication"]
-            result += "\n## Publication\n\n"
-            result += f"Title: {publication.get('title', 'Unknown')}\n"
-            
-            if "displayTitle" in publication:
-                result += f"Display Title: {publication['displayTitle']}\n"
-            
-            if "id" in publication:
-                result += f"ID: {publication['id']}\n"
-            
-            if "url" in publication:
-                result += f"URL: {publication['url']}\n"
-        
-        # Cover image
-        if "coverImage" in post and post["coverImage"]:
-            cover_image = post["coverImage"]
-            result += "\n## Cover Image\n\n"
-            
-            if "url" in cover_image:
-                result += f"URL: {cover_image['url']}\n"
-            
-            if "isPortrait" in cover_image:
-                result += f"Is Portrait: {cover_image['isPortrait']}\n"
-            
-            if "photographer" in cover_image and cover_image["photographer"]:
-                result += f"Photographer: {cover_image['photographer']}\n"
-            
-            if "attribution" in cover_image and cover_image["attribution"]:
-                result += f"Attribution: {cover_image['attribution']}\n"
-        
-        # Brief
-        if "brief" in post and post["brief"]:
-            result += f"\n## Brief\n\n{post['brief']}\n"
-        
-        # Content
-        if "content" in post and post["content"]:
-            content = post["content"]
-            result += "\n## Content\n\n"
-            
-            if "text" in content and content["text"]:
-                # Limit the text content to a reasonable length for display
-                text = content["text"]
-                max_length = 1000
-                if len(text) > max_length:
-                    text = text[:max_length] + "...\n\n(Content truncated for display. Full content available in the markdown or html fields.)"
-                result += text
-            
-            # Note: We're not including the full markdown or HTML content in the display
-            # as they could be very large, but we note their availability
-            if "markdown" in content and content["markdown"]:
-                result += "\n\n(Full markdown content available but not displayed due to length)"
-            
-            if "html" in content and content["html"]:
-                result += "\n\n(Full HTML content available but not displayed due to length)"
-        
-        return result
+        result = _render_post_details(post)
+        return result + _post_content(post, bytes_left(limit, text_size(result)))
     
     return "No post data found."
 
@@ -719,49 +831,10 @@ def format_top_articles(top_articles_data: dict) -> str:
         return "No top articles data found."
     
     if "feed" in top_articles_data["data"] and "edges" in top_articles_data["data"]["feed"]:
-        edges = top_articles_data["data"]["feed"]["edges"]
-        result = "# Top Articles on Hashnode\n\n"
-        
-        if not edges:
+        if not top_articles_data["data"]["feed"]["edges"]:
             return "No top articles found."
         
-        for edge in edges:
-            if "node" in edge:
-                node = edge["node"]
-                title = node.get("title", "Untitled")
-                result += f"## {title}\n"
-                
-                if "id" in node:
-                    result += f"ID: {node['id']}\n"
-                
-                if "url" in node:
-                    result += f"URL: {node['url']}\n"
-                
-                if "author" in node and node["author"]:
-                    author = node["author"]
-                    result += f"Author: {author.get('name', 'Unknown')}"
-                    if "username" in author:
-                        result += f" (@{author['username']})"
-                    result += "\n"
-                
-                if "publishedAt" in node and node["publishedAt"]:
-                    from datetime import datetime
-                    try:
-                        published_date = datetime.fromisoformat(node["publishedAt"].replace("Z", "+00:00"))
-                        result += f"Published: {published_date.strftime('%b %d, %Y')}\n"
-                    except:
-                        result += f"Published: {node['publishedAt']}\n"
-                
-                if "brief" in node and node["brief"]:
-                    brief = node["brief"]
-                    max_length = 200
-                    if len(brief) > max_length:
-                        brief = brief[:max_length] + "..."
-                    result += f"Description: {brief}\n"
-                
-                result += "\n"
-        
-        return result
+        return "# Top Articles on Hashnode\n\n" + _render_feed_posts(top_articles_data["data"]["feed"])
     
     return "No top articles data found."
 
@@ -781,48 +854,11 @@ def format_articles_by_tag(tag_data: dict) -> str:
     if "tag" in tag_data["data"] and tag_data["data"]["tag"]:
         tag = tag_data["data"]["tag"]
         tag_name = tag.get("name", tag.get("slug", "Unknown Tag"))
-        result = f"# Articles with Tag: {tag_name}\n\n"
         
         if "posts" not in tag or "edges" not in tag["posts"] or not tag["posts"]["edges"]:
             return f"No articles found with tag '{tag_name}'."
         
-        for edge in tag["posts"]["edges"]:
-            if "node" in edge:
-                node = edge["node"]
-                title = node.get("title", "Untitled")
-                result += f"## {title}\n"
-                
-                if "id" in node:
-                    result += f"ID: {node['id']}\n"
-                
-                if "url" in node:
-                    result += f"URL: {node['url']}\n"
-                
-                if "author" in node and node["author"]:
-                    author = node["author"]
-                    result += f"Author: {author.get('name', 'Unknown')}"
-                    if "username" in author:
-                        result += f" (@{author['username']})"
-                    result += "\n"
-                
-                if "publishedAt" in node and node["publishedAt"]:
-                    from datetime import datetime
-                    try:
-                        published_date = datetime.fromisoformat(node["publishedAt"].replace("Z", "+00:00"))
-                        result += f"Published: {published_date.strftime('%b %d, %Y')}\n"
-                    except:
-                        result += f"Published: {node['publishedAt']}\n"
-                
-                if "brief" in node and node["brief"]:
-                    brief = node["brief"]
-                    max_length = 200
-                    if len(brief) > max_length:
-                        brief = brief[:max_length] + "..."
-                    result += f"Description: {brief}\n"
-                
-                result += "\n"
-        
-        return result
+        return f"# Articles with Tag: {tag_name}\n\n" + _render_feed_posts(tag["posts"])
     
     return "No tag data found."
 
@@ -894,3 +930,39 @@ def format_user_info(user_data: dict) -> str:
         return result
     
     return "No user data found."
+
+
+def format_user_summary(user: dict) -> str:
+    """
+    Format a user as a single compact line, for listing many users at once
+    
+    Args:
+        user: The ``user`` object returned by GET_USER_INFO_QUERY
+        
+    Returns:
+        A one-line markdown list item
+    """
+    result = f"- @{user.get('username', 'unknown')}: {user.get('name') or 'Unknown'}"
+    result += f" | Followers: {user.get('followersCount', 0)} | Following: {user.get('followingsCount', 0)}"
+    
+    social_media = user.get("socialMediaLinks") or {}
+    links = [social_media[key] for key in ("website", "github", "twitter", "linkedin") if social_media.get(key)]
+    if links:
+        result += f" | Links: {', '.join(links)}"
+    
+    publications = [
+        edge["node"].get("title", "Untitled")
+        for edge in (user.get("publications") or {}).get("edges") or []
+        if edge.get("node")
+    ]
+    if publications:
+        result += f" | Publications: {', '.join(publications)}"
+    
+    bio = ((user.get("bio") or {}).get("text") or "").strip()
+    if bio:
+        bio = " ".join(bio.split())
+        if len(bio) > 100:
+            bio = bio[:100] + "..."
+        result += f" | Bio: {bio}"
+    
+    return result + "\n"
@@ -17,5 +17,4 @@ load_dotenv()
 from hashnode_mcp.mcp_server import main
 
 if __name__ == "__main__":
-    print("Starting Hashnode MCP server...")
     main()
@@ -26,6 +26,8 @@ setup(
     entry_points={
         "console_scripts": [
             "hashnode-mcp-server=hashnode_mcp.mcp_server:main",
+            "hashnode-export=hashnode_mcp.export:main",
+            "hashnode-sync=hashnode_mcp.sync:main",
         ],
     },
 )
@@ -0,0 +1,82 @@
+"""Shared fixtures for the test suite"""
+import json
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module whose ``monotonic`` only moves when told to"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class FakeApi:
+    """
+    Answers GraphQL requests from handlers registered by operation name
+
+    A handler takes the request variables and returns the ``data`` of the
+    response, or raises ``LookupError`` to answer with a GraphQL error.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.requests = []
+
+    def on(self, operation: str, handler) -> None:
+        self.handlers[operation] = handler
+
+    def count(self, operation: str) -> int:
+        return sum(1 for name, _ in self.requests if name == operation)
+
+    def __call__(self, request):
+        import httpx
+
+        from hashnode_mcp.graphql import operation_name
+
+        body = json.loads(request.content)
+        name = operation_name(body["query"])
+        variables = body.get("variables") or {}
+        self.requests.append((name, variables))
+        try:
+            data = self.handlers[name](variables)
+        except LookupError as e:
+            return httpx.Response(200, json={"errors": [{"message": str(e)}]})
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Route every API request to a ``FakeApi`` and start from empty caches"""
+    import httpx
+
+    from hashnode_mcp import http_client, mcp_server
+    from hashnode_mcp.ratelimit import AdaptiveRateLimiter
+
+    fake = FakeApi()
+    # Its lock belongs to the event loop of the first test that used it
+    monkeypatch.setattr(mcp_server, "rate_limiter", AdaptiveRateLimiter())
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(fake)))
+    monkeypatch.setattr(mcp_server, "BATCHING_ENABLED", False)
+    monkeypatch.setattr(mcp_server, "post_mirror", None)
+    mcp_server.response_cache.clear()
+    mcp_server.entity_store.clear()
+    mcp_server.host_cache.invalidate()
+    mcp_server.viewer_cache.invalidate()
+    mcp_server.content_store.clear()
+    mcp_server.search_cursors.invalidate(lambda key: True)
+    return fake
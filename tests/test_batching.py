@@ -0,0 +1,78 @@
+"""Tests for the batching of concurrent read queries"""
+import asyncio
+
+from hashnode_mcp.batching import QueryBatcher
+from hashnode_mcp.utils import GET_POST_BY_ID_QUERY, GET_USER_INFO_QUERY
+
+
+def run_batch(queries):
+    sent = []
+
+    async def send(query, variables, label=None):
+        sent.append(label)
+        return {"data": {}}
+
+    async def main():
+        batcher = QueryBatcher(send, window=0.01)
+        await asyncio.gather(*(batcher.load(query, variables) for query, variables in queries))
+
+    asyncio.run(main())
+    return sent
+
+
+def test_merged_batch_keeps_the_label_of_its_queries():
+    sent = run_batch([(GET_POST_BY_ID_QUERY, {"id": "p1"}), (GET_POST_BY_ID_QUERY, {"id": "p2"})])
+
+    assert sent == ["GET_POST_BY_ID_QUERY"]
+
+
+def test_mixed_batch_has_no_shared_label():
+    sent = run_batch([(GET_POST_BY_ID_QUERY, {"id": "p1"}), (GET_USER_INFO_QUERY, {"username": "writer"})])
+
+    assert sent == [None]
+
+
+def test_crashed_dispatch_fails_its_queries():
+    async def send(query, variables, label=None):
+        # Not a dict, so splitting the merged response fails
+        return None
+
+    async def main():
+        batcher = QueryBatcher(send, window=0.01)
+        results = await asyncio.gather(
+            batcher.load(GET_POST_BY_ID_QUERY, {"id": "p1"}),
+            batcher.load(GET_POST_BY_ID_QUERY, {"id": "p2"}),
+            return_exceptions=True,
+        )
+        return batcher, results
+
+    batcher, results = asyncio.run(main())
+
+    assert all(isinstance(result, AttributeError) for result in results)
+    assert not batcher._dispatches
+
+
+def test_rejected_batch_is_sent_again_query_by_query():
+    sent = []
+
+    async def send(query, variables, label=None):
+        sent.append(variables)
+        if "id_b0" in variables:
+            # One malformed ID fails validation of the whole merged document
+            return {"data": None, "errors": [{"message": "Invalid ID"}]}
+        if variables["id"] == "bad":
+            return {"data": None, "errors": [{"message": "Invalid ID"}]}
+        return {"data": {"post": {"id": variables["id"]}}}
+
+    async def main():
+        batcher = QueryBatcher(send, window=0.01)
+        return await asyncio.gather(
+            batcher.load(GET_POST_BY_ID_QUERY, {"id": "p1"}),
+            batcher.load(GET_POST_BY_ID_QUERY, {"id": "bad"}),
+        )
+
+    good, bad = asyncio.run(main())
+
+    assert good == {"data": {"post": {"id": "p1"}}}
+    assert bad == {"data": None, "errors": [{"message": "Invalid ID"}]}
+    assert len(sent) == 3
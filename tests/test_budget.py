@@ -0,0 +1,62 @@
+"""Tests for the output budget"""
+import pytest
+
+from hashnode_mcp.budget import BYTES_PER_TOKEN, clip, fit_items, min_size, parse_budget, text_size
+
+
+@pytest.mark.parametrize("budget, expected", [
+    (500, 500),
+    ("500", 500),
+    ("500 bytes", 500),
+    ("100 tokens", 100 * BYTES_PER_TOKEN),
+    (0, None),
+    ("0", None),
+])
+def test_parse_budget(budget, expected):
+    assert parse_budget(budget) == expected
+
+
+def test_parse_budget_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_budget("lots")
+
+
+def test_clip_never_splits_a_character():
+    text = "é" * 10
+
+    clipped = clip(text, 5)
+
+    assert clipped == "éé"
+    assert text_size(clipped) <= 5
+
+
+def test_fit_items_degrades_before_dropping_items():
+    levels = (lambda item: item * 10, lambda item: item)
+
+    fitted = fit_items(["a", "b", "c"], levels, limit=5)
+
+    assert fitted.items == ["a", "b", "c"]
+    assert fitted.level == 1
+    assert fitted.complete
+
+
+def test_fit_items_stops_at_the_first_item_that_overflows():
+    levels = (lambda item: item * 10, lambda item: item * 2)
+
+    fitted = fit_items(["a", "b", "c"], levels, limit=5)
+
+    assert fitted.items == ["aa", "bb"]
+    assert not fitted.complete
+
+
+def test_fit_items_always_includes_the_first_item():
+    fitted = fit_items(["long item"], (lambda item: item,), limit=1)
+
+    assert fitted.items == ["long item"]
+    assert fitted.complete
+
+
+def test_min_size_measures_the_briefest_level():
+    levels = (lambda item: item * 10, lambda item: item)
+
+    assert min_size(["ab", "c"], levels) == 3
@@ -0,0 +1,176 @@
+"""Tests for the response, viewer and hostname caches"""
+import pytest
+
+from hashnode_mcp.cache import PublicationHostCache, ResponseCache
+
+
+def test_host_cache_is_bounded():
+    cache = PublicationHostCache(max_entries=3)
+    cache.set("blog.example.com", {"id": "pub1", "title": "Blog"})
+    for index in range(10):
+        cache.lookup("blog.example.com")
+        cache.set(f"typo{index}.example.com", None)
+
+    assert len(cache) == 3
+    # Recently used hostnames stay
+    assert cache.lookup("https://Blog.example.com/") == (True, {"id": "pub1", "title": "Blog"})
+    assert cache.lookup("typo0.example.com") == (False, None)
+
+
+def test_host_cache_expires_unknown_hosts_sooner(clock, monkeypatch):
+    from hashnode_mcp import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "time", clock)
+    cache = PublicationHostCache(ttl=100, negative_ttl=10)
+    cache.set("blog.example.com", {"id": "pub1", "title": "Blog"})
+    cache.set("typo.example.com", None)
+
+    clock.advance(11)
+
+    assert cache.lookup("typo.example.com") == (False, None)
+    assert cache.lookup("blog.example.com")[0] is True
+
+
+def test_response_cache_is_bounded_by_size():
+    cache = ResponseCache(max_bytes=1000)
+    for index in range(20):
+        cache.set(f"key{index}", {"data": {"value": "x" * 100}}, ttl=60, label="TEST")
+
+    assert cache.size <= 1000
+    assert cache.get("key19") is not None
+    assert cache.get("key0") is None
+
+
+def test_unknown_host_is_looked_up_again_after_the_negative_ttl(api, clock, monkeypatch):
+    import asyncio
+
+    from hashnode_mcp import cache as cache_module
+    from hashnode_mcp import mcp_server
+
+    monkeypatch.setattr(cache_module, "time", clock)
+    monkeypatch.setattr(mcp_server, "host_cache", PublicationHostCache(ttl=3600, negative_ttl=300))
+    api.on("GetPublicationByHost", lambda variables: {"publication": None})
+
+    assert asyncio.run(mcp_server.resolve_publication("typo.example.com")) is None
+    assert asyncio.run(mcp_server.resolve_publication("typo.example.com")) is None
+    assert api.count("GetPublicationByHost") == 1
+
+    clock.advance(301)
+    api.on("GetPublicationByHost", lambda variables: {"publication": {"id": "pub1", "title": "Blog"}})
+
+    assert asyncio.run(mcp_server.resolve_publication("typo.example.com")) == {"id": "pub1", "title": "Blog"}
+    assert api.count("GetPublicationByHost") == 2
+
+
+def test_seeded_host_gets_its_real_title_once(api):
+    import asyncio
+
+    from hashnode_mcp import mcp_server
+
+    asyncio.run(mcp_server.seed_publication_hosts("blog.example.com=pub1"))
+    api.on("GetPublicationByHost", lambda variables: {"publication": {"id": "pub1", "title": "Blog"}})
+
+    assert asyncio.run(mcp_server.resolve_publication("blog.example.com")) == {"id": "pub1", "title": "Blog"}
+    assert asyncio.run(mcp_server.resolve_publication("blog.example.com")) == {"id": "pub1", "title": "Blog"}
+    assert api.count("GetPublicationByHost") == 1
+
+
+def test_seeded_host_keeps_its_id_when_the_title_lookup_fails(api):
+    import asyncio
+
+    from hashnode_mcp import mcp_server
+
+    def fail(variables):
+        raise LookupError("Internal error")
+
+    asyncio.run(mcp_server.seed_publication_hosts("blog.example.com=pub1"))
+    api.on("GetPublicationByHost", fail)
+
+    assert asyncio.run(mcp_server.resolve_publication("blog.example.com")) == {"id": "pub1", "title": None}
+
+
+def test_viewer_cache_expires_per_token(clock, monkeypatch):
+    from hashnode_mcp import cache as cache_module
+    from hashnode_mcp.cache import ViewerCache
+
+    monkeypatch.setattr(cache_module, "time", clock)
+    cache = ViewerCache(ttl=60)
+    cache.set("token-a", {"id": "pub1", "title": "Blog", "url": "https://blog.example.com"})
+
+    assert cache.get("token-a") == {"id": "pub1", "title": "Blog"}
+    assert cache.get("token-b") is None
+
+    clock.advance(60)
+
+    assert cache.get("token-a") is None
+
+
+def viewer(publication_id):
+    return {"me": {"publications": {"edges": [{"node": {"id": publication_id, "title": f"Blog {publication_id}"}}]}}}
+
+
+def test_viewer_publication_is_looked_up_again_after_the_ttl(api, clock, monkeypatch):
+    import asyncio
+
+    from hashnode_mcp import cache as cache_module
+    from hashnode_mcp import mcp_server
+    from hashnode_mcp.cache import ViewerCache
+
+    monkeypatch.setattr(cache_module, "time", clock)
+    monkeypatch.setattr(mcp_server, "viewer_cache", ViewerCache(ttl=3600))
+    api.on("ViewerPublication", lambda variables: viewer("pub1"))
+
+    assert asyncio.run(mcp_server.get_viewer_publication()) == {"id": "pub1", "title": "Blog pub1"}
+    assert asyncio.run(mcp_server.get_viewer_publication()) == {"id": "pub1", "title": "Blog pub1"}
+    assert api.count("ViewerPublication") == 1
+
+    clock.advance(3600)
+
+    asyncio.run(mcp_server.get_viewer_publication())
+    assert api.count("ViewerPublication") == 2
+
+
+def test_search_refreshes_the_viewer_publication_on_a_viewer_error(api):
+    import asyncio
+    import json
+
+    from hashnode_mcp import mcp_server
+
+    publications = iter(["pub1", "pub2"])
+    api.on("ViewerPublication", lambda variables: viewer(next(publications)))
+
+    def search(variables):
+        if variables["filter"]["publicationId"] == "pub1":
+            raise LookupError("Publication not found")
+        edges = [{"node": {"id": "p1", "title": "Found"}, "cursor": "c1"}]
+        return {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": False}}}
+
+    api.on("SearchPostsOfPublication", search)
+
+    result = json.loads(asyncio.run(mcp_server.search_articles("python", mode="remote", output="json", budget=0)))
+
+    assert [item["id"] for item in result["items"]] == ["p1"]
+    assert api.count("ViewerPublication") == 2
+    # The refreshed publication is kept for the next call
+    assert asyncio.run(mcp_server.get_viewer_publication()) == {"id": "pub2", "title": "Blog pub2"}
+    assert api.count("ViewerPublication") == 2
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_rejected_token_drops_its_viewer_publication(api, monkeypatch, status):
+    import asyncio
+
+    import httpx
+
+    from hashnode_mcp import http_client, mcp_server
+    from hashnode_mcp.utils import TEST_QUERY
+
+    monkeypatch.setenv("HASHNODE_PERSONAL_ACCESS_TOKEN", "token-a")
+    transport = httpx.MockTransport(lambda request: httpx.Response(status, json={"errors": [{"message": "Unauthorized"}]}))
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=transport))
+    mcp_server.viewer_cache.set("token-a", {"id": "pub1", "title": "Blog"})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(mcp_server.fetch_from_api(TEST_QUERY))
+
+    assert mcp_server.viewer_cache.get("token-a") is None
@@ -0,0 +1,143 @@
+"""Tests for the circuit breaker around API requests"""
+import asyncio
+
+import httpx
+import pytest
+
+from hashnode_mcp import cache, circuit, entities, mcp_server
+from hashnode_mcp.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, is_failure
+from hashnode_mcp.utils import GET_USER_INFO_QUERY
+
+
+@pytest.fixture
+def breaker(clock, monkeypatch):
+    monkeypatch.setattr(circuit, "time", clock)
+    return CircuitBreaker("GET_POST_BY_ID_QUERY", window=30, min_requests=4, failure_rate=0.5, open_seconds=15)
+
+
+def test_is_failure():
+    request = httpx.Request("POST", "https://gql.hashnode.com")
+
+    assert is_failure(httpx.HTTPStatusError("502", request=request, response=httpx.Response(502, request=request)))
+    assert is_failure(httpx.ConnectError("refused"))
+    assert not is_failure(httpx.HTTPStatusError("429", request=request, response=httpx.Response(429, request=request)))
+    assert not is_failure(ValueError("bad"))
+
+
+def test_circuit_stays_closed_below_the_minimum_requests(breaker):
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_circuit_opens_when_the_failure_rate_crosses_the_threshold(breaker):
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_old_outcomes_leave_the_window(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(31)
+
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_lets_one_probe_through_after_the_cool_down(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+    clock.advance(15)
+
+    breaker.before_request()
+
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_successful_probe_closes_the_circuit(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+    clock.advance(15)
+    breaker.before_request()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    breaker.before_request()
+    breaker.before_request()
+
+
+def test_failed_probe_reopens_the_circuit(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+    clock.advance(15)
+    breaker.before_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.retry_in() == 15
+
+
+def test_ignored_probe_frees_its_slot(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+    clock.advance(15)
+    breaker.before_request()
+
+    breaker.record_ignored()
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_request()
+
+
+def test_registry_keeps_one_breaker_per_operation():
+    registry = CircuitBreakerRegistry(min_requests=1)
+
+    assert registry.get("GET_POST_BY_ID_QUERY") is registry.get("GET_POST_BY_ID_QUERY")
+    registry.get("GET_USER_INFO_QUERY").record_failure()
+
+    assert registry.states() == {"GET_POST_BY_ID_QUERY": CLOSED, "GET_USER_INFO_QUERY": OPEN}
+
+
+def test_expired_response_is_served_while_the_circuit_is_open(api, clock, monkeypatch):
+    for module in (cache, circuit, entities):
+        monkeypatch.setattr(module, "time", clock)
+    registry = CircuitBreakerRegistry(min_requests=1)
+    monkeypatch.setattr(mcp_server, "circuit_breakers", registry)
+    monkeypatch.setattr(mcp_server, "CIRCUIT_ENABLED", True)
+    api.on("GetUserInfo", lambda variables: {"user": {"id": "u1", "name": "Writer", "username": variables["username"]}})
+    variables = {"username": "writer"}
+
+    first = asyncio.run(mcp_server.fetch_from_api(GET_USER_INFO_QUERY, variables))
+    clock.advance(cache.operation_ttl("GET_USER_INFO_QUERY") + 1)
+    registry.get("GET_USER_INFO_QUERY").record_failure()
+    stale = asyncio.run(mcp_server.fetch_from_api(GET_USER_INFO_QUERY, variables))
+
+    assert stale["data"] == first["data"]
+    assert stale["extensions"]["cache"]["stale"] is True
+    assert api.count("GetUserInfo") == 1
+
+
+def test_open_circuit_without_a_cached_response_fails_fast(api, monkeypatch):
+    registry = CircuitBreakerRegistry(min_requests=1)
+    monkeypatch.setattr(mcp_server, "circuit_breakers", registry)
+    monkeypatch.setattr(mcp_server, "CIRCUIT_ENABLED", True)
+    registry.get("GET_USER_INFO_QUERY").record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(mcp_server.fetch_from_api(GET_USER_INFO_QUERY, {"username": "writer"}))
+    assert api.count("GetUserInfo") == 0
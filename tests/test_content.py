@@ -0,0 +1,119 @@
+"""Tests for the article body store"""
+import asyncio
+
+import pytest
+
+from hashnode_mcp.content import Section, html_headings, index_sections, markdown_headings, utf8_slice
+
+
+def test_utf8_slice_never_splits_a_character():
+    body = "aé".encode("utf-8")
+
+    assert utf8_slice(body, 0, 2) == ("a", 0, 1)
+    assert utf8_slice(body, 2, 3) == ("é", 1, 3)
+
+
+def test_utf8_slice_keeps_at_least_one_character():
+    body = "éé".encode("utf-8")
+
+    text, start, end = utf8_slice(body, 0, 1)
+
+    assert (text, start, end) == ("é", 0, 2)
+    assert utf8_slice(body, end, end + 1) == ("é", 2, 4)
+    assert utf8_slice(body, 4, 5) == ("", 4, 4)
+
+
+MARKDOWN = """Intro line.
+
+# Title
+
+Some text.
+
+## Setup
+
+```bash
+# not a heading
+```
+
+### Details
+
+More.
+
+## Usage
+
+Use it.
+
+# Appendix
+"""
+
+
+def titles(sections):
+    return [(section.level, section.title) for section in sections]
+
+
+def test_markdown_headings_inside_code_blocks_are_ignored():
+    headings = markdown_headings(MARKDOWN.encode("utf-8"))
+
+    assert [title for _, title, _ in headings] == ["Title", "Setup", "Details", "Usage", "Appendix"]
+
+
+def test_sections_include_their_subsections():
+    body = MARKDOWN.encode("utf-8")
+
+    sections = index_sections(body, "markdown")
+
+    assert titles(sections) == [(0, ""), (1, "Title"), (2, "Setup"), (3, "Details"), (2, "Usage"), (1, "Appendix")]
+    preamble, title, setup, details, usage, appendix = sections
+    assert body[preamble.start:preamble.end] == b"Intro line.\n\n"
+    assert title.end == appendix.start
+    assert setup.end == usage.start
+    assert details.end == usage.start
+    assert body[setup.start:setup.end].decode("utf-8").count("# not a heading") == 1
+    assert appendix.end == len(body)
+
+
+def test_body_starting_with_a_heading_has_no_preamble():
+    sections = index_sections(b"# One\n\ntext\n# Two\n", "markdown")
+
+    assert titles(sections) == [(1, "One"), (1, "Two")]
+
+
+def test_text_without_headings_is_one_section():
+    body = "Just text.\n# Not parsed in plain text\n".encode("utf-8")
+
+    assert index_sections(body, "text") == [Section(0, "", 0, len(body))]
+
+
+def test_html_heading_offsets_are_in_bytes():
+    body = "<p>Résumé ☕</p><h2 id=\"a\">Café <em>au</em> lait</h2><p>x</p><h3>Détails</h3>".encode("utf-8")
+
+    headings = html_headings(body)
+
+    assert headings == [(2, "Café au lait", body.find(b"<h2")), (3, "Détails", body.find(b"<h3"))]
+    sections = index_sections(body, "html")
+    assert body[sections[0].start:sections[0].end].decode("utf-8") == "<p>Résumé ☕</p>"
+
+
+@pytest.fixture
+def article(api):
+    api.on("Post", lambda variables: {"post": {"id": variables["id"], "content": {"markdown": MARKDOWN}}})
+
+
+def test_section_resource_serves_a_heading_and_everything_under_it(article):
+    from hashnode_mcp import mcp_server
+
+    text = asyncio.run(mcp_server.post_section("p1", "markdown", "2"))
+
+    assert text.startswith("## Setup\n")
+    assert "### Details" in text
+    assert "## Usage" not in text
+
+
+def test_section_list_resource_numbers_every_section(article):
+    from hashnode_mcp import mcp_server
+
+    listing = asyncio.run(mcp_server.post_sections("p1", "markdown"))
+
+    assert "0. (before the first heading)" in listing
+    assert "3.     Details" in listing
+    assert "5. Appendix" in listing
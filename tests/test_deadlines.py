@@ -0,0 +1,82 @@
+"""Tests for timeout tiers and tool deadlines"""
+import asyncio
+
+import pytest
+
+from hashnode_mcp.batching import QueryBatcher
+from hashnode_mcp.deadlines import DeadlineExceeded, TimeoutTier, deadline, remaining, request_timeout, with_deadline
+from hashnode_mcp.singleflight import SingleFlight
+from hashnode_mcp.utils import GET_POST_BY_ID_QUERY
+
+TIER = TimeoutTier(connect=5.0, read=30.0, total=30.0)
+
+
+def test_request_timeout_is_cut_to_the_deadline():
+    with deadline(2):
+        total, timeout = request_timeout(TIER)
+
+    assert total <= 2
+    assert timeout.read <= 2
+    assert request_timeout(TIER)[0] == 30.0
+
+
+def test_request_timeout_fails_once_the_deadline_has_passed():
+    with deadline(-1):
+        with pytest.raises(DeadlineExceeded):
+            request_timeout(TIER, "GET_POST_BY_ID_QUERY")
+
+
+def test_nested_deadlines_never_extend_the_outer_one():
+    @with_deadline(60)
+    async def tool():
+        return remaining()
+
+    async def main():
+        with deadline(1):
+            return await tool()
+
+    assert asyncio.run(main()) <= 1
+
+
+def test_callers_sharing_a_request_keep_their_own_deadlines():
+    flight = SingleFlight()
+    seen = []
+
+    async def request():
+        seen.append(remaining())
+        await asyncio.sleep(0.2)
+        return "result"
+
+    async def call(seconds):
+        with deadline(seconds):
+            return await flight.do("key", request)
+
+    async def main():
+        return await asyncio.gather(call(0.05), call(50), return_exceptions=True)
+
+    hurried, patient = asyncio.run(main())
+
+    assert isinstance(hurried, DeadlineExceeded)
+    assert patient == "result"
+    # The request does not run under the deadline of the caller that started it
+    assert seen == [None]
+    assert flight.shared == 1
+
+
+def test_callers_sharing_a_batch_keep_their_own_deadlines():
+    async def send(query, variables, label=None):
+        await asyncio.sleep(0.2)
+        return {"data": {}}
+
+    async def call(batcher, seconds, post_id):
+        with deadline(seconds):
+            return await batcher.load(GET_POST_BY_ID_QUERY, {"id": post_id})
+
+    async def main():
+        batcher = QueryBatcher(send, window=0.01)
+        return await asyncio.gather(call(batcher, 0.05, "p1"), call(batcher, 50, "p2"), return_exceptions=True)
+
+    hurried, patient = asyncio.run(main())
+
+    assert isinstance(hurried, DeadlineExceeded)
+    assert not isinstance(patient, Exception)
@@ -0,0 +1,119 @@
+"""Tests for the normalized entity store"""
+import pytest
+
+from hashnode_mcp import entities
+from hashnode_mcp.entities import EntityStore
+from hashnode_mcp.utils import GET_POST_BY_ID_QUERY, SYNC_POSTS_OF_PUBLICATION_QUERY
+
+USER_QUERY = """
+query User($username: String!) {
+  user(username: $username) {
+    id
+    username
+    name
+  }
+}
+"""
+
+
+def post(post_id="p1", body="old body", updated_at="2024-01-01T00:00:00Z"):
+    return {
+        "id": post_id,
+        "slug": "a-post",
+        "previousSlugs": [],
+        "title": "A post",
+        "subtitle": None,
+        "author": {"id": "u1", "username": "writer", "name": "Writer", "profilePicture": None},
+        "url": "https://blog.example.com/a-post",
+        "canonicalUrl": None,
+        "publication": {"id": "pub1", "title": "Blog", "displayTitle": None, "url": "https://blog.example.com"},
+        "cuid": "c1",
+        "coverImage": None,
+        "brief": "Brief",
+        "readTimeInMinutes": 3,
+        "views": 10,
+        "content": {"markdown": body, "html": f"<p>{body}</p>", "text": body},
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+    }
+
+
+def listing(*nodes):
+    edges = [{"node": node} for node in nodes]
+    return {"data": {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": False, "endCursor": None}}}}
+
+
+LISTING_VARIABLES = {"first": 20, "filter": {"publicationId": "pub1"}}
+
+
+@pytest.fixture
+def store(clock, monkeypatch):
+    monkeypatch.setattr(entities, "time", clock)
+    return EntityStore(ttl=120)
+
+
+def test_post_is_answered_from_the_store(store):
+    store.write(GET_POST_BY_ID_QUERY, {"id": "p1"}, {"data": {"post": post()}})
+
+    result = store.read(GET_POST_BY_ID_QUERY, {"id": "p1"})
+
+    assert result["data"]["post"]["content"]["markdown"] == "old body"
+    assert result["extensions"]["cache"]["entity"] is True
+
+
+def test_listing_does_not_refresh_fields_it_did_not_write(store, clock):
+    store.write(GET_POST_BY_ID_QUERY, {"id": "p1"}, {"data": {"post": post()}})
+    clock.advance(100)
+    # A listing refreshes only the fields it selects
+    node = {"id": "p1", "publishedAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-02-01T00:00:00Z"}
+    store.write(SYNC_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES, listing(node))
+    clock.advance(30)
+
+    # The body is 130s old, so the lookup must go upstream
+    assert store.read(GET_POST_BY_ID_QUERY, {"id": "p1"}) is None
+    # What the listing wrote is still fresh
+    assert store.get("Post", "p1")["updatedAt"] == "2024-02-01T00:00:00Z"
+    assert "content" not in store.get("Post", "p1")
+
+
+def test_root_records_expire_with_the_operation_ttl(store, clock):
+    node = {"id": "p1", "publishedAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z"}
+    store.write(SYNC_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES, listing(node), ttl=60)
+
+    clock.advance(59)
+    assert store.read(SYNC_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES) is not None
+    clock.advance(2)
+    assert store.read(SYNC_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES) is None
+
+
+def test_read_honours_a_shorter_max_age(store, clock):
+    store.write(GET_POST_BY_ID_QUERY, {"id": "p1"}, {"data": {"post": post()}})
+    clock.advance(31)
+
+    assert store.read(GET_POST_BY_ID_QUERY, {"id": "p1"}, max_age=30) is None
+    assert store.read(GET_POST_BY_ID_QUERY, {"id": "p1"}) is not None
+
+
+def test_store_is_bounded_by_size(clock, monkeypatch):
+    monkeypatch.setattr(entities, "time", clock)
+    store = EntityStore(ttl=120, max_bytes=4096)
+    for index in range(20):
+        store.write(GET_POST_BY_ID_QUERY, {"id": f"p{index}"}, {"data": {"post": post(f"p{index}", body="x" * 500)}})
+
+    assert store.size <= 4096
+    assert store.evictions > 0
+    assert store.read(GET_POST_BY_ID_QUERY, {"id": "p19"}) is not None
+    assert store.read(GET_POST_BY_ID_QUERY, {"id": "p0"}) is None
+
+
+def test_eviction_drops_index_entries(clock, monkeypatch):
+    monkeypatch.setattr(entities, "time", clock)
+    store = EntityStore(ttl=120, max_entities=2)
+    for index in range(10):
+        user = {"id": f"u{index}", "username": f"user{index}", "name": "Name"}
+        store.write(USER_QUERY, {"username": f"user{index}"}, {"data": {"user": user}}, tags={f"User:u{index}"})
+
+    assert len(store) <= 2
+    assert len(store._usernames) <= 2
+    assert len(store._tagged) <= 2
+    assert store.read(USER_QUERY, {"username": "user9"})["data"]["user"]["name"] == "Name"
@@ -0,0 +1,173 @@
+"""Tests for the streaming publication export"""
+import asyncio
+import json
+
+import pytest
+
+from hashnode_mcp import mcp_server
+from hashnode_mcp.export import export_path, export_publication, load_state
+
+HOST = "blog.example.com"
+
+
+@pytest.fixture
+def blog(api):
+    """A publication of five posts, listed two per page by the fake API"""
+    posts = [
+        {
+            "id": f"p{index}",
+            "title": f"Post {index}",
+            "brief": "Brief",
+            "publishedAt": f"2024-01-0{index}T00:00:00Z",
+            "author": {"name": "Writer"},
+            "content": {"markdown": f"Body {index}", "html": "", "text": f"Body {index}"},
+        }
+        for index in range(5, 0, -1)
+    ]
+
+    def listing(variables):
+        start = int(variables.get("after") or 0)
+        page = posts[start:start + variables["first"]]
+        edges = [{"node": {key: post[key] for key in ("id", "title", "brief", "publishedAt", "author")}} for post in page]
+        more = start + len(page) < len(posts)
+        return {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": more, "endCursor": str(start + len(page))}}}
+
+    def post(variables):
+        if variables["id"] in api.broken:
+            raise LookupError("Internal error")
+        return {"post": next(post for post in posts if post["id"] == variables["id"])}
+
+    api.broken = set()
+    api.on("GetPublicationByHost", lambda variables: {"publication": {"id": "pub1", "title": "Blog"}})
+    api.on("SearchPostsOfPublication", listing)
+    api.on("Post", post)
+    return posts
+
+
+def exported_ids(path):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line)["id"] for line in fh]
+
+
+def test_export_writes_every_post(blog, tmp_path):
+    path = str(tmp_path / "posts.jsonl")
+    summary = asyncio.run(export_publication(mcp_server.publication_api, HOST, path, page_size=2))
+
+    assert summary["exported"] == 5
+    assert summary["complete"] is True
+    assert exported_ids(path) == ["p5", "p4", "p3", "p2", "p1"]
+
+
+def test_export_bypasses_the_caches(blog, tmp_path):
+    asyncio.run(export_publication(mcp_server.publication_api, HOST, str(tmp_path / "posts.jsonl"), page_size=2))
+
+    assert "op:GET_POST_BY_ID_QUERY" not in mcp_server.response_cache._tagged
+    assert "content" not in (mcp_server.entity_store.get("Post", "p1") or {})
+
+
+def test_export_syncs_to_disk_off_the_event_loop(blog, tmp_path, monkeypatch):
+    import threading
+
+    from hashnode_mcp import export
+
+    threads = []
+    fsync = export.os.fsync
+
+    def record(fd):
+        threads.append(threading.current_thread())
+        fsync(fd)
+
+    monkeypatch.setattr(export.os, "fsync", record)
+    asyncio.run(export_publication(mcp_server.publication_api, HOST, str(tmp_path / "posts.jsonl"), page_size=2))
+
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_resume_after_the_output_was_deleted_starts_over(blog, tmp_path):
+    path = tmp_path / "posts.jsonl"
+    asyncio.run(export_publication(mcp_server.publication_api, HOST, str(path), page_size=2))
+    state = load_state(str(path))
+    state.update(complete=False, cursor="2")
+    (tmp_path / "posts.jsonl.state").write_text(json.dumps(state))
+    path.unlink()
+
+    asyncio.run(export_publication(mcp_server.publication_api, HOST, str(path), page_size=2))
+
+    assert b"\0" not in path.read_bytes()
+    assert exported_ids(str(path)) == ["p5", "p4", "p3", "p2", "p1"]
+
+
+def test_resume_after_the_output_was_truncated_starts_over(blog, tmp_path):
+    path = tmp_path / "posts.jsonl"
+    asyncio.run(export_publication(mcp_server.publication_api, HOST, str(path), page_size=2))
+    state = load_state(str(path))
+    state.update(complete=False, cursor="2")
+    (tmp_path / "posts.jsonl.state").write_text(json.dumps(state))
+    path.write_bytes(path.read_bytes()[:10])
+
+    summary = asyncio.run(export_publication(mcp_server.publication_api, HOST, str(path), page_size=2))
+
+    assert summary["written"] == 5
+    assert exported_ids(str(path)) == ["p5", "p4", "p3", "p2", "p1"]
+
+
+def test_resume_continues_after_the_last_page(blog, tmp_path):
+    path = str(tmp_path / "posts.jsonl")
+    asyncio.run(export_publication(mcp_server.publication_api, HOST, path, page_size=2))
+    state = load_state(path)
+    # Pretend the run stopped after the first page
+    with open(path, "rb") as fh:
+        first_page = b"".join(fh.readlines()[:2])
+    # ... in the middle of writing the second one
+    with open(path, "wb") as fh:
+        fh.write(first_page + b'{"partial')
+    state.update(complete=False, cursor="2", offset=len(first_page), written=2)
+    with open(f"{path}.state", "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+
+    summary = asyncio.run(export_publication(mcp_server.publication_api, HOST, path, page_size=2))
+
+    assert summary["exported"] == 3
+    assert exported_ids(path) == ["p5", "p4", "p3", "p2", "p1"]
+
+
+def test_failed_posts_are_retried_on_the_next_run(blog, tmp_path, api):
+    path = str(tmp_path / "posts.jsonl")
+    api.broken.add("p3")
+    summary = asyncio.run(export_publication(mcp_server.publication_api, HOST, path, page_size=2))
+    assert summary["failed"] == ["p3"]
+    assert summary["complete"] is True
+
+    api.broken.clear()
+    summary = asyncio.run(export_publication(mcp_server.publication_api, HOST, path, page_size=2))
+
+    assert summary["exported"] == 1
+    assert summary["failed"] == []
+    assert sorted(exported_ids(path)) == ["p1", "p2", "p3", "p4", "p5"]
+
+
+@pytest.mark.parametrize("name", ["/etc/passwd", "../posts.jsonl", "backups/../../posts.jsonl", ""])
+def test_export_path_stays_in_the_export_directory(tmp_path, name):
+    with pytest.raises(ValueError):
+        export_path(name, str(tmp_path))
+
+
+def test_export_path_does_not_follow_symlinks_out(tmp_path):
+    (tmp_path / "exports").mkdir()
+    (tmp_path / "exports" / "out").symlink_to(tmp_path)
+
+    assert export_path("backups/posts.jsonl", str(tmp_path / "exports")) == str(tmp_path / "exports" / "backups" / "posts.jsonl")
+    with pytest.raises(ValueError):
+        export_path("out/posts.jsonl", str(tmp_path / "exports"))
+
+
+def test_export_tool_writes_inside_the_export_directory(blog, tmp_path, monkeypatch):
+    monkeypatch.setattr(mcp_server, "EXPORT_DIR", str(tmp_path))
+
+    result = json.loads(asyncio.run(mcp_server.export_publication(HOST, "backups/posts.jsonl", output="json")))
+    refused = json.loads(asyncio.run(mcp_server.export_publication(HOST, "../posts.jsonl", output="json")))
+
+    assert result["file"] == str(tmp_path / "backups" / "posts.jsonl")
+    assert exported_ids(result["file"]) == ["p5", "p4", "p3", "p2", "p1"]
+    assert "export directory" in refused["error"]
@@ -0,0 +1,51 @@
+"""Tests for the declarative Markdown renderers"""
+from hashnode_mcp.formatting import Block, Each, Text, Value, compile_renderer, date, format_date, truncate
+from hashnode_mcp.utils import format_latest_articles
+
+
+def test_renderer_follows_the_specs():
+    render = compile_renderer((
+        Value("title", "# {}\n", when="always", default="Untitled"),
+        Block("author", (Value("name", "By {}\n"),)),
+        Each("edges", (Value("title", "- {}\n"),), header="Posts:\n"),
+        Text("End\n"),
+    ))
+
+    text = render({"author": {"name": "Writer"}, "edges": [{"node": {"title": "A"}}, {"cursor": "x"}, {"node": {"title": "B"}}]})
+
+    assert text == "# Untitled\nBy Writer\nPosts:\n- A\n- B\nEnd\n"
+
+
+def test_transforms():
+    render = compile_renderer((
+        Value("publishedAt", "{}\n", transform=date("%b %d, %Y")),
+        Value("brief", "{}\n", transform=truncate(5)),
+    ))
+
+    assert render({"publishedAt": "2024-05-01T10:00:00Z", "brief": "A long brief"}) == "May 01, 2024\nA lon...\n"
+
+
+def test_format_date_leaves_other_values_alone():
+    assert format_date("not a date", "%Y") == "not a date"
+    assert format_date(None, "%Y") is None
+
+
+def test_latest_articles_fit_the_budget_and_hand_out_a_cursor():
+    edges = [
+        {"node": {"id": f"p{index}", "title": f"Post {index}", "brief": "Brief " * 50, "publishedAt": "2024-01-01T00:00:00Z"}, "cursor": f"c{index}"}
+        for index in range(50)
+    ]
+
+    text = format_latest_articles("Blog", edges, limit=2000)
+
+    assert len(text.encode("utf-8")) <= 2000
+    assert "Output budget reached" in text
+    assert 'cursor="c' in text
+
+
+def test_null_edges_are_skipped():
+    render = compile_renderer((Each("edges", (Value("title", "- {}\n"),)),))
+    edges = [{"node": {"title": "A"}}, None, {"node": None}, {"node": {"title": "B"}, "cursor": "2"}]
+
+    assert render({"edges": edges}) == "- A\n- B\n"
+    assert "## B" in format_latest_articles("Blog", edges)
@@ -0,0 +1,70 @@
+"""Tests for merging read queries into one document and splitting the response"""
+import pytest
+
+from hashnode_mcp.graphql import merge_queries, split_response
+from hashnode_mcp.utils import GET_POST_BY_ID_QUERY, UPDATE_ARTICLE_MUTATION
+
+TWO_POSTS_QUERY = """
+query TwoPosts($id: ID!, $other: ID!) {
+  first: post(id: $id) { id }
+  post(id: $other) { id }
+}
+"""
+
+
+def test_merge_renames_the_variables_of_each_query():
+    merged, variables, aliases = merge_queries([(GET_POST_BY_ID_QUERY, {"id": "p1"}), (GET_POST_BY_ID_QUERY, {"id": "p2"})])
+
+    assert merged.startswith("query Batched($id_b0: ID!, $id_b1: ID!)")
+    assert "b0_post: post(id: $id_b0)" in merged
+    assert "b1_post: post(id: $id_b1)" in merged
+    assert variables == {"id_b0": "p1", "id_b1": "p2"}
+    assert aliases == [[("b0_post", "post")], [("b1_post", "post")]]
+
+
+def test_merge_keeps_aliases_of_the_same_field_apart():
+    merged, variables, aliases = merge_queries([(TWO_POSTS_QUERY, {"id": "p1", "other": "p2"}), (GET_POST_BY_ID_QUERY, {"id": "p3"})])
+
+    assert aliases == [[("b0_first", "first"), ("b0_post", "post")], [("b1_post", "post")]]
+    assert variables == {"id_b0": "p1", "other_b0": "p2", "id_b1": "p3"}
+    assert "$id_b0" in merged and "$other_b0" in merged
+
+
+def test_only_queries_are_merged():
+    with pytest.raises(ValueError):
+        merge_queries([(GET_POST_BY_ID_QUERY, {"id": "p1"}), (UPDATE_ARTICLE_MUTATION, {"input": {}})])
+
+
+def test_split_routes_errors_to_the_query_at_their_path():
+    aliases = [[("b0_post", "post")], [("b1_post", "post")]]
+    result = {
+        "data": {"b0_post": {"id": "p1"}, "b1_post": None},
+        "errors": [
+            {"message": "Post not found", "path": ["b1_post"]},
+            {"message": "Slow down"},
+        ],
+    }
+
+    first, second = split_response(result, aliases)
+
+    assert first == {"data": {"post": {"id": "p1"}}, "errors": [{"message": "Slow down"}]}
+    assert second["data"] == {"post": None}
+    assert second["errors"] == [{"message": "Post not found", "path": ["post"]}, {"message": "Slow down"}]
+
+
+def test_split_keeps_the_rest_of_an_error_path():
+    aliases = [[("b0_first", "first"), ("b0_post", "post")]]
+    result = {"data": {"b0_first": {"id": "p1", "title": None}, "b0_post": None}, "errors": [{"message": "Bad title", "path": ["b0_first", "title"]}]}
+
+    (response,) = split_response(result, aliases)
+
+    assert response["data"] == {"first": {"id": "p1", "title": None}, "post": None}
+    assert response["errors"] == [{"message": "Bad title", "path": ["first", "title"]}]
+
+
+def test_split_of_a_rejected_document_has_no_data():
+    result = {"data": None, "errors": [{"message": "Invalid ID"}]}
+
+    responses = split_response(result, [[("b0_post", "post")], [("b1_post", "post")]])
+
+    assert responses == [{"data": None, "errors": [{"message": "Invalid ID"}]}] * 2
@@ -0,0 +1,136 @@
+"""Tests for the cache invalidation driven by mutations"""
+import asyncio
+
+from hashnode_mcp import mcp_server
+from hashnode_mcp.entities import tag_slug_key
+from hashnode_mcp.graphql import request_key
+from hashnode_mcp.invalidation import LISTING_TAGS, mutation_effects, response_tags
+from hashnode_mcp.utils import (
+    CREATE_ARTICLE_MUTATION,
+    GET_ARTICLES_BY_TAG_QUERY,
+    GET_POST_BY_ID_QUERY,
+    PUBLISH_DRAFT_MUTATION,
+    SEARCH_POSTS_OF_PUBLICATION_QUERY,
+    UPDATE_ARTICLE_MUTATION,
+)
+
+LISTING_VARIABLES = {"first": 5, "after": None, "filter": {"publicationId": "pub1", "query": "python"}}
+
+
+def published(post_id="p9", publication_id="pub1"):
+    post = {"id": post_id, "slug": "new", "title": "New", "url": None, "brief": "Brief", "publishedAt": None}
+    if publication_id:
+        post["publication"] = {"id": publication_id, "title": "Blog"}
+    return {"data": {"publishPost": {"post": post}}}
+
+
+def test_responses_are_tagged_with_what_they_were_requested_for():
+    empty = {"data": {"searchPostsOfPublication": {"edges": [], "pageInfo": {"hasNextPage": False}}}}
+
+    assert "Publication:pub1" in response_tags(SEARCH_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES, empty)
+    assert "Post:p1" in response_tags(GET_POST_BY_ID_QUERY, {"id": "p1"}, {"data": {"post": None}})
+    assert response_tags(GET_ARTICLES_BY_TAG_QUERY, {"tag": "Python", "first": 5}, {"data": {"tag": None}}) >= {tag_slug_key("python")}
+
+
+def test_listed_posts_tag_the_response():
+    listing = {"data": {"searchPostsOfPublication": {"edges": [{"node": {"id": "p1", "title": "A post"}}]}}}
+
+    assert "Post:p1" in response_tags(SEARCH_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES, listing)
+
+
+def test_create_evicts_its_publication_and_tags():
+    variables = {"input": {"publicationId": "pub1", "tags": [{"slug": "python"}]}}
+
+    effects = mutation_effects(CREATE_ARTICLE_MUTATION, variables, published())
+
+    assert {"Publication:pub1", "Post:p9", tag_slug_key("python")} <= effects.tags
+    assert not effects.tags & {"op:SEARCH_POSTS_OF_PUBLICATION_QUERY", "op:GET_PUBLICATION_POSTS_QUERY"}
+    assert effects.entities == {}
+
+
+def test_create_without_a_known_publication_evicts_every_listing():
+    effects = mutation_effects(CREATE_ARTICLE_MUTATION, {"input": {}}, published(publication_id=None))
+
+    assert LISTING_TAGS <= effects.tags
+
+
+def test_publish_draft_evicts_every_listing():
+    result = {"data": {"publishDraft": {"post": {"id": "p9"}}}}
+
+    effects = mutation_effects(PUBLISH_DRAFT_MUTATION, {"draftId": "d1"}, result)
+
+    assert effects.tags == LISTING_TAGS | {"Post:p9"}
+
+
+def test_update_evicts_the_post_and_only_the_changed_fields():
+    variables = {"input": {"id": "p1", "title": "Renamed", "tags": [{"slug": "rust"}]}}
+
+    effects = mutation_effects(UPDATE_ARTICLE_MUTATION, variables, {"data": {"updatePost": {"post": {"id": "p1"}}}})
+
+    assert effects.tags == {"Post:p1", tag_slug_key("rust")}
+    assert effects.entities == {"Post:p1": {"title", "tags"}}
+
+
+def test_update_of_an_unknown_field_evicts_the_whole_post():
+    variables = {"input": {"id": "p1", "seriesId": "s1"}}
+
+    effects = mutation_effects(UPDATE_ARTICLE_MUTATION, variables, {"data": {}})
+
+    assert effects.entities == {"Post:p1": None}
+
+
+def post(post_id="p1", title="A post"):
+    return {
+        "id": post_id, "slug": "a-post", "previousSlugs": [], "title": title, "subtitle": None,
+        "author": {"id": "u1", "username": "writer", "name": "Writer", "profilePicture": None},
+        "url": "https://blog.example.com/a-post", "canonicalUrl": None,
+        "publication": {"id": "pub1", "title": "Blog", "displayTitle": None, "url": "https://blog.example.com"},
+        "cuid": "c1", "coverImage": None, "brief": "Brief", "readTimeInMinutes": 3, "views": 10,
+        "content": {"markdown": "Body", "html": "<p>Body</p>", "text": "Body"},
+        "publishedAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+def cached(query, variables):
+    return mcp_server.response_cache.get(request_key(query, variables)) is not None
+
+
+def test_update_drops_cached_responses_and_writes_the_post_through(api):
+    api.on("Post", lambda variables: {"post": post()})
+    api.on("SearchPostsOfPublication", lambda variables: {"searchPostsOfPublication": {
+        "edges": [{"node": {"id": "p1", "title": "A post"}, "cursor": "c1"}], "pageInfo": {"hasNextPage": False},
+    }})
+    api.on("UpdatePost", lambda variables: {"updatePost": {"post": {
+        "id": "p1", "slug": "a-post", "title": "Renamed", "url": None, "brief": "Brief", "publishedAt": None,
+    }}})
+
+    async def main():
+        await mcp_server.fetch_from_api(GET_POST_BY_ID_QUERY, {"id": "p1"})
+        await mcp_server.fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES)
+        await mcp_server.fetch_from_api(UPDATE_ARTICLE_MUTATION, {"input": {"id": "p1", "title": "Renamed"}})
+
+    asyncio.run(main())
+
+    assert not cached(GET_POST_BY_ID_QUERY, {"id": "p1"})
+    assert not cached(SEARCH_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES)
+    stored = mcp_server.entity_store.get("Post", "p1")
+    assert stored["title"] == "Renamed"
+    # Fields the update did not touch are kept
+    assert stored["content"]["text"] == "Body"
+
+
+def test_create_drops_the_listings_of_its_publication_only(api):
+    other = {"first": 5, "after": None, "filter": {"publicationId": "pub2", "query": "python"}}
+    api.on("SearchPostsOfPublication", lambda variables: {"searchPostsOfPublication": {"edges": [], "pageInfo": {"hasNextPage": False}}})
+    api.on("PublishPost", lambda variables: published()["data"])
+
+    async def main():
+        await mcp_server.fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES)
+        await mcp_server.fetch_from_api(SEARCH_POSTS_OF_PUBLICATION_QUERY, other)
+        await mcp_server.fetch_from_api(CREATE_ARTICLE_MUTATION, {"input": {"publicationId": "pub1", "title": "New"}})
+
+    asyncio.run(main())
+
+    assert not cached(SEARCH_POSTS_OF_PUBLICATION_QUERY, LISTING_VARIABLES)
+    assert cached(SEARCH_POSTS_OF_PUBLICATION_QUERY, other)
+    assert mcp_server.entity_store.get("Post", "p9")["title"] == "New"
@@ -0,0 +1,15 @@
+"""Tests for the package logging"""
+import logging
+
+from hashnode_mcp.log import configure_logging, get_logger
+
+
+def test_records_reach_the_handlers_of_the_host(caplog):
+    configure_logging()
+
+    with caplog.at_level(logging.INFO):
+        get_logger("tests").info("seen by the host")
+
+    assert [record.name for record in caplog.records] == ["hashnode_mcp.tests"]
+    assert "seen by the host" in caplog.text
+
@@ -0,0 +1,51 @@
+"""Tests for the JSON output formats"""
+import json
+
+from hashnode_mcp.output import LATEST_ARTICLE_KEYS, POST_SUMMARY_KEYS, compact, post_summary, render
+
+
+def test_post_summary_keys_do_not_depend_on_the_source():
+    remote = {
+        "id": "p1",
+        "title": "A post",
+        "url": "https://blog.example.com/a-post",
+        "slug": "a-post",
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "author": {"name": "Writer"},
+        "brief": "Brief",
+    }
+    # Shaped like PostMirror.latest
+    mirrored = {"id": "p1", "title": "A post", "brief": "Brief", "publishedAt": "2024-01-01T00:00:00Z", "author": {"name": "Writer"}}
+
+    assert tuple(post_summary(remote)) == POST_SUMMARY_KEYS
+    assert tuple(post_summary(mirrored)) == POST_SUMMARY_KEYS
+    assert post_summary(mirrored)["url"] is None
+
+
+def test_compact_turns_lists_of_objects_into_tables():
+    value = {"items": [{"id": 1, "title": "a", "url": None}, {"id": 2, "title": None, "url": None}], "next": None}
+
+    assert compact(value, {"items": ("id", "title", "url")}) == {
+        "items": {"fields": ["id", "title", "url"], "rows": [[1, "a", None], [2, None, None]]},
+        "next": None,
+    }
+
+
+def test_compact_shape_does_not_depend_on_the_number_of_items():
+    tables = {"items": ("id", "title", "url")}
+
+    for items in ([], [{"id": 1, "title": "a"}], [{"id": 1}, {"id": 2}]):
+        document = compact({"items": items}, tables)
+        assert document["items"]["fields"] == ["id", "title", "url"]
+        assert len(document["items"]["rows"]) == len(items)
+
+
+def test_compact_output_is_smaller():
+    nodes = [
+        {"id": f"p{index}", "title": f"Post {index}", "brief": "Brief", "publishedAt": "2024-01-01T00:00:00Z", "author": {"name": "Writer"}}
+        for index in range(10)
+    ]
+    document = {"publication": "Blog", "items": [post_summary(node, LATEST_ARTICLE_KEYS) for node in nodes], "endCursor": None}
+
+    assert len(render(document, "compact", {"items": LATEST_ARTICLE_KEYS})) < len(render(document, "json"))
+    assert json.loads(render(document, "json")) == document
@@ -0,0 +1,79 @@
+"""Tests for cursor pagination"""
+import asyncio
+
+import pytest
+
+from hashnode_mcp import mcp_server
+from hashnode_mcp.pagination import CursorMap
+
+LISTING = ("pub1", "python", 5)
+
+
+def test_cursor_map_finds_the_nearest_known_page():
+    cursors = CursorMap()
+    cursors.set(LISTING, 1, "c5")
+    cursors.set(LISTING, 2, "c10")
+
+    assert cursors.nearest(LISTING, 3) == (3, "c10")
+    assert cursors.nearest(LISTING, 5) == (3, "c10")
+    assert cursors.nearest(("pub2", "python", 5), 3) == (1, None)
+    assert cursors.page_before(LISTING, "c10") == 2
+    assert cursors.page_before(LISTING, "c7") is None
+
+
+def test_cursor_map_is_bounded():
+    cursors = CursorMap(max_entries=2)
+    for page in range(1, 5):
+        cursors.set(LISTING, page, f"c{page * 5}")
+
+    assert len(cursors) == 2
+    assert cursors.get(LISTING, 1) is None
+    assert cursors.get(LISTING, 4) == "c20"
+
+
+@pytest.fixture
+def search(api):
+    """Thirty search results; the cursor "c<N>" points after the first N"""
+    posts = [{"id": f"p{index}", "title": f"Post {index}", "brief": "Brief"} for index in range(30)]
+
+    def handler(variables):
+        start = int((variables.get("after") or "c0")[1:])
+        page = posts[start:start + variables["first"]]
+        end = start + len(page)
+        edges = [{"node": post, "cursor": f"c{start + index + 1}"} for index, post in enumerate(page)]
+        return {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": end < len(posts), "endCursor": f"c{end}"}}}
+
+    api.on("SearchPostsOfPublication", handler)
+    return posts
+
+
+def ids(data):
+    return [edge["node"]["id"] for edge in data["data"]["searchPostsOfPublication"]["edges"]]
+
+
+def test_mid_page_cursor_does_not_overwrite_known_pages(search):
+    asyncio.run(mcp_server.fetch_search_page("pub1", "python", 1, 5))
+    # e.g. the cursor of the last result shown within an output budget
+    asyncio.run(mcp_server.fetch_search_page("pub1", "python", 1, 5, after="c4"))
+
+    page_two = asyncio.run(mcp_server.fetch_search_page("pub1", "python", 2, 5))
+
+    assert ids(page_two) == ["p5", "p6", "p7", "p8", "p9"]
+
+
+def test_page_boundary_cursor_is_remembered(search, api):
+    asyncio.run(mcp_server.fetch_search_page("pub1", "python", 1, 5))
+    asyncio.run(mcp_server.fetch_search_page("pub1", "python", 1, 5, after="c5"))
+    before = api.count("SearchPostsOfPublication")
+
+    page_three = asyncio.run(mcp_server.fetch_search_page("pub1", "python", 3, 5))
+
+    assert ids(page_three) == ["p10", "p11", "p12", "p13", "p14"]
+    assert api.count("SearchPostsOfPublication") == before + 1
+
+
+def test_later_page_walks_from_the_nearest_known_cursor(search, api):
+    page_three = asyncio.run(mcp_server.fetch_search_page("pub1", "python", 3, 5))
+
+    assert ids(page_three) == ["p10", "p11", "p12", "p13", "p14"]
+    assert api.count("SearchPostsOfPublication") == 3
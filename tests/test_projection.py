@@ -0,0 +1,47 @@
+"""Tests for the field projection of post lookups"""
+import pytest
+
+from hashnode_mcp import cache
+from hashnode_mcp.cache import query_label
+from hashnode_mcp.projection import DETAILS_FIELDS, normalize_fields, post_query, project_post
+
+
+def test_normalize_fields_orders_fields_and_always_selects_the_id():
+    assert normalize_fields(["content", "title"]) == (("id", "title", "content"), "text")
+    assert normalize_fields(None, "markdown") == (DETAILS_FIELDS, "markdown")
+
+
+def test_normalize_fields_drops_the_body_when_no_format_is_wanted():
+    assert normalize_fields(["title", "content"], "none") == (("id", "title"), "none")
+
+
+@pytest.mark.parametrize("fields, content_format", [(["title", "likes"], "text"), (["title"], "pdf")])
+def test_normalize_fields_rejects_unknown_names(fields, content_format):
+    with pytest.raises(ValueError):
+        normalize_fields(fields, content_format)
+
+
+def test_post_query_selects_only_the_requested_fields():
+    query = post_query(("id", "title", "content"), "markdown")
+
+    assert "content { markdown }" in query
+    assert "html" not in query
+    assert "author" not in query
+
+
+def test_projected_documents_are_labelled_without_a_registry():
+    known = len(cache.QUERY_NAMES)
+    queries = {post_query(fields, "text") for fields in [("id",), ("id", "title"), ("id", "brief"), ("id", "slug")]}
+
+    assert {query_label(query) for query in queries} == {"GET_POST_BY_ID_QUERY"}
+    assert len(cache.QUERY_NAMES) == known
+
+
+def test_project_post_keeps_one_content_format():
+    post = {"id": "p1", "title": "A post", "brief": "Brief", "content": {"text": "Body", "markdown": "**Body**"}}
+
+    assert project_post(post, ("id", "title", "content"), "markdown") == {
+        "id": "p1",
+        "title": "A post",
+        "content": {"markdown": "**Body**"},
+    }
@@ -0,0 +1,90 @@
+"""Tests for the adaptive rate limiter"""
+import asyncio
+
+import pytest
+
+from hashnode_mcp import ratelimit
+from hashnode_mcp.ratelimit import AdaptiveRateLimiter, parse_rate_limit_reset, parse_retry_after
+
+
+@pytest.fixture
+def paused(clock, monkeypatch):
+    """Run the limiter on the fake clock; sleeping moves the clock forward"""
+    sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        clock.advance(seconds)
+        await sleep(0)
+
+    monkeypatch.setattr(ratelimit, "time", clock)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+    return clock
+
+
+def acquire(limiter, times=1):
+    async def main():
+        return [await limiter.acquire() for _ in range(times)]
+    return asyncio.run(main())
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"retry-after": "3"}) == 3.0
+    assert parse_retry_after({}) is None
+    assert parse_retry_after({"retry-after": "soon"}) is None
+
+
+def test_parse_rate_limit_reset_only_when_the_quota_is_used_up():
+    assert parse_rate_limit_reset({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "7"}) == 7.0
+    assert parse_rate_limit_reset({"x-ratelimit-remaining": "5", "x-ratelimit-reset": "7"}) is None
+
+
+def test_bucket_allows_a_burst_then_refills_at_the_rate(paused):
+    limiter = AdaptiveRateLimiter(rate=2, burst=2)
+
+    waits = acquire(limiter, 3)
+
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.5)
+
+    paused.advance(1)
+    assert acquire(limiter, 2) == [0, 0]
+
+
+def test_429_halves_the_rate_and_pauses_for_retry_after(paused):
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, min_rate=1)
+
+    limiter.on_response(429, {"retry-after": "3"})
+
+    assert limiter.rate == 5
+    assert acquire(limiter) == [pytest.approx(3)]
+    assert limiter.throttled == 1
+
+
+def test_rate_never_drops_below_the_minimum(paused):
+    limiter = AdaptiveRateLimiter(rate=4, burst=1, min_rate=1)
+
+    for _ in range(5):
+        limiter.on_response(429, {"retry-after": "0"})
+
+    assert limiter.rate == 1
+
+
+def test_rate_recovers_step_by_step_after_throttling(paused):
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, min_rate=1)
+    limiter.on_response(429, {"retry-after": "0"})
+
+    limiter.on_response(200, {})
+    assert limiter.rate == pytest.approx(5.5)
+
+    for _ in range(20):
+        limiter.on_response(200, {})
+    assert limiter.rate == 10
+
+
+def test_used_up_quota_pauses_without_cutting_the_rate(paused):
+    limiter = AdaptiveRateLimiter(rate=10, burst=10)
+
+    limiter.on_response(200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "2"})
+
+    assert limiter.rate == 10
+    assert acquire(limiter) == [pytest.approx(2)]
@@ -0,0 +1,118 @@
+"""Tests for the retry policy and budget"""
+import asyncio
+
+import httpx
+import pytest
+
+from hashnode_mcp.retry import RetryBudget, RetryPolicy, backoff_delay, is_retryable
+
+
+def status_error(status, headers=None):
+    request = httpx.Request("POST", "https://gql.hashnode.com")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status}", request=request, response=response)
+
+
+@pytest.mark.parametrize("error, expected", [
+    (status_error(500), True),
+    (status_error(503), True),
+    (status_error(429), True),
+    (status_error(400), False),
+    (status_error(401), False),
+    (httpx.ConnectError("refused"), True),
+    (httpx.ReadError("reset"), True),
+    (httpx.ReadTimeout("slow"), False),
+    (ValueError("bad"), False),
+])
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+def test_backoff_delay_stays_under_its_ceiling():
+    for attempt in range(1, 10):
+        ceiling = min(5.0, 0.2 * 2 ** (attempt - 1))
+        delays = [backoff_delay(attempt, base_delay=0.2, max_delay=5.0) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+
+
+class Flaky:
+    """Fails with ``error`` the first ``failures`` times it is called"""
+
+    def __init__(self, error, failures):
+        self.error = error
+        self.failures = failures
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def policy(**kwargs):
+    return RetryPolicy(base_delay=0.001, max_delay=0.001, **kwargs)
+
+
+def test_retryable_errors_are_retried():
+    call = Flaky(status_error(502), failures=2)
+
+    assert asyncio.run(policy(max_attempts=3).call(call)) == "ok"
+    assert call.calls == 3
+
+
+def test_attempts_are_capped():
+    call = Flaky(status_error(502), failures=5)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(policy(max_attempts=3).call(call))
+    assert call.calls == 3
+
+
+def test_non_retryable_errors_and_mutations_are_not_retried():
+    client_error = Flaky(status_error(400), failures=1)
+    mutation = Flaky(status_error(502), failures=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(policy().call(client_error))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(policy().call(mutation, idempotent=False))
+    assert client_error.calls == mutation.calls == 1
+
+
+def test_retry_budget_is_earned_by_requests(clock, monkeypatch):
+    from hashnode_mcp import retry
+
+    monkeypatch.setattr(retry, "time", clock)
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+
+    assert budget.try_withdraw() and budget.try_withdraw()
+    assert not budget.try_withdraw()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_withdraw()
+    assert budget.exhausted == 1
+
+
+def test_retry_budget_refills_over_time(clock, monkeypatch):
+    from hashnode_mcp import retry
+
+    monkeypatch.setattr(retry, "time", clock)
+    budget = RetryBudget(ratio=0, min_per_second=1, max_tokens=1)
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+    clock.advance(1)
+
+    assert budget.try_withdraw()
+
+
+def test_exhausted_budget_stops_retries():
+    budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=1)
+    first = Flaky(status_error(502), failures=1)
+    second = Flaky(status_error(502), failures=1)
+
+    assert asyncio.run(policy(budget=budget).call(first)) == "ok"
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(policy(budget=budget).call(second))
+    assert second.calls == 1
@@ -0,0 +1,51 @@
+"""Tests for the deduplication of identical in-flight requests"""
+import asyncio
+
+from hashnode_mcp import mcp_server
+from hashnode_mcp.utils import GET_USER_INFO_QUERY, GET_VIEWER_PUBLICATION_QUERY, TOGGLE_FOLLOW_MUTATION
+
+
+def concurrently(*calls):
+    async def main():
+        return await asyncio.gather(*calls)
+    return asyncio.run(main())
+
+
+def test_identical_concurrent_reads_share_one_request(api):
+    api.on("GetUserInfo", lambda variables: {"user": {"id": "u1", "username": variables["username"]}})
+
+    results = concurrently(*(mcp_server.fetch_from_api(GET_USER_INFO_QUERY, {"username": "writer"}) for _ in range(5)))
+
+    assert api.count("GetUserInfo") == 1
+    assert all(result["data"] == results[0]["data"] for result in results)
+
+
+def test_uncached_reads_are_shared_only_while_in_flight(api):
+    api.on("ViewerPublication", lambda variables: {"me": {"publications": {"edges": []}}})
+
+    concurrently(*(mcp_server.fetch_from_api(GET_VIEWER_PUBLICATION_QUERY) for _ in range(3)))
+    assert api.count("ViewerPublication") == 1
+
+    concurrently(mcp_server.fetch_from_api(GET_VIEWER_PUBLICATION_QUERY))
+    assert api.count("ViewerPublication") == 2
+
+
+def test_different_variables_are_not_shared(api):
+    api.on("GetUserInfo", lambda variables: {"user": {"id": variables["username"], "username": variables["username"]}})
+
+    first, second = concurrently(
+        mcp_server.fetch_from_api(GET_USER_INFO_QUERY, {"username": "one"}),
+        mcp_server.fetch_from_api(GET_USER_INFO_QUERY, {"username": "two"}),
+    )
+
+    assert api.count("GetUserInfo") == 2
+    assert first["data"]["user"]["id"] == "one"
+    assert second["data"]["user"]["id"] == "two"
+
+
+def test_concurrent_mutations_are_never_merged(api):
+    api.on("ToggleFollowUser", lambda variables: {"toggleFollowUser": {"user": {"following": True}}})
+
+    concurrently(*(mcp_server.fetch_from_api(TOGGLE_FOLLOW_MUTATION, {"username": "writer"}) for _ in range(3)))
+
+    assert api.count("ToggleFollowUser") == 3
@@ -0,0 +1,201 @@
+"""Tests for the local post mirror and its sync"""
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from hashnode_mcp import mcp_server
+from hashnode_mcp.sync import PostMirror, fts_query, sync_publication
+from hashnode_mcp.utils import UPDATE_ARTICLE_MUTATION
+
+HOST = "blog.example.com"
+
+
+@pytest.fixture
+def blog(api):
+    """A publication of three posts served by the fake API"""
+    posts = {
+        f"p{index}": {
+            "id": f"p{index}",
+            "title": f"Post {index}",
+            "brief": "Brief",
+            "author": {"name": "Writer"},
+            "publishedAt": f"2024-01-0{index}T00:00:00Z",
+            "updatedAt": f"2024-01-0{index}T00:00:00Z",
+            "content": {"markdown": f"Body {index}", "html": "", "text": f"Body {index}"},
+        }
+        for index in (1, 2, 3)
+    }
+
+    def listing(variables):
+        nodes = sorted(posts.values(), key=lambda post: post["publishedAt"], reverse=True)
+        edges = [{"node": {key: post[key] for key in ("id", "publishedAt", "updatedAt")}} for post in nodes]
+        return {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": False, "endCursor": None}}}
+
+    def post(variables):
+        if variables["id"] in api.broken:
+            raise LookupError("Internal error")
+        return {"post": posts[variables["id"]]}
+
+    def update(variables):
+        changed = posts[variables["input"]["id"]]
+        changed.update(title=variables["input"]["title"], updatedAt="2024-02-01T00:00:00Z")
+        return {"updatePost": {"post": {key: changed.get(key) for key in ("id", "slug", "title", "url", "brief", "publishedAt")}}}
+
+    api.broken = set()
+    api.on("GetPublicationByHost", lambda variables: {"publication": {"id": "pub1", "title": "Blog"}})
+    api.on("SyncPostsOfPublication", listing)
+    api.on("Post", post)
+    api.on("UpdatePost", update)
+    return posts
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    mirror = PostMirror(str(tmp_path / "mirror.db"))
+    monkeypatch.setattr(mcp_server, "post_mirror", mirror)
+    yield mirror
+    mirror.close()
+
+
+def test_update_keeps_the_post_in_the_mirror(blog, mirror, api):
+    asyncio.run(sync_publication(mirror, mcp_server.publication_api, HOST))
+    asyncio.run(mcp_server.fetch_from_api(UPDATE_ARTICLE_MUTATION, {"input": {"id": "p2", "title": "Renamed"}}))
+
+    assert [edge["node"]["id"] for edge in mirror.latest("pub1", 10)] == ["p3", "p2", "p1"]
+    # The outdated copy is not served, and the next incremental sync fetches it again
+    assert mirror.post("p2") is None
+    summary = asyncio.run(sync_publication(mirror, mcp_server.publication_api, HOST))
+    assert summary["saved"] == 1
+    assert mirror.post("p2")["title"] == "Renamed"
+    assert len(mirror.latest("pub1", 10)) == 3
+
+
+def test_failed_post_is_skipped_and_retried(blog, mirror, api):
+    api.broken.add("p3")
+    summary = asyncio.run(sync_publication(mirror, mcp_server.publication_api, HOST))
+
+    assert summary["failed"] == ["p3"]
+    assert summary["saved"] == 2
+    assert mirror.watermark("pub1") == "2024-01-02T00:00:00Z"
+
+    api.broken.clear()
+    summary = asyncio.run(sync_publication(mirror, mcp_server.publication_api, HOST))
+    assert summary["failed"] == []
+    assert mirror.post("p3")["title"] == "Post 3"
+    assert mirror.watermark("pub1") == "2024-01-03T00:00:00Z"
+
+
+def test_failed_save_leaves_the_mirror_unchanged(mirror):
+    good = {"id": "p1", "title": "Searchable", "content": {"text": "Body"}}
+    # A title sqlite cannot store makes the second row fail
+    bad = {"id": "p2", "title": {"not": "text"}}
+
+    with pytest.raises(sqlite3.Error):
+        mirror.save_posts("pub1", [good, bad])
+
+    assert mirror.updated_at(["p1"]) == {}
+    assert mirror.search("Searchable")["data"]["searchPostsOfPublication"]["edges"] == []
+    # The next write is not caught up in a transaction left open
+    mirror.save_posts("pub1", [good])
+    assert mirror.post("p1")["title"] == "Searchable"
+
+
+def article(post_id, title, text, brief="Brief"):
+    return {"id": post_id, "title": title, "brief": brief, "publishedAt": "2024-01-01T00:00:00Z", "content": {"text": text}}
+
+
+def found(mirror, query, **kwargs):
+    edges = mirror.search(query, **kwargs)["data"]["searchPostsOfPublication"]["edges"]
+    return [edge["node"]["id"] for edge in edges]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("python tips", '"python" "tips"'),
+    ('"event loop" async', '"event loop" "async"'),
+    ("sync*", '"sync"*'),
+    ("c++", '"c++"'),
+    # A stray quote is kept as a literal character
+    ('NEAR( say "hi', '"NEAR(" "say" """hi"'),
+    ("* \"\"", ""),
+])
+def test_fts_query_quotes_every_term(text, expected):
+    assert fts_query(text) == expected
+
+
+def test_title_matches_rank_above_body_matches(mirror):
+    mirror.save_posts("pub1", [
+        article("body", "Gardening", "A few words about python in the garden"),
+        article("title", "Python", "Nothing to see here"),
+    ])
+
+    assert found(mirror, "python") == ["title", "body"]
+
+
+def test_phrase_and_prefix_queries(mirror):
+    mirror.save_posts("pub1", [
+        article("p1", "Loops", "the event loop runs callbacks"),
+        article("p2", "Events", "a loop of every event"),
+        article("p3", "Sync", "synchronization primitives"),
+    ])
+
+    assert found(mirror, '"event loop"') == ["p1"]
+    assert sorted(found(mirror, "event loop")) == ["p1", "p2"]
+    assert found(mirror, "synchron*") == ["p3"]
+
+
+@pytest.mark.parametrize("query", ["c++", "NEAR(", 'AND OR "', 'say "hi', "title:python", "-python"])
+def test_operator_like_input_cannot_break_the_query(mirror, query):
+    mirror.save_posts("pub1", [article("p1", "Python", "c++ and python")])
+
+    assert isinstance(found(mirror, query), list)
+
+
+def test_index_follows_updates_and_prunes(mirror):
+    mirror.save_posts("pub1", [article("p1", "Python", "Body"), article("p2", "Rust", "Body")])
+
+    mirror.save_posts("pub1", [article("p1", "Haskell", "Body")])
+    assert found(mirror, "python") == []
+    assert found(mirror, "haskell") == ["p1"]
+
+    assert mirror.prune("pub1", keep=["p1"]) == 1
+    assert found(mirror, "rust") == []
+    assert found(mirror, "body") == ["p1"]
+
+
+def test_search_is_limited_to_a_publication(mirror):
+    mirror.save_posts("pub1", [article("p1", "Python", "Body")])
+    mirror.save_posts("pub2", [article("p2", "Python", "Body")])
+
+    assert found(mirror, "python", publication_id="pub2") == ["p2"]
+
+
+def test_local_search_pages_with_local_cursors(api, mirror):
+    mirror.save_posts("pub1", [article(f"p{index}", f"Python {index}", "Body") for index in range(3)])
+
+    first = json.loads(asyncio.run(mcp_server.search_articles("python", per_page=2, mode="local", output="json", budget=0)))
+    assert len(first["items"]) == 2
+    assert first["endCursor"] == "local:2"
+
+    rest = json.loads(asyncio.run(mcp_server.search_articles("python", per_page=2, cursor=first["endCursor"], mode="local", output="json", budget=0)))
+    assert len(rest["items"]) == 1
+    assert rest["hasNextPage"] is False
+    assert {item["id"] for item in first["items"] + rest["items"]} == {"p0", "p1", "p2"}
+    assert api.requests == []
+
+
+def test_auto_search_falls_back_to_the_api_until_the_publication_is_mirrored(api, mirror):
+    remote = {"edges": [{"node": {"id": "remote", "title": "Remote"}, "cursor": "c1"}], "pageInfo": {"hasNextPage": False}}
+    api.on("ViewerPublication", lambda variables: {"me": {"publications": {"edges": [{"node": {"id": "pub1", "title": "Blog"}}]}}})
+    api.on("SearchPostsOfPublication", lambda variables: {"searchPostsOfPublication": remote})
+    mirror.save_posts("pub1", [article("local", "Python", "Body")])
+
+    result = json.loads(asyncio.run(mcp_server.search_articles("python", output="json", budget=0)))
+    assert [item["id"] for item in result["items"]] == ["remote"]
+
+    mirror.save_publication(HOST, {"id": "pub1", "title": "Blog"})
+    mirror.mark_synced("pub1", full=True)
+    result = json.loads(asyncio.run(mcp_server.search_articles("python", output="json", budget=0)))
+    assert [item["id"] for item in result["items"]] == ["local"]
+    assert api.count("SearchPostsOfPublication") == 1
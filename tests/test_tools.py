@@ -0,0 +1,219 @@
+"""Tests for the MCP tools"""
+import asyncio
+import json
+
+import pytest
+
+from hashnode_mcp import mcp_server
+from hashnode_mcp.output import LATEST_ARTICLE_KEYS, SEARCH_RESULT_KEYS, USER_SUMMARY_KEYS
+
+HOST = "blog.example.com"
+
+
+@pytest.fixture
+def blog(api):
+    """A publication of 100 posts, listed by the fake API"""
+    posts = [
+        {
+            "id": f"p{index}",
+            "title": f"Post {index}",
+            "brief": "A brief that is long enough to take some room in the listing. " * 3,
+            "slug": f"post-{index}",
+            "url": f"https://{HOST}/post-{index}",
+            "publishedAt": "2024-01-01T00:00:00Z",
+            "author": {"name": "Writer"},
+        }
+        for index in range(100)
+    ]
+
+    def listing(variables):
+        start = int(variables.get("after") or 0)
+        page = posts[start:start + variables["first"]]
+        edges = [{"node": post, "cursor": str(start + index + 1)} for index, post in enumerate(page)]
+        more = start + len(page) < len(posts)
+        return {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": more, "endCursor": str(start + len(page))}}}
+
+    api.on("GetPublicationByHost", lambda variables: {"publication": {"id": "pub1", "title": "Blog"}})
+    api.on("SearchPostsOfPublication", listing)
+    return posts
+
+
+@pytest.mark.parametrize("output", ["markdown", "json"])
+def test_latest_articles_stop_paging_once_the_budget_is_spent(blog, api, output):
+    result = asyncio.run(mcp_server.get_latest_articles(HOST, limit=100, output=output, budget=2000))
+
+    assert len(result.encode("utf-8")) <= 2000
+    assert api.count("SearchPostsOfPublication") == 1
+    # The articles left out can still be reached
+    assert ('cursor="' if output == "markdown" else '"endCursor":"') in result
+
+
+def test_degraded_json_listing_keeps_the_keys_of_every_item(blog):
+    full = json.loads(asyncio.run(mcp_server.get_latest_articles(HOST, limit=5, output="json", budget=0)))
+    degraded = json.loads(asyncio.run(mcp_server.get_latest_articles(HOST, limit=20, output="json", budget=2000)))
+
+    assert degraded["endCursor"] is not None
+    assert {tuple(item) for item in full["items"] + degraded["items"]} == {LATEST_ARTICLE_KEYS}
+    # Only the ID, title and brief are still filled in
+    assert all(item["author"] is None and item["publishedAt"] is None for item in degraded["items"])
+
+
+def test_latest_articles_without_a_budget_fetch_every_page(blog, api):
+    result = asyncio.run(mcp_server.get_latest_articles(HOST, limit=100, budget=0))
+
+    assert api.count("SearchPostsOfPublication") == 5
+    assert "Post 99" in result
+
+
+def test_compact_latest_articles_are_smaller_than_markdown(blog):
+    as_markdown = asyncio.run(mcp_server.get_latest_articles(HOST, limit=20, output="markdown", budget=0))
+    as_json = asyncio.run(mcp_server.get_latest_articles(HOST, limit=20, output="json", budget=0))
+    as_compact = asyncio.run(mcp_server.get_latest_articles(HOST, limit=20, output="compact", budget=0))
+
+    assert len(as_compact.encode("utf-8")) < len(as_markdown.encode("utf-8"))
+    assert len(as_compact) < len(as_json)
+
+
+def test_compact_search_results_are_smaller_than_markdown(blog):
+    edges = [{"node": post, "cursor": post["id"]} for post in blog[:10]]
+    search_data = {"data": {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": True, "endCursor": "p9"}}}}
+
+    as_markdown = mcp_server.describe_search_page(search_data, 1, None, "markdown")
+    as_compact = mcp_server.describe_search_page(search_data, 1, None, "compact")
+
+    assert len(as_compact.encode("utf-8")) < len(as_markdown.encode("utf-8"))
+
+
+@pytest.mark.parametrize("per_page", [0, 1, 2])
+def test_compact_search_results_keep_their_shape(per_page):
+    edges = [{"node": {"id": f"p{index}", "title": f"Post {index}"}, "cursor": f"p{index}"} for index in range(per_page)]
+    search_data = {"data": {"searchPostsOfPublication": {"edges": edges, "pageInfo": {"hasNextPage": False}}}}
+
+    result = json.loads(mcp_server.describe_search_page(search_data, 1, None, "compact"))
+
+    assert set(result) == {"items", "hasNextPage", "endCursor", "nextPage"}
+    assert result["items"]["fields"] == list(SEARCH_RESULT_KEYS)
+    assert len(result["items"]["rows"]) == per_page
+
+
+@pytest.fixture
+def long_post(api):
+    """A post whose body is 5000 characters long, starting with a multibyte one"""
+    body = "é" + "x" * 4999
+    post = {"id": "p1", "title": "Long", "content": {"text": body, "markdown": body}}
+    api.on("Post", lambda variables: {"post": post})
+    return post
+
+
+@pytest.mark.parametrize("output", ["markdown", "json"])
+def test_article_details_show_a_preview_of_the_body(long_post, output):
+    result = asyncio.run(mcp_server.get_article_details("p1", output=output))
+
+    assert "x" * 1000 not in result
+    assert len(result.encode("utf-8")) < 1500
+
+
+def test_tiny_budget_still_reads_the_body_on(long_post):
+    first = json.loads(asyncio.run(mcp_server.get_article_content("p1", output="json", budget=100)))
+    second = json.loads(asyncio.run(mcp_server.get_article_content("p1", offset=first["end"], output="json", budget=100)))
+
+    assert first["text"] == "é"
+    assert second["start"] == first["end"] > 0
+
+
+@pytest.fixture
+def posts(api):
+    """Ten posts with 500-character bodies, looked up by ID; other IDs are not found"""
+    posts = {f"p{index}": {"id": f"p{index}", "title": f"Post {index}", "content": {"text": "x" * 500}} for index in range(10)}
+    api.on("Post", lambda variables: {"post": posts.get(variables["id"])})
+    return posts
+
+
+def test_batch_details_keep_the_order_given_with_an_error_per_unknown_id(posts, api):
+    ids = ["p2", "missing", "p1", "p2"]
+
+    result = json.loads(asyncio.run(mcp_server.get_article_details_batch(ids, fields=["title"], output="json", budget=0)))
+
+    assert [post["id"] for post in result["posts"]] == ids
+    assert [post["title"] for post in result["posts"]] == ["Post 2", None, "Post 1", "Post 2"]
+    assert result["posts"][1]["error"] == "No article found with ID 'missing'"
+    assert result["omitted"] == []
+    # Repeated IDs are looked up once
+    assert api.count("Post") == 3
+
+
+def test_batch_details_list_the_articles_left_out_of_the_budget(posts):
+    ids = list(posts)
+
+    as_json = json.loads(asyncio.run(mcp_server.get_article_details_batch(ids, output="json", budget=1500)))
+    as_markdown = asyncio.run(mcp_server.get_article_details_batch(ids, budget=1500))
+
+    shown = [post["id"] for post in as_json["posts"]]
+    assert shown and as_json["omitted"]
+    assert shown + as_json["omitted"] == ids
+    assert len(as_markdown.encode("utf-8")) <= 1500
+    omitted = as_markdown.split("Not shown: ")[1].split(".")[0].split(", ")
+    assert omitted == ids[-len(omitted):]
+    assert "# Post 9" not in as_markdown
+
+
+def test_batch_details_refuse_too_many_ids(posts, api):
+    ids = [f"p{index}" for index in range(mcp_server.MAX_BATCH_ARTICLES + 1)]
+
+    result = json.loads(asyncio.run(mcp_server.get_article_details_batch(ids, output="json")))
+
+    assert "Too many article IDs" in result["error"]
+    assert api.count("Post") == 0
+
+
+@pytest.fixture
+def users(api):
+    """Ten users with long bios, looked up case-insensitively; other names are not found"""
+    users = {
+        f"user{index}": {
+            "id": f"u{index}",
+            "username": f"user{index}",
+            "name": f"User {index}",
+            "followersCount": index,
+            "followingsCount": 0,
+            "bio": {"text": "A bio that takes some room. " * 5},
+        }
+        for index in range(10)
+    }
+    api.on("GetUserInfo", lambda variables: {"user": users.get(variables["username"].lower())})
+    return users
+
+
+def test_users_info_keep_the_first_spelling_of_each_name_in_order(users, api):
+    names = ["User3", "user1", "@user3", " USER1 ", "ghost"]
+
+    result = json.loads(asyncio.run(mcp_server.get_users_info(names, output="json", budget=0)))
+
+    assert [user["username"] for user in result["users"]] == ["User3", "user1", "ghost"]
+    assert [user["name"] for user in result["users"]] == ["User 3", "User 1", None]
+    assert api.count("GetUserInfo") == 3
+
+
+def test_users_info_report_unknown_users_in_the_error_column(users):
+    result = json.loads(asyncio.run(mcp_server.get_users_info(["user1", "ghost"], output="compact", budget=0)))
+
+    table = result["users"]
+    assert table["fields"] == list(USER_SUMMARY_KEYS)
+    errors = [row[table["fields"].index("error")] for row in table["rows"]]
+    assert errors == [None, "Not found"]
+    assert "- @ghost: Not found" in asyncio.run(mcp_server.get_users_info(["user1", "ghost"], budget=0))
+
+
+def test_users_info_list_the_users_left_out_of_the_budget(users):
+    names = list(users)
+
+    as_json = json.loads(asyncio.run(mcp_server.get_users_info(names, output="json", budget=800)))
+    as_markdown = asyncio.run(mcp_server.get_users_info(names, budget=800))
+
+    shown = [user["username"] for user in as_json["users"]]
+    assert shown and as_json["omitted"]
+    assert shown + as_json["omitted"] == names
+    assert len(as_markdown.encode("utf-8")) <= 800
+    omitted = as_markdown.split("Not shown: ")[1].split(".")[0].split(", ")
+    assert omitted == names[-len(omitted):]
+    assert "@user9" not in as_markdown.split("Not shown: ")[0]